@@ -1,12 +1,27 @@
 """Conversion API endpoints."""
 
-from typing import Literal
+from typing import List, Literal, Optional, Union
 
 from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 
-from app.core.exceptions import FileTooLargeError, InvalidFileFormatError
-from app.schemas.response import TaskCreatedResponse, ErrorResponse
+from app.api.routes.tasks import build_result_response
+from app.core.excel_reader import parse_cell_range
+from app.core.json_converter import JSON_FORMATS
+from app.core.exceptions import (
+    ConversionError,
+    EmptyFileError,
+    FileTooLargeError,
+    InvalidFileFormatError,
+    InvalidRangeError,
+    SheetNotFoundError,
+)
+from app.schemas.response import (
+    ConversionResultResponse,
+    ErrorResponse,
+    TaskCreatedResponse,
+)
 from app.services.conversion_service import conversion_service
 from app.services.file_handler import file_handler
 
@@ -25,7 +40,7 @@ async def convert_form(
     request: Request,
     file: UploadFile = File(...),
     use_headers: bool = Form(default=True),
-    output_format: Literal["markdown", "json"] = Form(default="markdown"),
+    output_format: Literal["markdown", "json", "ndjson"] = Form(default="markdown"),
 ):
     """
     Handle form submission for file conversion.
@@ -35,7 +50,7 @@ async def convert_form(
     Args:
         file: The uploaded Excel file.
         use_headers: Whether to treat first row as headers.
-        output_format: Output format (markdown or json).
+        output_format: Output format (markdown, json or ndjson).
 
     Returns:
         Redirect to progress page.
@@ -48,15 +63,19 @@ async def convert_form(
         task_id = file_handler.generate_task_id()
 
         # Save uploaded file
-        file_path, original_filename = await file_handler.save_upload(file, task_id)
+        file_path, original_filename, file_hash = await file_handler.save_upload(
+            file, task_id
+        )
 
         # Start conversion task
-        if output_format == "json":
+        if output_format in JSON_FORMATS:
             conversion_service.start_json_conversion(
                 str(file_path),
                 original_filename,
                 task_id,
                 use_headers,
+                json_format=output_format,
+                file_hash=file_hash,
             )
         else:
             conversion_service.start_markdown_conversion(
@@ -64,6 +83,7 @@ async def convert_form(
                 original_filename,
                 task_id,
                 use_headers,
+                file_hash=file_hash,
             )
 
         # Redirect to progress page
@@ -72,7 +92,7 @@ async def convert_form(
             status_code=302,
         )
 
-    except (InvalidFileFormatError, FileTooLargeError) as e:
+    except (InvalidFileFormatError, FileTooLargeError, EmptyFileError) as e:
         # For form submission, redirect to error page
         return RedirectResponse(
             url=f"/error?message={str(e)}",
@@ -82,50 +102,90 @@ async def convert_form(
 
 @router.post(
     "/api/v1/convert",
-    response_model=TaskCreatedResponse,
+    response_model=Union[ConversionResultResponse, TaskCreatedResponse],
     responses={
         400: {"model": ErrorResponse},
         413: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
     },
 )
 async def convert_api(
     file: UploadFile = File(...),
     use_headers: bool = Form(default=True),
-    output_format: Literal["markdown", "json"] = Form(default="markdown"),
-) -> TaskCreatedResponse:
+    output_format: Literal["markdown", "json", "ndjson"] = Form(default="markdown"),
+    sheets: Optional[List[str]] = Form(default=None),
+    sheet_indices: Optional[List[int]] = Form(default=None),
+    cell_range: Optional[str] = Form(default=None, alias="range"),
+    mode: Literal["sync", "async", "auto"] = Form(default="async"),
+) -> Union[ConversionResultResponse, TaskCreatedResponse]:
     """
     API endpoint for file conversion.
 
-    Returns task ID for polling status.
+    Returns task ID for polling status, or the result itself when the
+    file is converted inline.
 
     Args:
         file: The uploaded Excel file.
         use_headers: Whether to treat first row as headers.
-        output_format: Output format (markdown or json).
+        output_format: Output format (markdown, json or ndjson).
+        sheets: Sheet names to convert (repeat the field for several).
+        sheet_indices: 0-based sheet positions to convert.
+        cell_range: A1-style range (form field "range") applied to every sheet.
+        mode: "async" queues a worker task, "sync" converts in the API
+            process and rejects files over the sync budget (SYNC_MAX_FILE_KB,
+            SYNC_MAX_CELLS) with 413, "auto" converts files within the
+            budget inline and queues the rest.
 
     Returns:
-        Task creation response with task ID.
+        Conversion result (inline) or task creation response with task ID.
 
     Raises:
-        HTTPException: If file validation fails.
+        HTTPException: If file validation or an inline conversion fails.
     """
     try:
-        # Validate file
+        # Validate file and range before storing anything
         file_handler.validate_file(file)
+        parse_cell_range(cell_range)
 
         # Generate task ID
         task_id = file_handler.generate_task_id()
 
         # Save uploaded file
-        file_path, original_filename = await file_handler.save_upload(file, task_id)
+        file_path, original_filename, file_hash = await file_handler.save_upload(
+            file, task_id
+        )
+
+        # Small files skip the queue round trip; inspecting the workbook
+        # reads it, so keep that off the event loop too
+        if await run_in_threadpool(
+            conversion_service.should_convert_inline, str(file_path), mode
+        ):
+            result = await run_in_threadpool(
+                conversion_service.convert_inline,
+                str(file_path),
+                original_filename,
+                task_id,
+                output_format,
+                use_headers,
+                sheets=sheets,
+                sheet_indices=sheet_indices,
+                cell_range=cell_range,
+                file_hash=file_hash,
+            )
+            return build_result_response(task_id, result)
 
         # Start conversion task
-        if output_format == "json":
+        if output_format in JSON_FORMATS:
             conversion_service.start_json_conversion(
                 str(file_path),
                 original_filename,
                 task_id,
                 use_headers,
+                sheets=sheets,
+                sheet_indices=sheet_indices,
+                cell_range=cell_range,
+                json_format=output_format,
+                file_hash=file_hash,
             )
         else:
             conversion_service.start_markdown_conversion(
@@ -133,6 +193,10 @@ async def convert_api(
                 original_filename,
                 task_id,
                 use_headers,
+                sheets=sheets,
+                sheet_indices=sheet_indices,
+                cell_range=cell_range,
+                file_hash=file_hash,
             )
 
         return TaskCreatedResponse(
@@ -141,7 +205,14 @@ async def convert_api(
             message=f"Conversion to {output_format} started",
         )
 
-    except InvalidFileFormatError as e:
+    except (
+        InvalidFileFormatError,
+        InvalidRangeError,
+        EmptyFileError,
+        SheetNotFoundError,
+    ) as e:
         raise HTTPException(status_code=400, detail=str(e))
     except FileTooLargeError as e:
         raise HTTPException(status_code=413, detail=str(e))
+    except ConversionError as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,9 +1,13 @@
-"""Health check endpoint."""
+"""Health check and monitoring endpoints."""
 
 from fastapi import APIRouter
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST
 
 from app.config import settings
-from app.schemas.response import HealthResponse
+from app.schemas.response import CacheStatsResponse, HealthResponse
+from app.services.metrics import collect_metrics
+from app.services.result_cache import result_cache
 
 router = APIRouter()
 
@@ -20,3 +24,28 @@ async def health_check() -> HealthResponse:
         status="ok",
         version=settings.app_version,
     )
+
+
+@router.get("/api/v1/cache/stats", response_model=CacheStatsResponse)
+def cache_stats() -> CacheStatsResponse:
+    """
+    Report result cache hit and miss counters.
+
+    Returns:
+        Cache counters and whether the cache is enabled.
+    """
+    return CacheStatsResponse(
+        enabled=settings.result_cache_enabled,
+        **result_cache.stats(),
+    )
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """
+    Expose metrics in the Prometheus text format.
+
+    Returns:
+        Metrics of all API processes, queue depth and cache counters.
+    """
+    return Response(collect_metrics(), media_type=CONTENT_TYPE_LATEST)
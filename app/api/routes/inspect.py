@@ -0,0 +1,55 @@
+"""Workbook inspection API endpoints."""
+
+from fastapi import APIRouter, File, HTTPException, UploadFile
+
+from app.core.excel_reader import inspect_workbook
+from app.core.exceptions import FileTooLargeError, InvalidFileFormatError
+from app.schemas.response import (
+    ErrorResponse,
+    SheetInfoResponse,
+    WorkbookInfoResponse,
+)
+from app.services.file_handler import file_handler
+
+router = APIRouter(tags=["inspection"])
+
+
+@router.post(
+    "/api/v1/inspect",
+    response_model=WorkbookInfoResponse,
+    responses={
+        400: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+    },
+)
+def inspect_api(file: UploadFile = File(...)) -> WorkbookInfoResponse:
+    """
+    List sheets and their declared dimensions without converting.
+
+    Only workbook metadata is parsed, so the call is cheap enough to run
+    synchronously before choosing sheets or starting a conversion.
+
+    Args:
+        file: The uploaded Excel file.
+
+    Returns:
+        Sheet names, declared dimensions and estimated cell counts.
+
+    Raises:
+        HTTPException: If file validation fails or the file cannot be read.
+    """
+    try:
+        file_handler.validate_file(file)
+        info = inspect_workbook(file.file, file.filename)
+    except InvalidFileFormatError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+    return WorkbookInfoResponse(
+        filename=file.filename,
+        format=info["format"],
+        sheets=[SheetInfoResponse(**sheet) for sheet in info["sheets"]],
+        total_sheets=len(info["sheets"]),
+        estimated_cells=info["estimated_cells"],
+    )
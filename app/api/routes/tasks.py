@@ -1,16 +1,66 @@
 """Task status and result endpoints."""
 
+import json
 from pathlib import Path
+from urllib.parse import quote
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
-from app.schemas.response import TaskStatusResponse, SheetResult, ConversionResultResponse
+from app.config import settings
+from app.core.compression import ENCODING_SUFFIXES, compressed_path
+from app.core.line_index import INDEX_SUFFIX
+from app.core.zip_writer import iter_zip
+from app.schemas.request import TaskStatusBatchRequest
+from app.schemas.response import (
+    ConversionResultResponse,
+    SheetPageResponse,
+    SheetResult,
+    TaskStatusBatchResponse,
+    TaskStatusResponse,
+)
 from app.services.conversion_service import conversion_service
 from app.services.file_handler import file_handler
+from app.services.task_events import task_events
 
 router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"])
 
+# Files stored next to sheet outputs: compressed copies and line indexes
+SIDECAR_SUFFIXES = {*ENCODING_SUFFIXES.values(), INDEX_SUFFIX}
+
+
+@router.post(
+    "/status",
+    response_model=TaskStatusBatchResponse,
+    response_model_exclude_none=True,
+)
+async def get_task_statuses(batch: TaskStatusBatchRequest) -> TaskStatusBatchResponse:
+    """
+    Get the current status of many conversion tasks at once.
+
+    All task metas are fetched in a single Redis round trip. Statuses are
+    compact: unset fields are omitted and finished tasks do not carry
+    their result (fetch it from the result endpoint).
+
+    Args:
+        batch: Task IDs to check.
+
+    Returns:
+        Task status by task ID; unknown IDs are reported as PENDING.
+
+    Raises:
+        HTTPException: If more task IDs than STATUS_BATCH_MAX are sent.
+    """
+    if len(batch.task_ids) > settings.status_batch_max:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.status_batch_max} task IDs per request",
+        )
+
+    statuses = await conversion_service.get_task_statuses_async(batch.task_ids)
+    return TaskStatusBatchResponse(tasks=statuses)
+
 
 @router.get("/{task_id}/status", response_model=TaskStatusResponse)
 async def get_task_status(task_id: str) -> TaskStatusResponse:
@@ -23,24 +73,135 @@ async def get_task_status(task_id: str) -> TaskStatusResponse:
     Returns:
         Task status information including progress.
     """
-    status = conversion_service.get_task_status(task_id)
+    status = await conversion_service.get_task_status_async(task_id)
     return TaskStatusResponse(**status)
 
 
+@router.get(
+    "/{task_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_task_events(task_id: str, request: Request) -> StreamingResponse:
+    """
+    Stream task status changes as Server-Sent Events.
+
+    Sends the current status right away, then one event per change, until
+    the task succeeds or fails. Each event's data is the JSON body of the
+    status endpoint; comment lines are sent as keep-alives while idle.
+
+    Args:
+        task_id: The task ID to watch.
+
+    Returns:
+        Event stream response.
+    """
+
+    async def events() -> AsyncIterator[str]:
+        async for status in task_events.watch(task_id):
+            if await request.is_disconnected():
+                break
+            if status is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"data: {json.dumps(status, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Keep proxies (nginx) from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{task_id}/result", response_model=ConversionResultResponse)
-async def get_task_result(task_id: str) -> ConversionResultResponse:
+def get_task_result(
+    task_id: str,
+    sheet: Optional[str] = Query(default=None, description="Only return this sheet"),
+    include_content: bool = Query(default=True, description="Read sheet content from storage"),
+    offset: int = Query(default=0, ge=0, description="Lines to skip in each sheet"),
+    limit: Optional[int] = Query(default=None, ge=1, description="Maximum lines per sheet"),
+) -> ConversionResultResponse:
     """
-    Get the full result of a completed conversion task.
+    Get the result of a completed conversion task.
+
+    The task result only holds a manifest; sheet content is read from
+    storage on demand, optionally a window of lines at a time.
 
     Args:
         task_id: The task ID.
+        sheet: Optional sheet name to return alone.
+        include_content: Whether to read sheet content (manifest only if False).
+        offset: Number of lines to skip in each sheet file.
+        limit: Maximum number of lines to return per sheet.
 
     Returns:
-        Full conversion result with all sheet contents.
+        Conversion result with sheet manifests and (paginated) contents.
 
     Raises:
         HTTPException: If task is not found or not completed.
     """
+    result = _finished_result(task_id)
+    return build_result_response(task_id, result, sheet, include_content, offset, limit)
+
+
+@router.get("/{task_id}/sheets/{sheet_name}", response_model=SheetPageResponse)
+def get_sheet_page(
+    task_id: str,
+    sheet_name: str,
+    offset: int = Query(default=0, ge=0, description="Lines to skip"),
+    limit: int = Query(default=1000, ge=1, le=100000, description="Lines to return"),
+) -> SheetPageResponse:
+    """
+    Get a window of lines of one converted sheet.
+
+    Sheets converted with a line index are read with a single seek, so
+    every page costs the same however deep into a large sheet it is.
+
+    Args:
+        task_id: The task ID.
+        sheet_name: Name of the sheet.
+        offset: Number of lines to skip.
+        limit: Maximum number of lines to return.
+
+    Returns:
+        The window's text and the offset of the next one.
+
+    Raises:
+        HTTPException: If the task is not completed or the sheet is not found.
+    """
+    result = _finished_result(task_id)
+    sheet_data = result.get("sheets", {}).get(sheet_name)
+    if sheet_data is None:
+        raise HTTPException(status_code=404, detail=f"Sheet not found: {sheet_name}")
+
+    line_count = None
+    try:
+        if "file" in sheet_data:
+            content, has_more, line_count = file_handler.read_result_window(
+                task_id, sheet_data["file"], offset, limit
+            )
+        else:
+            content, has_more = _read_sheet_content(task_id, sheet_data, offset, limit)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    return SheetPageResponse(
+        task_id=task_id,
+        sheet_name=sheet_name,
+        content=content,
+        offset=offset,
+        limit=limit,
+        has_more=has_more,
+        next_offset=offset + limit if has_more else None,
+        line_count=line_count,
+        row_count=sheet_data["row_count"],
+        column_count=sheet_data["column_count"],
+    )
+
+
+def _finished_result(task_id: str) -> Dict[str, Any]:
+    """Return a task's result, or raise if it failed or is still running."""
     result = conversion_service.get_task_result(task_id)
 
     if result is None:
@@ -54,15 +215,63 @@ async def get_task_result(task_id: str) -> ConversionResultResponse:
             status_code=202,
             detail="Task is still processing",
         )
+    return result
+
+
+def build_result_response(
+    task_id: str,
+    result: Dict[str, Any],
+    sheet: Optional[str] = None,
+    include_content: bool = True,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> ConversionResultResponse:
+    """
+    Build the result response of a finished conversion.
+
+    Args:
+        task_id: The task ID.
+        result: Task result (sheet manifests).
+        sheet: Optional sheet name to return alone.
+        include_content: Whether to read sheet content (manifest only if False).
+        offset: Number of lines to skip in each sheet file.
+        limit: Maximum number of lines to return per sheet.
+
+    Returns:
+        Conversion result with sheet manifests and (paginated) contents.
+
+    Raises:
+        HTTPException: If the sheet or a result file is not found.
+    """
+    sheet_results = result.get("sheets", {})
+    if sheet is not None:
+        if sheet not in sheet_results:
+            raise HTTPException(status_code=404, detail=f"Sheet not found: {sheet}")
+        sheet_results = {sheet: sheet_results[sheet]}
 
     sheets = []
-    for sheet_name, sheet_data in result.get("sheets", {}).items():
+    for sheet_name, sheet_data in sheet_results.items():
+        content = None
+        has_more = False
+        if include_content:
+            try:
+                content, has_more = _read_sheet_content(
+                    task_id, sheet_data, offset, limit
+                )
+            except FileNotFoundError as e:
+                raise HTTPException(status_code=404, detail=str(e))
+
         sheets.append(
             SheetResult(
                 sheet_name=sheet_name,
-                content=sheet_data["content"],
+                content=content,
                 row_count=sheet_data["row_count"],
                 column_count=sheet_data["column_count"],
+                file=sheet_data.get("file"),
+                size=sheet_data.get("size"),
+                sha256=sheet_data.get("sha256"),
+                offset=offset,
+                has_more=has_more,
             )
         )
 
@@ -76,12 +285,33 @@ async def get_task_result(task_id: str) -> ConversionResultResponse:
     )
 
 
+def _read_sheet_content(
+    task_id: str,
+    sheet_data: Dict[str, Any],
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> Tuple[str, bool]:
+    """Read sheet content from storage, falling back to inline content."""
+    if "file" not in sheet_data:
+        # Results stored before content moved out of the result backend
+        lines = sheet_data.get("content", "").splitlines(keepends=True)
+        end = None if limit is None else offset + limit
+        return "".join(lines[offset:end]), end is not None and end < len(lines)
+
+    return file_handler.read_result_text(task_id, sheet_data["file"], offset, limit)
+
+
 @router.get("/{task_id}/download")
-async def download_result(task_id: str, file: str = None):
+async def download_result(request: Request, task_id: str, file: str = None):
     """
     Download conversion result file.
 
+    Sheet files are served pre-compressed when a gzip or brotli copy
+    exists and the client accepts it. Files carry an ETag (answered with
+    304 Not Modified on If-None-Match) and support Range requests.
+
     Args:
+        request: The incoming request (content negotiation headers).
         task_id: The task ID.
         file: Optional specific filename to download.
               If not provided, downloads ZIP (if available) or single file.
@@ -92,44 +322,104 @@ async def download_result(task_id: str, file: str = None):
     Raises:
         HTTPException: If file is not found.
     """
-    result = conversion_service.get_task_result(task_id)
+    result = await conversion_service.get_task_result_async(task_id)
 
     if result is None:
         raise HTTPException(status_code=404, detail="Task result not found")
 
+    digests = {
+        sheet["file"]: sheet.get("sha256")
+        for sheet in result.get("sheets", {}).values()
+        if "file" in sheet
+    }
+
     try:
         if file:
             # Download specific file
             file_path = file_handler.get_result_file(task_id, file)
-            return FileResponse(
-                path=file_path,
-                filename=file,
-                media_type="application/octet-stream",
-            )
+            return _send_file(request, file_path, file, digests.get(file))
 
         # Download ZIP if available, otherwise single file
         if result.get("has_zip"):
-            zip_path = file_handler.get_result_zip(task_id)
             original_name = Path(result.get("original_filename", "result")).stem
-            return FileResponse(
-                path=zip_path,
-                filename=f"{original_name}.zip",
-                media_type="application/zip",
+            zip_name = f"{original_name}.zip"
+            try:
+                zip_path = file_handler.get_result_zip(task_id)
+            except FileNotFoundError:
+                # Not stored (ZIP_ON_DOWNLOAD): build it while sending
+                files = [
+                    file_handler.get_result_file(task_id, name) for name in digests
+                ]
+                return StreamingResponse(
+                    iter_zip(files, settings.zip_compress_level),
+                    media_type="application/zip",
+                    headers={"Content-Disposition": _attachment(zip_name)},
+                )
+            return _send_file(
+                request, zip_path, zip_name, media_type="application/zip"
             )
 
         # Single file - find and download it
-        files = file_handler.list_result_files(task_id)
-        files = [f for f in files if f != "result.zip"]
+        files = list(digests) or [
+            f
+            for f in file_handler.list_result_files(task_id)
+            if f != "result.zip" and Path(f).suffix not in SIDECAR_SUFFIXES
+        ]
 
         if not files:
             raise HTTPException(status_code=404, detail="No result files found")
 
         file_path = file_handler.get_result_file(task_id, files[0])
-        return FileResponse(
-            path=file_path,
-            filename=files[0],
-            media_type="application/octet-stream",
-        )
+        return _send_file(request, file_path, files[0], digests.get(files[0]))
 
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+
+
+def _send_file(
+    request: Request,
+    path: Path,
+    filename: str,
+    digest: Optional[str] = None,
+    media_type: str = "application/octet-stream",
+) -> Response:
+    """
+    Serve a result file, pre-compressed if possible, with ETag handling.
+
+    Args:
+        request: The incoming request.
+        path: Uncompressed file on disk.
+        filename: Download name.
+        digest: SHA-256 of the content from the result manifest, if known.
+        media_type: Content type of the uncompressed file.
+
+    Returns:
+        304 response if the client's copy is current, file response
+        otherwise (Range requests are handled by FileResponse).
+    """
+    encoding = file_handler.negotiate_encoding(
+        path, request.headers.get("accept-encoding")
+    )
+    etag = file_handler.make_etag(path, digest, encoding)
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+
+    if file_handler.etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        path = compressed_path(path, encoding)
+    return FileResponse(
+        path=path,
+        filename=filename,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+def _attachment(filename: str) -> str:
+    """Content-Disposition value for a download, as FileResponse builds it."""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
@@ -1,9 +1,14 @@
 """Celery application configuration."""
 
-from celery import Celery
+import os
+import time
+from typing import Dict
+
+from celery import Celery, signals
 from celery.schedules import crontab
 
 from app.config import settings
+from app.services import metrics
 
 celery_app = Celery(
     "excel2markdown",
@@ -30,3 +35,33 @@ celery_app.conf.update(
         },
     },
 )
+
+
+# Start times of the tasks running in this process
+_task_started: Dict[str, float] = {}
+
+
+@signals.task_prerun.connect
+def _task_prerun(task_id=None, **kwargs):
+    _task_started[task_id] = time.perf_counter()
+
+
+@signals.task_postrun.connect
+def _task_postrun(task_id=None, task=None, state=None, **kwargs):
+    start = _task_started.pop(task_id, None)
+    if start is not None:
+        metrics.TASK_SECONDS.labels(task.name, state or "UNKNOWN").observe(
+            time.perf_counter() - start
+        )
+    metrics.record_worker_rss()
+
+
+@signals.worker_ready.connect
+def _start_metrics_server(**kwargs):
+    if settings.metrics_worker_port:
+        metrics.start_worker_server(settings.metrics_worker_port)
+
+
+@signals.worker_process_shutdown.connect
+def _mark_process_dead(**kwargs):
+    metrics.mark_process_dead(os.getpid())
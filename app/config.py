@@ -1,7 +1,7 @@
 """Application configuration settings."""
 
 from pathlib import Path
-from typing import List
+from typing import List, Literal
 
 from pydantic_settings import BaseSettings
 
@@ -18,21 +18,64 @@ class Settings(BaseSettings):
     max_file_size_mb: int = 10
     allowed_extensions: List[str] = [".xls", ".xlsx"]
 
+    # Reader engine for .xlsx files: "openpyxl" or the streaming "fast" engine
+    xlsx_engine: Literal["openpyxl", "fast"] = "openpyxl"
+
     # Storage paths
     storage_dir: Path = Path("storage")
     uploads_dir: Path = Path("storage/uploads")
     results_dir: Path = Path("storage/results")
+    cache_dir: Path = Path("storage/cache")
+
+    # Result cache: identical uploads with identical options reuse results
+    result_cache_enabled: bool = True
+    result_cache_max_mb: int = 500
+
+    # Parallel conversion: sheets are converted in separate worker tasks
+    # once a workbook has this many sheets to convert or is this large
+    parallel_sheets_enabled: bool = True
+    parallel_sheets_min_count: int = 8
+    parallel_sheets_min_mb: int = 5
+
+    # Result ZIP of multi-sheet conversions: compression level 0 (stored,
+    # fastest) to 9; with zip_on_download no archive is stored and the
+    # download endpoint streams one
+    zip_compress_level: int = 6
+    zip_on_download: bool = False
+
+    # Lines of each sheet shown as a preview on the result page, which
+    # loads the rest on demand
+    preview_lines: int = 50
+
+    # Pre-compressed copies of sheet outputs (.gz, .br) served to clients
+    # that accept them; "br" needs the optional brotli package
+    result_precompress: List[Literal["gzip", "br"]] = []
+
+    # Inline conversion: with mode=auto, uploads up to this size and cell
+    # count are converted in the API process instead of a worker; mode=sync
+    # rejects larger ones
+    sync_max_file_kb: int = 256
+    sync_max_cells: int = 20000
 
     # Cleanup settings
     file_retention_days: int = 7
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
+    # Connections of the API's async pool for task status lookups; event
+    # streams share one separate subscriber connection
+    redis_pool_size: int = 50
+    # Most task IDs accepted by one batch status request
+    status_batch_max: int = 1000
 
     # Celery
     celery_broker_url: str = "redis://localhost:6379/0"
     celery_result_backend: str = "redis://localhost:6379/0"
 
+    # Metrics: workers serve theirs over HTTP on this port (0 disables);
+    # the API serves /metrics
+    metrics_worker_port: int = 8001
+
     @property
     def max_file_size_bytes(self) -> int:
         """Return max file size in bytes."""
@@ -0,0 +1,81 @@
+"""Pre-compressed copies of result files for HTTP content negotiation."""
+
+import gzip
+import os
+import shutil
+from pathlib import Path
+from typing import Dict
+
+try:
+    import brotli
+except ImportError:  # optional dependency, only needed for "br"
+    brotli = None
+
+# Content-Encoding -> suffix of the pre-compressed sibling file
+ENCODING_SUFFIXES: Dict[str, str] = {"br": ".br", "gzip": ".gz"}
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+
+def encoding_supported(encoding: str) -> bool:
+    """Whether pre-compressed copies can be written for ``encoding``."""
+    if encoding == "br":
+        return brotli is not None
+    return encoding in ENCODING_SUFFIXES
+
+
+def compressed_path(path: Path, encoding: str) -> Path:
+    """Return the path of the ``encoding`` copy of a file (``x.md.gz``)."""
+    return path.with_name(path.name + ENCODING_SUFFIXES[encoding])
+
+
+def write_compressed(
+    path: Path,
+    encoding: str,
+    chunk_size: int = 1024 * 1024,
+) -> Path:
+    """
+    Write a compressed copy of a file next to it.
+
+    The copy is written under a temporary name and renamed into place,
+    so a partially written copy is never served.
+
+    Args:
+        path: File to compress.
+        encoding: Content-Encoding, one of ENCODING_SUFFIXES.
+        chunk_size: Bytes read at a time.
+
+    Returns:
+        Path of the compressed copy.
+
+    Raises:
+        ValueError: If the encoding is unknown or its library is missing.
+    """
+    if not encoding_supported(encoding):
+        raise ValueError(f"Unsupported content encoding: {encoding}")
+
+    target = compressed_path(path, encoding)
+    temp = target.with_name(f".{target.name}.{os.getpid()}")
+    try:
+        with open(path, "rb") as source:
+            if encoding == "gzip":
+                # mtime=0 keeps the copy identical across conversions
+                with open(temp, "wb") as raw, gzip.GzipFile(
+                    filename="",
+                    mode="wb",
+                    fileobj=raw,
+                    compresslevel=GZIP_LEVEL,
+                    mtime=0,
+                ) as dest:
+                    shutil.copyfileobj(source, dest, chunk_size)
+            else:
+                compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+                with open(temp, "wb") as dest:
+                    for chunk in iter(lambda: source.read(chunk_size), b""):
+                        dest.write(compressor.process(chunk))
+                    dest.write(compressor.finish())
+        os.replace(temp, target)
+    finally:
+        temp.unlink(missing_ok=True)
+    return target
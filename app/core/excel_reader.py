@@ -1,8 +1,22 @@
 """Excel file reading module with support for .xls and .xlsx formats."""
 
+import hashlib
+import struct
 from io import BytesIO
 from pathlib import Path
-from typing import Any, BinaryIO, List, TypedDict, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from loguru import logger
 
@@ -10,8 +24,19 @@ from app.core.exceptions import (
     EmptyFileError,
     EmptySheetError,
     InvalidFileFormatError,
+    InvalidRangeError,
+    SheetNotFoundError,
 )
 
+# Available .xlsx reader engines: openpyxl, or the iterparse-based
+# streaming reader from app.core.xlsx_fast_reader.
+XLSX_ENGINES = ("openpyxl", "fast")
+
+# 1-based (min_col, min_row, max_col, max_row); None means unbounded.
+CellBounds = Tuple[int, int, Optional[int], Optional[int]]
+
+FULL_SHEET: CellBounds = (1, 1, None, None)
+
 
 class SheetData(TypedDict):
     """Type definition for sheet data structure."""
@@ -21,6 +46,39 @@ class SheetData(TypedDict):
     data: List[List[Any]]
 
 
+class SheetInfo(TypedDict):
+    """Type definition for sheet metadata returned by inspect_workbook."""
+
+    name: str
+    index: int
+    dimension: Optional[str]
+    row_count: Optional[int]
+    column_count: Optional[int]
+    estimated_cells: Optional[int]
+
+
+class WorkbookInfo(TypedDict):
+    """Type definition for workbook metadata returned by inspect_workbook."""
+
+    format: str
+    sheets: List[SheetInfo]
+    estimated_cells: int
+
+
+class SheetStream(TypedDict):
+    """Type definition for a lazily read sheet.
+
+    ``rows`` is a generator over data rows (the header row, if any, is
+    already consumed). It must be exhausted before advancing to the next
+    sheet of the same workbook.
+    """
+
+    sheetname: str
+    headers: List[str]
+    column_count: int
+    rows: Iterator[List[Any]]
+
+
 def detect_excel_format(filename: str) -> str:
     """
     Detect Excel format based on file extension.
@@ -45,9 +103,253 @@ def detect_excel_format(filename: str) -> str:
         )
 
 
+def parse_cell_range(cell_range: Optional[str]) -> CellBounds:
+    """
+    Parse an A1-style cell range into 1-based bounds.
+
+    Accepts cell ranges ("B2:D100"), single cells ("C3"), column
+    ranges ("A:C") and row ranges ("2:10").
+
+    Args:
+        cell_range: Range string, or None/empty for the whole sheet.
+
+    Returns:
+        Tuple of (min_col, min_row, max_col, max_row); None means unbounded.
+
+    Raises:
+        InvalidRangeError: If the range cannot be parsed.
+    """
+    from openpyxl.utils.cell import range_boundaries
+
+    if not cell_range:
+        return FULL_SHEET
+
+    try:
+        min_col, min_row, max_col, max_row = range_boundaries(cell_range.strip().upper())
+    except (ValueError, TypeError) as e:
+        raise InvalidRangeError(f"Invalid cell range: {cell_range} ({e})")
+
+    return (min_col or 1, min_row or 1, max_col, max_row)
+
+
+def select_sheet_names(
+    sheet_names: Sequence[str],
+    sheets: Optional[Sequence[str]] = None,
+    sheet_indices: Optional[Sequence[int]] = None,
+) -> List[str]:
+    """
+    Resolve requested sheet names and 0-based indices against a workbook.
+
+    Args:
+        sheet_names: All sheet names of the workbook, in order.
+        sheets: Sheet names to keep.
+        sheet_indices: 0-based sheet positions to keep.
+
+    Returns:
+        Selected sheet names in workbook order (all sheets if nothing
+        was requested).
+
+    Raises:
+        SheetNotFoundError: If a name or index does not exist.
+    """
+    if not sheets and not sheet_indices:
+        return list(sheet_names)
+
+    wanted = set()
+    for name in sheets or []:
+        if name not in sheet_names:
+            raise SheetNotFoundError(f"Sheet not found: {name}")
+        wanted.add(name)
+    for index in sheet_indices or []:
+        if not 0 <= index < len(sheet_names):
+            raise SheetNotFoundError(
+                f"Sheet index {index} out of range (workbook has {len(sheet_names)} sheets)"
+            )
+        wanted.add(sheet_names[index])
+
+    return [name for name in sheet_names if name in wanted]
+
+
+def iter_excel_xls(
+    file_content: Union[bytes, BinaryIO],
+    use_headers: bool = True,
+    sheets: Optional[Sequence[str]] = None,
+    sheet_indices: Optional[Sequence[int]] = None,
+    cell_range: Optional[str] = None,
+) -> Iterator[SheetStream]:
+    """
+    Iterate over sheets of .xls file using xlrd.
+
+    The workbook is opened on demand, so only the selected sheets are
+    parsed, and each sheet is unloaded once the next one is requested.
+
+    Args:
+        file_content: File content as bytes or file-like object.
+        use_headers: If True, first row is treated as headers.
+        sheets: Optional sheet names to read.
+        sheet_indices: Optional 0-based sheet positions to read.
+        cell_range: Optional A1-style range applied to every sheet.
+
+    Yields:
+        SheetStream dictionaries with a lazy row generator.
+
+    Raises:
+        EmptyFileError: If the file contains no sheets.
+        InvalidFileFormatError: If the file cannot be read.
+        SheetNotFoundError: If a requested sheet does not exist.
+        InvalidRangeError: If the cell range is invalid.
+    """
+    bounds = parse_cell_range(cell_range)
+    workbook = _open_xls_workbook(file_content)
+
+    try:
+        sheet_names = workbook.sheet_names()
+        if not sheet_names:
+            raise EmptyFileError("Excel file contains no sheets")
+
+        for sheet_name in select_sheet_names(sheet_names, sheets, sheet_indices):
+            sheet = _load_xls_sheet(workbook, sheet_name)
+            min_col, min_row, max_col, max_row = bounds
+            last_row = min(max_row, sheet.nrows) if max_row else sheet.nrows
+            last_col = min(max_col, sheet.ncols) if max_col else sheet.ncols
+
+            if last_row < min_row:
+                logger.warning("Empty sheet skipped: {}", sheet_name)
+                workbook.unload_sheet(sheet_name)
+                continue
+            if last_col < min_col:
+                logger.warning("Sheet with no data skipped: {}", sheet_name)
+                workbook.unload_sheet(sheet_name)
+                continue
+
+            rows = _iter_xls_rows(
+                sheet, workbook.datemode, (min_col, min_row, last_col, last_row)
+            )
+            headers: List[str] = []
+            if use_headers:
+                headers = [str(cell) if cell else "" for cell in next(rows)]
+
+            yield SheetStream(
+                sheetname=sheet_name,
+                headers=headers,
+                column_count=last_col - min_col + 1,
+                rows=rows,
+            )
+            workbook.unload_sheet(sheet_name)
+    finally:
+        workbook.release_resources()
+
+
+def _open_xls_workbook(file_content: Union[bytes, BinaryIO]) -> Any:
+    """
+    Open .xls content with on-demand sheet loading.
+
+    Args:
+        file_content: File content as bytes or file-like object.
+
+    Returns:
+        xlrd Book; sheets are loaded with _load_xls_sheet.
+
+    Raises:
+        InvalidFileFormatError: If the file cannot be read.
+    """
+    import xlrd
+
+    if not isinstance(file_content, bytes):
+        file_content = file_content.read()
+    try:
+        return xlrd.open_workbook(file_contents=file_content, on_demand=True)
+    except xlrd.biffh.XLRDError as e:
+        raise InvalidFileFormatError(f"Cannot read .xls file: {e}") from e
+    except Exception as e:
+        # Corrupt OLE containers and truncated BIFF streams fail inside
+        # xlrd with CompDocError, struct.error, IndexError and the like
+        raise InvalidFileFormatError(f"Error reading .xls file: {e}") from e
+
+
+def _load_xls_sheet(workbook: Any, sheet: Union[str, int]) -> Any:
+    """
+    Load one sheet of a workbook opened with _open_xls_workbook.
+
+    Raises:
+        InvalidFileFormatError: If the sheet's records cannot be parsed.
+    """
+    try:
+        if isinstance(sheet, int):
+            return workbook.sheet_by_index(sheet)
+        return workbook.sheet_by_name(sheet)
+    except Exception as e:
+        raise InvalidFileFormatError(f"Error reading .xls sheet {sheet}: {e}") from e
+
+
+def _iter_xls_rows(
+    sheet: Any,
+    datemode: int,
+    bounds: Tuple[int, int, int, int],
+) -> Iterator[List[Any]]:
+    """
+    Yield rows of an xlrd sheet within bounds using bulk row access.
+
+    Values are taken a whole row at a time with ``row_values`` instead of
+    creating a Cell object per access. Date cells (stored as floats in
+    .xls) are converted column by column, and only for columns that
+    actually contain dates.
+
+    Args:
+        sheet: xlrd sheet.
+        datemode: Workbook date mode (1900 or 1904 based).
+        bounds: Clamped 1-based (min_col, min_row, max_col, max_row).
+    """
+    from xlrd import XL_CELL_DATE
+
+    min_col, min_row, max_col, max_row = bounds
+    start_col, start_row = min_col - 1, min_row - 1
+    date_columns: Dict[int, List[Any]] = {}
+
+    if any(
+        XL_CELL_DATE in sheet.row_types(row_idx, start_col, max_col)
+        for row_idx in range(start_row, max_row)
+    ):
+        for col_idx in range(start_col, max_col):
+            col_types = sheet.col_types(col_idx, start_row, max_row)
+            if XL_CELL_DATE in col_types:
+                col_values = sheet.col_values(col_idx, start_row, max_row)
+                date_columns[col_idx - start_col] = [
+                    _xls_date_value(value, datemode) if cell_type == XL_CELL_DATE else value
+                    for value, cell_type in zip(col_values, col_types)
+                ]
+
+    if not date_columns:
+        for row_idx in range(start_row, max_row):
+            yield sheet.row_values(row_idx, start_col, max_col)
+        return
+
+    for row_idx in range(start_row, max_row):
+        row_data = sheet.row_values(row_idx, start_col, max_col)
+        for col_idx, values in date_columns.items():
+            row_data[col_idx] = values[row_idx - start_row]
+        yield row_data
+
+
+def _xls_date_value(value: float, datemode: int) -> Any:
+    """Convert an .xls serial date to datetime (or time for fractions of a day)."""
+    from xlrd.xldate import XLDateError, xldate_as_datetime
+
+    try:
+        converted = xldate_as_datetime(value, datemode)
+    except (XLDateError, ValueError, OverflowError):
+        return value
+    if 0 <= value < 1:
+        return converted.time()
+    return converted
+
+
 def read_excel_xls(
     file_content: Union[bytes, BinaryIO],
     use_headers: bool = True,
+    sheets: Optional[Sequence[str]] = None,
+    sheet_indices: Optional[Sequence[int]] = None,
+    cell_range: Optional[str] = None,
 ) -> List[SheetData]:
     """
     Read data from .xls file using xlrd.
@@ -55,6 +357,9 @@ def read_excel_xls(
     Args:
         file_content: File content as bytes or file-like object.
         use_headers: If True, first row is treated as headers.
+        sheets: Optional sheet names to read.
+        sheet_indices: Optional 0-based sheet positions to read.
+        cell_range: Optional A1-style range applied to every sheet.
 
     Returns:
         List of SheetData dictionaries with sheet data.
@@ -62,49 +367,88 @@ def read_excel_xls(
     Raises:
         EmptyFileError: If the file contains no sheets.
         InvalidFileFormatError: If the file cannot be read.
+        SheetNotFoundError: If a requested sheet does not exist.
+        InvalidRangeError: If the cell range is invalid.
     """
-    import xlrd
+    return [
+        SheetData(
+            sheetname=sheet["sheetname"],
+            headers=sheet["headers"],
+            data=list(sheet["rows"]),
+        )
+        for sheet in iter_excel_xls(
+            file_content, use_headers, sheets, sheet_indices, cell_range
+        )
+    ]
 
-    try:
-        if isinstance(file_content, bytes):
-            workbook = xlrd.open_workbook(file_contents=file_content)
-        else:
-            content = file_content.read()
-            workbook = xlrd.open_workbook(file_contents=content)
-    except xlrd.biffh.XLRDError as e:
-        raise InvalidFileFormatError(f"Cannot read .xls file: {e}")
 
-    sheet_names = workbook.sheet_names()
+def read_excel_xlsx(
+    file_content: Union[bytes, BinaryIO],
+    use_headers: bool = True,
+    engine: str = "openpyxl",
+    sheets: Optional[Sequence[str]] = None,
+    sheet_indices: Optional[Sequence[int]] = None,
+    cell_range: Optional[str] = None,
+) -> List[SheetData]:
+    """
+    Read data from .xlsx file using openpyxl or the fast engine.
+
+    Args:
+        file_content: File content as bytes or file-like object.
+        use_headers: If True, first row is treated as headers.
+        engine: Reader engine, one of XLSX_ENGINES.
+        sheets: Optional sheet names to read.
+        sheet_indices: Optional 0-based sheet positions to read.
+        cell_range: Optional A1-style range applied to every sheet.
+
+    Returns:
+        List of SheetData dictionaries with sheet data.
+
+    Raises:
+        EmptyFileError: If the file contains no sheets.
+        InvalidFileFormatError: If the file cannot be read.
+        SheetNotFoundError: If a requested sheet does not exist.
+        InvalidRangeError: If the cell range is invalid.
+    """
+    bounds = parse_cell_range(cell_range)
+    workbook = _open_xlsx_workbook(file_content, engine)
+
+    sheet_names = workbook.sheetnames
     if not sheet_names:
+        workbook.close()
         raise EmptyFileError("Excel file contains no sheets")
 
+    try:
+        selected = select_sheet_names(sheet_names, sheets, sheet_indices)
+    except SheetNotFoundError:
+        workbook.close()
+        raise
+
     result: List[SheetData] = []
 
-    for sheet_name in sheet_names:
-        sheet = workbook.sheet_by_name(sheet_name)
-        num_cols = sheet.ncols
-        num_rows = sheet.nrows
+    for sheet_name in selected:
+        sheet = workbook[sheet_name]
 
-        if num_rows == 0:
+        rows, max_cols = _trim_xlsx_rows(_iter_xlsx_bounded(sheet, bounds))
+        if not rows:
             logger.warning("Empty sheet skipped: {}", sheet_name)
             continue
 
+        if max_cols == 0:
+            logger.warning("Sheet with no data skipped: {}", sheet_name)
+            continue
+
+        # Pad rows that end before the rightmost used column
+        for row in rows:
+            if len(row) < max_cols:
+                row.extend([""] * (max_cols - len(row)))
+
         headers: List[str] = []
-        data: List[List[Any]] = []
-        start_row_idx = 0
-
-        if use_headers and num_rows > 0:
-            start_row_idx = 1
-            for col_idx in range(num_cols):
-                cell_value = sheet.cell(0, col_idx).value
-                headers.append(str(cell_value) if cell_value else "")
-
-        for row_idx in range(start_row_idx, num_rows):
-            row_data: List[Any] = []
-            for col_idx in range(num_cols):
-                cell_value = sheet.cell(row_idx, col_idx).value
-                row_data.append(cell_value)
-            data.append(row_data)
+        data: List[List[Any]] = rows
+
+        if use_headers:
+            headers = [str(cell) for cell in rows[0]]
+            data = rows[1:]
 
         result.append(
             SheetData(
@@ -114,99 +458,219 @@ def read_excel_xls(
             )
         )
 
+    workbook.close()
     return result
 
 
-def read_excel_xlsx(
+def iter_excel_xlsx(
     file_content: Union[bytes, BinaryIO],
     use_headers: bool = True,
-) -> List[SheetData]:
+    engine: str = "openpyxl",
+    sheets: Optional[Sequence[str]] = None,
+    sheet_indices: Optional[Sequence[int]] = None,
+    cell_range: Optional[str] = None,
+) -> Iterator[SheetStream]:
     """
-    Read data from .xlsx file using openpyxl.
+    Iterate over sheets of .xlsx file in read-only mode.
+
+    Rows are never materialized: the used column range of each sheet is
+    found first with a pre-scan (see _xlsx_used_width), then rows are
+    trimmed or padded to that width as they are emitted. The pre-scan
+    usually stops at the header row, but reads the whole sheet in the
+    worst case, so each sheet is parsed at most twice. Trailing columns
+    that are only formatted are dropped, as in read_excel_xlsx.
 
     Args:
         file_content: File content as bytes or file-like object.
         use_headers: If True, first row is treated as headers.
+        engine: Reader engine, one of XLSX_ENGINES.
+        sheets: Optional sheet names to read.
+        sheet_indices: Optional 0-based sheet positions to read.
+        cell_range: Optional A1-style range applied to every sheet.
 
-    Returns:
-        List of SheetData dictionaries with sheet data.
+    Yields:
+        SheetStream dictionaries with a lazy row generator.
 
     Raises:
         EmptyFileError: If the file contains no sheets.
         InvalidFileFormatError: If the file cannot be read.
+        SheetNotFoundError: If a requested sheet does not exist.
+        InvalidRangeError: If the cell range is invalid.
+    """
+    bounds = parse_cell_range(cell_range)
+    workbook = _open_xlsx_workbook(file_content, engine)
+
+    try:
+        sheet_names = workbook.sheetnames
+        if not sheet_names:
+            raise EmptyFileError("Excel file contains no sheets")
+
+        for sheet_name in select_sheet_names(sheet_names, sheets, sheet_indices):
+            sheet = workbook[sheet_name]
+
+            max_cols = _xlsx_used_width(sheet, bounds)
+            if max_cols < 0:
+                logger.warning("Empty sheet skipped: {}", sheet_name)
+                continue
+            if max_cols == 0:
+                logger.warning("Sheet with no data skipped: {}", sheet_name)
+                continue
+
+            rows = _iter_xlsx_rows(_iter_xlsx_bounded(sheet, bounds), max_cols)
+            headers: List[str] = []
+            if use_headers:
+                headers = [str(cell) for cell in next(rows)]
+
+            yield SheetStream(
+                sheetname=sheet_name,
+                headers=headers,
+                column_count=max_cols,
+                rows=rows,
+            )
+    finally:
+        workbook.close()
+
+
+def _open_xlsx_workbook(
+    file_content: Union[bytes, BinaryIO],
+    engine: str = "openpyxl",
+) -> Any:
+    """
+    Open .xlsx content in read-only, values-only mode.
+
+    Args:
+        file_content: File content as bytes or file-like object.
+        engine: Reader engine, one of XLSX_ENGINES.
+
+    Returns:
+        Workbook exposing the openpyxl read-only sheet API.
+
+    Raises:
+        ValueError: If the engine is unknown.
+        InvalidFileFormatError: If the file cannot be read.
     """
     from openpyxl import load_workbook
     from openpyxl.utils.exceptions import InvalidFileException
 
+    if engine not in XLSX_ENGINES:
+        raise ValueError(
+            f"Unknown xlsx engine: {engine}. Available: {', '.join(XLSX_ENGINES)}"
+        )
+
     try:
         if isinstance(file_content, bytes):
             file_obj = BytesIO(file_content)
         else:
             file_obj = file_content
 
-        workbook = load_workbook(filename=file_obj, read_only=True, data_only=True)
+        if engine == "fast":
+            from app.core.xlsx_fast_reader import open_fast_xlsx
+
+            return open_fast_xlsx(file_obj)
+        return load_workbook(filename=file_obj, read_only=True, data_only=True)
     except InvalidFileException as e:
         raise InvalidFileFormatError(f"Cannot read .xlsx file: {e}")
     except Exception as e:
         raise InvalidFileFormatError(f"Error reading .xlsx file: {e}")
 
-    sheet_names = workbook.sheetnames
-    if not sheet_names:
-        raise EmptyFileError("Excel file contains no sheets")
 
-    result: List[SheetData] = []
+def _trim_xlsx_rows(rows: Iterable[tuple]) -> Tuple[List[List[Any]], int]:
+    """
+    Normalize raw openpyxl rows in a single pass.
 
-    for sheet_name in sheet_names:
-        sheet = workbook[sheet_name]
+    Each row is cut after its last non-empty cell and None is replaced
+    with '' while the rightmost used column is tracked, so every cell is
+    visited exactly once. Rows are left unpadded.
 
-        rows = list(sheet.iter_rows(values_only=True))
-        if not rows:
-            logger.warning("Empty sheet skipped: {}", sheet_name)
-            continue
+    Returns:
+        Tuple of (normalized rows, number of used columns).
+    """
+    result: List[List[Any]] = []
+    width = 0
+    for row in rows:
+        end = len(row)
+        while end and row[end - 1] is None:
+            end -= 1
+        if end > width:
+            width = end
+        result.append([cell if cell is not None else "" for cell in row[:end]])
+    return result, width
 
-        # Determine actual column count (exclude trailing None columns)
-        max_cols = 0
-        for row in rows:
-            for i, cell in enumerate(row):
-                if cell is not None:
-                    max_cols = max(max_cols, i + 1)
 
-        if max_cols == 0:
-            logger.warning("Sheet with no data skipped: {}", sheet_name)
-            continue
+def _iter_xlsx_bounded(sheet: Any, bounds: CellBounds) -> Iterator[tuple]:
+    """Yield raw value rows of a read-only sheet restricted to bounds."""
+    min_col, min_row, max_col, max_row = bounds
+    return sheet.iter_rows(
+        min_row=min_row,
+        max_row=max_row,
+        min_col=min_col,
+        max_col=max_col,
+        values_only=True,
+    )
 
-        headers: List[str] = []
-        data: List[List[Any]] = []
 
-        if use_headers and rows:
-            header_row = rows[0][:max_cols]
-            headers = [str(cell) if cell is not None else "" for cell in header_row]
-            data_rows = rows[1:]
-        else:
-            data_rows = rows
+def _xlsx_used_width(sheet: Any, bounds: CellBounds = FULL_SHEET) -> int:
+    """
+    Find the used column count of a read-only sheet within bounds.
 
-        for row in data_rows:
-            row_data = list(row[:max_cols])
-            # Replace None with empty string for consistency
-            row_data = [cell if cell is not None else "" for cell in row_data]
-            data.append(row_data)
+    Streamed sheets need their width before the first row is emitted
+    (the header and separator come first), so the rightmost non-empty
+    column is found with a pre-scan pass that keeps no row data, and the
+    rows are read again afterwards. The ``<dimension>`` declared in the
+    sheet XML bounds the scan: once a value is found in its last column
+    the scan stops, which for most sheets happens in the header row.
 
-        result.append(
-            SheetData(
-                sheetname=sheet_name,
-                headers=headers,
-                data=data,
-            )
-        )
+    Worst case, the pre-scan reads every row, so the sheet is parsed
+    twice: when no dimension is declared, or when its last columns are
+    only formatted. Buffering rows instead would keep a whole sheet in
+    memory in that same case; read_excel_xlsx, which keeps the rows
+    anyway, trims them in a single pass (see _trim_xlsx_rows).
 
-    workbook.close()
-    return result
+    Returns:
+        Number of used columns, 0 if all cells are empty,
+        or -1 if the sheet has no rows at all.
+    """
+    min_col, min_row, max_col, max_row = bounds
+    dim_col, dim_row = sheet.max_column, sheet.max_row
+    declared = None
+    if dim_col and dim_row and dim_col * dim_row > 1:
+        if min_row > dim_row:
+            return -1
+        last_col = min(max_col, dim_col) if max_col else dim_col
+        declared = last_col - min_col + 1
+        if declared <= 0:
+            return 0
+
+    width = -1
+    for row in _iter_xlsx_bounded(sheet, bounds):
+        if width < 0:
+            width = 0
+        for i in range(len(row) - 1, width - 1, -1):
+            if row[i] is not None:
+                width = i + 1
+                break
+        if declared is not None and width >= declared:
+            break
+    return width
+
+
+def _iter_xlsx_rows(rows: Iterator[tuple], width: int) -> Iterator[List[Any]]:
+    """Trim or pad raw openpyxl rows to ``width``, replacing None with ''."""
+    for row in rows:
+        row_data = [cell if cell is not None else "" for cell in row[:width]]
+        if len(row_data) < width:
+            row_data.extend([""] * (width - len(row_data)))
+        yield row_data
 
 
 def get_excel_data(
     file_content: Union[bytes, BinaryIO],
     filename: str,
     use_headers: bool = True,
+    xlsx_engine: str = "openpyxl",
+    sheets: Optional[Sequence[str]] = None,
+    sheet_indices: Optional[Sequence[int]] = None,
+    cell_range: Optional[str] = None,
 ) -> List[SheetData]:
     """
     Read Excel file and extract data from all sheets.
@@ -218,6 +682,11 @@ def get_excel_data(
         file_content: File content as bytes or file-like object.
         filename: Original filename (used to detect format).
         use_headers: If True, first row is treated as headers.
+        xlsx_engine: Reader engine for .xlsx files, one of XLSX_ENGINES.
+        sheets: Optional sheet names to read; other sheets are skipped.
+        sheet_indices: Optional 0-based sheet positions to read.
+        cell_range: Optional A1-style range (e.g. "A1:D100") applied to
+            every selected sheet. The first row of the range is the header.
 
     Returns:
         List of SheetData dictionaries with sheet data.
@@ -225,26 +694,36 @@ def get_excel_data(
     Raises:
         InvalidFileFormatError: If format is not supported or file is invalid.
         EmptyFileError: If the file contains no data.
+        SheetNotFoundError: If a requested sheet does not exist.
+        InvalidRangeError: If the cell range is invalid.
     """
     file_format = detect_excel_format(filename)
 
     logger.info("Reading Excel file: {} (format: {})", filename, file_format)
 
     if file_format == "xls":
-        sheets = read_excel_xls(file_content, use_headers)
+        result = read_excel_xls(
+            file_content, use_headers, sheets, sheet_indices, cell_range
+        )
     else:
-        sheets = read_excel_xlsx(file_content, use_headers)
+        result = read_excel_xlsx(
+            file_content, use_headers, xlsx_engine, sheets, sheet_indices, cell_range
+        )
 
-    if not sheets:
+    if not result:
         raise EmptyFileError("Excel file contains no data")
 
-    logger.info("Successfully read {} sheet(s) from {}", len(sheets), filename)
-    return sheets
+    logger.info("Successfully read {} sheet(s) from {}", len(result), filename)
+    return result
 
 
 def get_excel_data_from_path(
     file_path: str,
     use_headers: bool = True,
+    xlsx_engine: str = "openpyxl",
+    sheets: Optional[Sequence[str]] = None,
+    sheet_indices: Optional[Sequence[int]] = None,
+    cell_range: Optional[str] = None,
 ) -> List[SheetData]:
     """
     Read Excel file from filesystem path.
@@ -254,6 +733,10 @@ def get_excel_data_from_path(
     Args:
         file_path: Path to the Excel file.
         use_headers: If True, first row is treated as headers.
+        xlsx_engine: Reader engine for .xlsx files, one of XLSX_ENGINES.
+        sheets: Optional sheet names to read.
+        sheet_indices: Optional 0-based sheet positions to read.
+        cell_range: Optional A1-style range applied to every sheet.
 
     Returns:
         List of SheetData dictionaries with sheet data.
@@ -261,4 +744,326 @@ def get_excel_data_from_path(
     path = Path(file_path)
     with open(path, "rb") as f:
         content = f.read()
-    return get_excel_data(content, path.name, use_headers)
+    return get_excel_data(
+        content, path.name, use_headers, xlsx_engine, sheets, sheet_indices, cell_range
+    )
+
+
+def iter_excel_sheets(
+    file_content: Union[bytes, BinaryIO],
+    filename: str,
+    use_headers: bool = True,
+    xlsx_engine: str = "openpyxl",
+    sheets: Optional[Sequence[str]] = None,
+    sheet_indices: Optional[Sequence[int]] = None,
+    cell_range: Optional[str] = None,
+) -> Iterator[SheetStream]:
+    """
+    Lazily read Excel file one sheet at a time.
+
+    Streaming counterpart of get_excel_data: each yielded sheet carries a
+    row generator, so callers can start writing output before the
+    workbook is fully read. Each sheet's rows must be consumed before
+    requesting the next sheet.
+
+    Args:
+        file_content: File content as bytes or file-like object.
+        filename: Original filename (used to detect format).
+        use_headers: If True, first row is treated as headers.
+        xlsx_engine: Reader engine for .xlsx files, one of XLSX_ENGINES.
+        sheets: Optional sheet names to read; other sheets are skipped.
+        sheet_indices: Optional 0-based sheet positions to read.
+        cell_range: Optional A1-style range applied to every sheet.
+
+    Yields:
+        SheetStream dictionaries with sheet headers and lazy rows.
+
+    Raises:
+        InvalidFileFormatError: If format is not supported or file is invalid.
+        EmptyFileError: If the file contains no data.
+        SheetNotFoundError: If a requested sheet does not exist.
+        InvalidRangeError: If the cell range is invalid.
+    """
+    file_format = detect_excel_format(filename)
+
+    logger.info("Streaming Excel file: {} (format: {})", filename, file_format)
+
+    if file_format == "xls":
+        streams = iter_excel_xls(
+            file_content, use_headers, sheets, sheet_indices, cell_range
+        )
+    else:
+        streams = iter_excel_xlsx(
+            file_content, use_headers, xlsx_engine, sheets, sheet_indices, cell_range
+        )
+
+    sheet_count = 0
+    for sheet in streams:
+        sheet_count += 1
+        yield sheet
+
+    if not sheet_count:
+        raise EmptyFileError("Excel file contains no data")
+
+
+def iter_excel_sheets_from_path(
+    file_path: str,
+    use_headers: bool = True,
+    xlsx_engine: str = "openpyxl",
+    sheets: Optional[Sequence[str]] = None,
+    sheet_indices: Optional[Sequence[int]] = None,
+    cell_range: Optional[str] = None,
+) -> Iterator[SheetStream]:
+    """
+    Lazily read Excel file from filesystem path.
+
+    The file stays open until the generator is exhausted or closed.
+
+    Args:
+        file_path: Path to the Excel file.
+        use_headers: If True, first row is treated as headers.
+        xlsx_engine: Reader engine for .xlsx files, one of XLSX_ENGINES.
+        sheets: Optional sheet names to read.
+        sheet_indices: Optional 0-based sheet positions to read.
+        cell_range: Optional A1-style range applied to every sheet.
+
+    Yields:
+        SheetStream dictionaries with sheet headers and lazy rows.
+    """
+    path = Path(file_path)
+    with open(path, "rb") as f:
+        yield from iter_excel_sheets(
+            f, path.name, use_headers, xlsx_engine, sheets, sheet_indices, cell_range
+        )
+
+
+def inspect_workbook(
+    file_content: Union[bytes, BinaryIO],
+    filename: str,
+) -> WorkbookInfo:
+    """
+    List sheets and their declared dimensions without reading cell data.
+
+    For .xlsx only ``workbook.xml`` and the ``<dimension>`` tag at the top
+    of each worksheet part are parsed. For .xls the workbook globals are
+    read and the DIMENSIONS record following each sheet's BOF record is
+    decoded directly. Sizes are as declared by the file (they may include
+    formatted but empty cells) and are None when the file omits them.
+
+    Args:
+        file_content: File content as bytes or file-like object.
+        filename: Original filename (used to detect format).
+
+    Returns:
+        WorkbookInfo with per-sheet dimensions and estimated cell counts.
+
+    Raises:
+        InvalidFileFormatError: If format is not supported or file is invalid.
+    """
+    file_format = detect_excel_format(filename)
+
+    if file_format == "xls":
+        bounds_by_sheet = _inspect_xls(file_content)
+    else:
+        bounds_by_sheet = _inspect_xlsx(file_content)
+
+    sheets: List[SheetInfo] = []
+    total_cells = 0
+    for index, (name, bounds) in enumerate(bounds_by_sheet):
+        info = _sheet_info(name, index, bounds)
+        total_cells += info["estimated_cells"] or 0
+        sheets.append(info)
+
+    return WorkbookInfo(format=file_format, sheets=sheets, estimated_cells=total_cells)
+
+
+def _sheet_info(
+    name: str,
+    index: int,
+    bounds: Optional[Tuple[int, int, int, int]],
+) -> SheetInfo:
+    """Build SheetInfo from 1-based (min_col, min_row, max_col, max_row)."""
+    from openpyxl.utils import get_column_letter
+
+    if bounds is None:
+        return SheetInfo(
+            name=name,
+            index=index,
+            dimension=None,
+            row_count=None,
+            column_count=None,
+            estimated_cells=None,
+        )
+
+    min_col, min_row, max_col, max_row = bounds
+    if max_col < min_col or max_row < min_row:
+        return SheetInfo(
+            name=name,
+            index=index,
+            dimension=None,
+            row_count=0,
+            column_count=0,
+            estimated_cells=0,
+        )
+
+    row_count = max_row - min_row + 1
+    column_count = max_col - min_col + 1
+    return SheetInfo(
+        name=name,
+        index=index,
+        dimension=(
+            f"{get_column_letter(min_col)}{min_row}:"
+            f"{get_column_letter(max_col)}{max_row}"
+        ),
+        row_count=row_count,
+        column_count=column_count,
+        estimated_cells=row_count * column_count,
+    )
+
+
+def _inspect_xlsx(
+    file_content: Union[bytes, BinaryIO],
+) -> List[Tuple[str, Optional[Tuple[int, int, int, int]]]]:
+    """Return (sheet name, declared bounds) pairs of an .xlsx workbook."""
+    workbook = _open_xlsx_workbook(file_content, engine="fast")
+    try:
+        # Sheet parts are opened and their dimension parsed on access
+        return [(name, workbook[name].boundaries) for name in workbook.sheetnames]
+    except Exception as e:
+        raise InvalidFileFormatError(f"Error reading .xlsx file: {e}") from e
+    finally:
+        workbook.close()
+
+
+# BIFF record identifiers used when scanning .xls sheet substreams
+_XLS_DIMENSIONS = 0x0200
+_XLS_EOF = 0x000A
+_XLS_BOF_CODES = (0x0809, 0x0409, 0x0209, 0x0009)
+
+
+def _inspect_xls(
+    file_content: Union[bytes, BinaryIO],
+) -> List[Tuple[str, Optional[Tuple[int, int, int, int]]]]:
+    """Return (sheet name, declared bounds) pairs of an .xls workbook."""
+    workbook = _open_xls_workbook(file_content)
+
+    try:
+        result = []
+        for index, name in enumerate(workbook.sheet_names()):
+            try:
+                bounds = _xls_declared_bounds(workbook, index)
+            except (AttributeError, IndexError, struct.error):
+                bounds = None
+            if bounds is None:
+                # No DIMENSIONS record: fall back to loading this sheet only
+                sheet = _load_xls_sheet(workbook, index)
+                bounds = (1, 1, sheet.ncols, sheet.nrows)
+                workbook.unload_sheet(index)
+            result.append((name, bounds))
+        return result
+    finally:
+        workbook.release_resources()
+
+
+def _xls_declared_bounds(
+    workbook: Any,
+    index: int,
+) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Decode the DIMENSIONS record of a sheet substream without parsing cells.
+
+    Relies on xlrd's record offsets (``_sh_abs_posn``) kept for on-demand
+    loading. Returns None when the record is missing.
+    """
+    for code, data, _ in _iter_xls_records(workbook.mem, workbook._sh_abs_posn[index]):
+        if code == _XLS_DIMENSIONS:
+            if workbook.biff_version >= 80:
+                first_row, last_row, first_col, last_col = struct.unpack("<IIHH", data[:12])
+            else:
+                first_row, last_row, first_col, last_col = struct.unpack("<HHHH", data[:8])
+            # Stored as 0-based first and 0-based "last + 1"
+            return (first_col + 1, first_row + 1, last_col, last_row)
+    return None
+
+
+def _iter_xls_records(mem: bytes, position: int) -> Iterator[Tuple[int, bytes, int]]:
+    """
+    Yield (code, data, end offset) of the BIFF records of one substream.
+
+    Starts at the BOF record at ``position`` and stops after the matching
+    EOF record, stepping over nested substreams (e.g. embedded charts).
+    """
+    depth = 0
+    while position + 4 <= len(mem):
+        code, length = struct.unpack("<HH", mem[position:position + 4])
+        data = mem[position + 4:position + 4 + length]
+        position += 4 + length
+        yield code, data, position
+        if code in _XLS_BOF_CODES:
+            depth += 1
+        elif code == _XLS_EOF:
+            depth -= 1
+            if depth <= 0:
+                return
+
+
+def sheet_fingerprints(
+    file_content: Union[bytes, BinaryIO],
+    filename: str,
+) -> Dict[str, str]:
+    """
+    Fingerprint the raw data of every sheet without parsing cells.
+
+    For .xlsx each fingerprint covers the worksheet XML part plus the
+    shared strings and styles parts its values depend on. For .xls it
+    covers the sheet's BIFF record stream plus the shared string table
+    and cell format types of the workbook globals. An edit to one sheet
+    therefore leaves the others' fingerprints unchanged, unless it also
+    changes the shared string table (any new or removed text does).
+
+    Args:
+        file_content: File content as bytes or file-like object.
+        filename: Original filename (used to detect format).
+
+    Returns:
+        Dictionary mapping sheet names to SHA-256 hex digests.
+
+    Raises:
+        InvalidFileFormatError: If format is not supported or file is invalid.
+    """
+    if detect_excel_format(filename) == "xls":
+        return _xls_sheet_fingerprints(file_content)
+
+    workbook = _open_xlsx_workbook(file_content, engine="fast")
+    try:
+        return {name: workbook.sheet_fingerprint(name) for name in workbook.sheetnames}
+    except Exception as e:
+        raise InvalidFileFormatError(f"Error reading .xlsx file: {e}") from e
+    finally:
+        workbook.close()
+
+
+def _xls_sheet_fingerprints(file_content: Union[bytes, BinaryIO]) -> Dict[str, str]:
+    """Fingerprint .xls sheets from their record streams (see sheet_fingerprints)."""
+    workbook = _open_xls_workbook(file_content)
+
+    try:
+        shared = hashlib.sha256()
+        shared.update(str(workbook.datemode).encode())
+        for text in workbook._sharedstrings:
+            shared.update(text.encode("utf-8", "surrogatepass") + b"\0")
+        shared.update(repr(sorted(workbook._xf_index_to_xl_type_map.items())).encode())
+        shared_digest = shared.digest()
+
+        fingerprints = {}
+        for index, name in enumerate(workbook.sheet_names()):
+            digest = hashlib.sha256(shared_digest)
+            start = workbook._sh_abs_posn[index]
+            end = start
+            for _, _, end in _iter_xls_records(workbook.mem, start):
+                pass
+            digest.update(workbook.mem[start:end])
+            fingerprints[name] = digest.hexdigest()
+        return fingerprints
+    finally:
+        workbook.release_resources()
@@ -31,6 +31,18 @@ class EmptySheetError(Excel2MarkdownError):
     pass
 
 
+class SheetNotFoundError(Excel2MarkdownError):
+    """Raised when a requested sheet does not exist in the workbook."""
+
+    pass
+
+
+class InvalidRangeError(Excel2MarkdownError):
+    """Raised when a requested cell range cannot be parsed."""
+
+    pass
+
+
 class ConversionError(Excel2MarkdownError):
     """Raised when conversion fails for any reason."""
 
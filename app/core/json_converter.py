@@ -0,0 +1,121 @@
+"""JSON and NDJSON conversion module for Excel data."""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+# Supported JSON output formats: a pretty-printed array, or one compact
+# record per line (newline-delimited JSON)
+JSON_FORMATS = ("json", "ndjson")
+
+_PRETTY_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2, default=str)
+_COMPACT_ENCODER = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), default=str
+)
+
+JsonRecord = Union[Dict[str, Any], List[Any]]
+
+
+def iter_json_records(
+    headers: Optional[List[str]],
+    rows: Iterable[List[Any]],
+) -> Iterator[JsonRecord]:
+    """
+    Turn sheet rows into JSON records.
+
+    Args:
+        headers: Column headers. Empty headers become ``column_<index>``.
+        rows: Iterable of rows, where each row is a list of cell values.
+
+    Yields:
+        One dict per row keyed by header, or the row itself when there
+        are no headers. Missing trailing cells become None.
+    """
+    if not headers:
+        yield from rows
+        return
+
+    keys = [header if header else f"column_{j}" for j, header in enumerate(headers)]
+    width = len(keys)
+    for row in rows:
+        if len(row) < width:
+            row = list(row) + [None] * (width - len(row))
+        yield dict(zip(keys, row))
+
+
+def write_json_records(
+    headers: Optional[List[str]],
+    rows: Iterable[List[Any]],
+    fp: TextIO,
+    buffer_rows: int = 1024,
+) -> int:
+    """
+    Write sheet rows as a pretty-printed JSON array, record by record.
+
+    Output is identical to ``json.dumps(records, ensure_ascii=False,
+    indent=2, default=str)`` but only ``buffer_rows`` encoded records are
+    held in memory at a time.
+
+    Args:
+        headers: Column headers (records are lists when empty).
+        rows: Iterable of rows, where each row is a list of cell values.
+        fp: Writable text stream.
+        buffer_rows: Number of encoded records kept before each write.
+
+    Returns:
+        Number of records written.
+    """
+    buffer: List[str] = []
+    row_count = 0
+    separator = "[\n  "
+
+    for record in iter_json_records(headers, rows):
+        # JSON strings never contain raw newlines, so re-indenting the
+        # encoded record line by line is safe
+        buffer.append(_PRETTY_ENCODER.encode(record).replace("\n", "\n  "))
+        row_count += 1
+
+        if len(buffer) >= buffer_rows:
+            fp.write(separator + ",\n  ".join(buffer))
+            separator = ",\n  "
+            buffer.clear()
+
+    if buffer:
+        fp.write(separator + ",\n  ".join(buffer))
+    fp.write("\n]" if row_count else "[]")
+
+    return row_count
+
+
+def write_ndjson_records(
+    headers: Optional[List[str]],
+    rows: Iterable[List[Any]],
+    fp: TextIO,
+    buffer_rows: int = 1024,
+) -> int:
+    """
+    Write sheet rows as newline-delimited JSON, one compact record per line.
+
+    Args:
+        headers: Column headers (records are lists when empty).
+        rows: Iterable of rows, where each row is a list of cell values.
+        fp: Writable text stream.
+        buffer_rows: Number of encoded records kept before each write.
+
+    Returns:
+        Number of records written.
+    """
+    buffer: List[str] = []
+    row_count = 0
+
+    for record in iter_json_records(headers, rows):
+        buffer.append(_COMPACT_ENCODER.encode(record))
+        row_count += 1
+
+        if len(buffer) >= buffer_rows:
+            fp.write("\n".join(buffer) + "\n")
+            buffer.clear()
+
+    if buffer:
+        fp.write("\n".join(buffer) + "\n")
+
+    return row_count
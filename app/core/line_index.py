@@ -0,0 +1,106 @@
+"""Byte-offset indexes of the lines of result files.
+
+The index of a file is a sidecar ``<file>.idx`` holding little-endian
+uint64 offsets: the start of every line, then the file size. Line ``i``
+spans bytes ``[idx[i], idx[i + 1])``, so any window of lines is read with
+one seek into the index and one into the file.
+"""
+
+import struct
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple
+
+INDEX_SUFFIX = ".idx"
+
+_OFFSET = struct.Struct("<Q")
+
+
+def index_path(path: Path) -> Path:
+    """Return the path of the line index of a file."""
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+class LineIndexWriter:
+    """
+    Text stream encoding each write once and recording where lines start.
+
+    The encoded bytes are passed on to the binary stream ``fp`` (e.g. the
+    result file, or a TeeWriter that also feeds a ZIP entry), so text is
+    never encoded again further down. Lines end at ``\\n`` only, as in the
+    files the converters write.
+    """
+
+    def __init__(self, fp: BinaryIO, index: BinaryIO, encoding: str = "utf-8"):
+        self.fp = fp
+        self.index = index
+        self.encoding = encoding
+        self.position = 0
+        self.line_count = 0
+        self._at_line_start = True
+
+    def write(self, text: str) -> int:
+        data = text.encode(self.encoding)
+        self.fp.write(data)
+        starts = []
+        pos = 0
+        while pos < len(data):
+            if self._at_line_start:
+                starts.append(self.position + pos)
+            newline = data.find(b"\n", pos)
+            if newline < 0:
+                self._at_line_start = False
+                break
+            pos = newline + 1
+            self._at_line_start = True
+        self.position += len(data)
+        self.line_count += len(starts)
+        if starts:
+            self.index.write(struct.pack(f"<{len(starts)}Q", *starts))
+        return len(text)
+
+    def finish(self) -> None:
+        """Terminate the index with the file size; call after the last write."""
+        self.index.write(_OFFSET.pack(self.position))
+
+
+def read_line_window(
+    path: Path,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> Optional[Tuple[str, bool, int]]:
+    """
+    Read a window of lines of a file through its line index.
+
+    Args:
+        path: Indexed text file.
+        offset: Number of lines to skip.
+        limit: Maximum number of lines to return (default: all).
+
+    Returns:
+        Tuple of (text, has_more, line_count), or None if the file has no
+        index.
+    """
+    try:
+        index = open(index_path(path), "rb")
+    except FileNotFoundError:
+        return None
+
+    with index:
+        size = index.seek(0, 2)
+        if size < _OFFSET.size:
+            # Conversion did not finish writing the index
+            return None
+        line_count = size // _OFFSET.size - 1
+        first = min(offset, line_count)
+        last = line_count if limit is None else min(first + limit, line_count)
+        if first == last:
+            return "", last < line_count, line_count
+        index.seek(first * _OFFSET.size)
+        (start,) = _OFFSET.unpack(index.read(_OFFSET.size))
+        index.seek(last * _OFFSET.size)
+        (end,) = _OFFSET.unpack(index.read(_OFFSET.size))
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return data.decode("utf-8"), last < line_count, line_count
@@ -1,12 +1,106 @@
 """Markdown conversion module for Excel data."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TextIO
 
 from loguru import logger
 
 from app.core.excel_reader import SheetData
 
 
+# Integral floats up to this magnitude are written without ".0"
+_MAX_INTEGRAL_FLOAT = 1e16
+
+
+def _format_str(value: str) -> str:
+    # Escape pipe character which is used as column separator
+    if "|" in value:
+        value = value.replace("|", "\\|")
+    # Replace newlines with <br> for multi-line content
+    if "\n" in value:
+        value = value.replace("\n", "<br>")
+    return value
+
+
+def _format_float(value: float) -> str:
+    # xlrd returns every number as float: show 1.0 as "1"
+    if value.is_integer() and -_MAX_INTEGRAL_FLOAT < value < _MAX_INTEGRAL_FLOAT:
+        return str(int(value))
+    return repr(value)
+
+
+def _format_other(value: Any) -> str:
+    return _format_str(str(value))
+
+
+# Formatter per exact cell type; anything else goes through str()
+_CELL_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    str: _format_str,
+    int: str,
+    bool: str,
+    float: _format_float,
+    type(None): lambda value: "",
+}
+
+
+class CellFormatter:
+    """
+    Format rows of cell values for markdown, dispatching on the value type.
+
+    xlrd returns every number as a float, so integral floats are cached and
+    repeated numbers (categories, codes, years) are only formatted once.
+    The cache stops growing at ``max_entries`` values. It is dropped when
+    more than ``max_entries`` lookups, and most lookups, missed: values
+    that never repeat (IDs) only pay for the lookups. Other floats rarely
+    repeat and most strings need no escaping, so neither is cached.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._floats: Optional[Dict[float, str]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def row(self, cells: Sequence[Any]) -> str:
+        """Render one table row."""
+        floats = self._floats
+        hits = misses = 0
+        texts: List[str] = []
+        append = texts.append
+        for cell in cells:
+            kind = type(cell)
+            if kind is str:
+                if "|" in cell or "\n" in cell:
+                    cell = _format_str(cell)
+                append(cell)
+            elif kind is float:
+                if not cell.is_integer():
+                    append(repr(cell))
+                elif floats is None:
+                    append(_format_float(cell))
+                else:
+                    text = floats.get(cell)
+                    if text is None:
+                        misses += 1
+                        text = _format_float(cell)
+                        if len(floats) < self.max_entries:
+                            floats[cell] = text
+                    else:
+                        hits += 1
+                    append(text)
+            elif kind is int:
+                append(str(cell))
+            elif cell is None:
+                append("")
+            else:
+                append(_CELL_FORMATTERS.get(kind, _format_other)(cell))
+        self._hits += hits
+        if misses:
+            self._misses += misses
+            if self._misses > max(self.max_entries, self._hits):
+                self._floats = None
+        return "|" + "|".join(texts) + "|"
+
+
 def escape_markdown_cell(value: Any) -> str:
     """
     Escape special markdown characters in cell value.
@@ -17,12 +111,7 @@ def escape_markdown_cell(value: Any) -> str:
     Returns:
         Escaped string safe for markdown table.
     """
-    text = str(value) if value is not None else ""
-    # Escape pipe character which is used as column separator
-    text = text.replace("|", "\\|")
-    # Replace newlines with <br> for multi-line content
-    text = text.replace("\n", "<br>")
-    return text
+    return _CELL_FORMATTERS.get(type(value), _format_other)(value)
 
 
 def get_markdown_table(
@@ -32,6 +121,9 @@ def get_markdown_table(
     """
     Create markdown table from headers and data.
 
+    Lines are collected in a list and joined once, so the cost stays
+    linear in the size of the table.
+
     Args:
         headers: List of column headers. Can be None or empty.
         data: List of rows, where each row is a list of cell values.
@@ -39,26 +131,90 @@ def get_markdown_table(
     Returns:
         String with table in markdown format.
     """
-    result = ""
+    lines: List[str] = []
+    formatter = CellFormatter()
 
     if headers:
-        escaped_headers = [escape_markdown_cell(h) for h in headers]
-        result += "|" + "|".join(escaped_headers) + "|\n"
-        result += "|" + "|".join(["-"] * len(headers)) + "|"
+        lines.extend(_header_lines(formatter, headers, len(headers)))
     elif data:
         # No headers but have data - create empty header row
-        max_col_count = len(max(data, key=len)) if data else 0
-        result += "|" + "|".join([" "] * max_col_count) + "|\n"
-        result += "|" + "|".join(["-"] * max_col_count) + "|"
+        lines.extend(_header_lines(formatter, None, max(map(len, data))))
 
-    if not data:
-        return result
+    if data:
+        lines.extend(map(formatter.row, data))
 
-    for row in data:
-        escaped_row = [escape_markdown_cell(cell) for cell in row]
-        result += "\n|" + "|".join(escaped_row) + "|"
+    return "\n".join(lines)
 
-    return result
+
+def _header_lines(
+    formatter: CellFormatter,
+    headers: Optional[List[str]],
+    column_count: int,
+) -> List[str]:
+    """Render the header row (blank if no headers) and the separator row."""
+    if headers:
+        header = formatter.row(headers)
+    else:
+        header = "|" + "|".join([" "] * column_count) + "|"
+    return [header, "|" + "|".join(["-"] * column_count) + "|"]
+
+
+def write_markdown_table(
+    headers: Optional[List[str]],
+    rows: Iterable[List[Any]],
+    fp: TextIO,
+    column_count: Optional[int] = None,
+    buffer_rows: int = 1024,
+) -> int:
+    """
+    Write markdown table to a text stream as rows arrive.
+
+    Produces the same text as get_markdown_table, but rows are consumed
+    lazily and flushed to ``fp`` every ``buffer_rows`` lines, so memory
+    use does not grow with the table size.
+
+    Args:
+        headers: List of column headers. Can be None or empty.
+        rows: Iterable of rows, where each row is a list of cell values.
+        fp: Writable text stream (file, socket wrapper, StringIO...).
+        column_count: Width of the blank header row used when there are
+            no headers. Required in that case, since rows are not known
+            in advance.
+        buffer_rows: Number of rendered lines kept before each write.
+
+    Returns:
+        Number of data rows written.
+
+    Raises:
+        ValueError: If neither headers nor column_count are given.
+    """
+    if not headers and column_count is None:
+        raise ValueError("column_count is required when there are no headers")
+
+    buffer: List[str] = []
+    row_count = 0
+    separator = ""
+    formatter = CellFormatter()
+
+    if headers:
+        buffer.extend(_header_lines(formatter, headers, len(headers)))
+
+    for row in rows:
+        if not row_count and not headers:
+            # Blank header row is only emitted for tables with data
+            buffer.extend(_header_lines(formatter, None, column_count))
+        buffer.append(formatter.row(row))
+        row_count += 1
+
+        if len(buffer) >= buffer_rows:
+            fp.write(separator + "\n".join(buffer))
+            separator = "\n"
+            buffer.clear()
+
+    if buffer:
+        fp.write(separator + "\n".join(buffer))
+
+    return row_count
 
 
 def convert_sheet_to_markdown(sheet: SheetData) -> str:
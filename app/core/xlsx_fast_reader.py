@@ -0,0 +1,424 @@
+"""Lightweight .xlsx reader streaming worksheet XML without openpyxl cells.
+
+openpyxl builds a cell dictionary and coordinate tuple for every value,
+even in read-only mode. This engine parses ``xl/worksheets/sheetN.xml``
+incrementally with the standard library's C-accelerated ``iterparse``,
+resolves shared strings through a plain list and yields rows as tuples
+of values. Only "end" events are requested: a finished ``<row>`` already
+holds all its cells, so start events would just double the event count.
+Each row is cleared once emitted, leaving an empty element behind (about
+80 bytes per row, as with openpyxl's own read-only reader).
+
+The workbook object mimics the subset of openpyxl's read-only API used
+by ``app.core.excel_reader`` (``sheetnames``, ``wb[name]``,
+``sheet.max_column``/``max_row``, ``sheet.iter_rows(values_only=True)``
+and ``close()``), and produces the same values and row padding.
+"""
+
+import hashlib
+import posixpath
+import zipfile
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from openpyxl.styles.numbers import (
+    BUILTIN_FORMATS,
+    is_date_format,
+    is_timedelta_format,
+)
+from openpyxl.utils.cell import column_index_from_string, range_boundaries
+from openpyxl.utils.datetime import MAC_EPOCH, WINDOWS_EPOCH, from_excel, from_ISO8601
+
+from xml.etree.ElementTree import iterparse
+
+SHEET_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+ROW_TAG = f"{{{SHEET_MAIN_NS}}}row"
+VALUE_TAG = f"{{{SHEET_MAIN_NS}}}v"
+INLINE_STRING_TAG = f"{{{SHEET_MAIN_NS}}}is"
+TEXT_TAG = f"{{{SHEET_MAIN_NS}}}t"
+RUN_TAG = f"{{{SHEET_MAIN_NS}}}r"
+SHARED_STRING_TAG = f"{{{SHEET_MAIN_NS}}}si"
+DIMENSION_TAG = f"{{{SHEET_MAIN_NS}}}dimension"
+SHEET_DATA_TAG = f"{{{SHEET_MAIN_NS}}}sheetData"
+
+WORKSHEET_REL_TYPE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"
+)
+OFFICE_DOCUMENT_REL_TYPE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+
+_DIGITS = "0123456789"
+_COLUMN_CACHE: Dict[str, int] = {}
+
+
+def _column_index(letters: str) -> int:
+    """Return 1-based column index for column letters, cached."""
+    index = _COLUMN_CACHE.get(letters)
+    if index is None:
+        index = column_index_from_string(letters)
+        _COLUMN_CACHE[letters] = index
+    return index
+
+
+def _cast_number(value: str) -> Any:
+    """Convert numbers as string to an int or float (as openpyxl does)."""
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+    return int(value)
+
+
+def _text_content(element: Any) -> str:
+    """Concatenate plain and rich-text runs, skipping phonetic hints."""
+    snippets = []
+    for child in element:
+        if child.tag == TEXT_TAG:
+            if child.text:
+                snippets.append(child.text)
+        elif child.tag == RUN_TAG:
+            text = child.findtext(TEXT_TAG)
+            if text:
+                snippets.append(text)
+    return "".join(snippets)
+
+
+class FastXlsxSheet:
+    """A single worksheet streamed straight from its XML part."""
+
+    def __init__(self, workbook: "FastXlsxWorkbook", title: str, path: str):
+        self.parent = workbook
+        self.title = title
+        self._path = path
+        self._dimension: Optional[Tuple[int, int, int, int]] = self._read_dimension()
+
+    def _read_dimension(self) -> Optional[Tuple[int, int, int, int]]:
+        """Read the ``<dimension>`` tag, stopping at the start of sheet data."""
+        with self.parent._archive.open(self._path) as source:
+            for _, element in iterparse(source, events=("start",)):
+                if element.tag == DIMENSION_TAG:
+                    ref = element.get("ref")
+                    if not ref:
+                        return None
+                    try:
+                        return range_boundaries(ref)
+                    except ValueError:
+                        return None
+                if element.tag == SHEET_DATA_TAG:
+                    return None
+        return None
+
+    @property
+    def boundaries(self) -> Optional[Tuple[int, int, int, int]]:
+        """Declared (min_col, min_row, max_col, max_row), or None if unsized."""
+        return self._dimension
+
+    @property
+    def max_column(self) -> Optional[int]:
+        return self._dimension[2] if self._dimension else None
+
+    @property
+    def max_row(self) -> Optional[int]:
+        return self._dimension[3] if self._dimension else None
+
+    def iter_rows(
+        self,
+        min_row: Optional[int] = None,
+        max_row: Optional[int] = None,
+        min_col: Optional[int] = None,
+        max_col: Optional[int] = None,
+        values_only: bool = True,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Yield rows as value tuples, padded the way openpyxl read-only does.
+
+        Missing rows are filled with empty rows, and when the sheet declares
+        a dimension (or max_col is given) every row is padded or cut to
+        that width. Bounds are 1-based and inclusive.
+        """
+        min_col = min_col or 1
+        min_row = min_row or 1
+        max_col = max_col or self.max_column
+        max_row = max_row or self.max_row
+        empty_row: Tuple[Any, ...] = ()
+        if max_col is not None:
+            empty_row = (None,) * (max_col + 1 - min_col)
+
+        counter = min_row
+        idx = 1
+        for idx, cells in self._iter_raw_rows():
+            if max_row is not None and idx > max_row:
+                break
+
+            while counter < idx:
+                counter += 1
+                yield empty_row
+
+            if counter <= idx:
+                counter += 1
+                if not cells and not max_col:
+                    yield ()
+                    continue
+                last_col = max_col or cells[-1][0]
+                row = [None] * (last_col + 1 - min_col)
+                for column, value in cells:
+                    if min_col <= column <= last_col:
+                        row[column - min_col] = value
+                yield tuple(row)
+
+        if max_row is not None and max_row < idx:
+            while counter <= max_row:
+                counter += 1
+                yield empty_row
+
+    def _iter_raw_rows(self) -> Iterator[Tuple[int, List[Tuple[int, Any]]]]:
+        """Yield (row number, [(column, value), ...]) for each ``<row>``."""
+        workbook = self.parent
+        shared_strings = workbook.shared_strings
+        date_styles = workbook.date_styles
+        timedelta_styles = workbook.timedelta_styles
+        epoch = workbook.epoch
+
+        columns = _COLUMN_CACHE
+        row_counter = 0
+        with workbook._archive.open(self._path) as source:
+            for _, element in iterparse(source):
+                if element.tag != ROW_TAG:
+                    continue
+
+                ref = element.get("r")
+                row_counter = int(float(ref)) if ref else row_counter + 1
+
+                cells: List[Tuple[int, Any]] = []
+                column = 0
+                for cell in element:
+                    coordinate = cell.get("r")
+                    if coordinate:
+                        letters = coordinate.rstrip(_DIGITS)
+                        column = columns.get(letters) or _column_index(letters)
+                    else:
+                        column += 1
+
+                    data_type = cell.get("t")
+                    if data_type == "inlineStr":
+                        inline = cell.find(INLINE_STRING_TAG)
+                        value = _text_content(inline) if inline is not None else None
+                    else:
+                        value = None
+                        for child in cell:
+                            if child.tag == VALUE_TAG:
+                                value = child.text or None
+                                break
+                        if value is None:
+                            pass
+                        elif data_type is None or data_type == "n":
+                            value = _cast_number(value)
+                            style_id = cell.get("s", "0")
+                            if style_id in date_styles:
+                                try:
+                                    value = from_excel(
+                                        value,
+                                        epoch,
+                                        timedelta=style_id in timedelta_styles,
+                                    )
+                                except (OverflowError, ValueError):
+                                    value = "#VALUE!"
+                        elif data_type == "s":
+                            value = shared_strings[int(value)]
+                        elif data_type == "b":
+                            value = bool(int(value))
+                        elif data_type == "d":
+                            value = from_ISO8601(value)
+                    cells.append((column, value))
+
+                element.clear()
+                yield row_counter, cells
+
+
+class FastXlsxWorkbook:
+    """Read-only view over an .xlsx archive for the fast engine."""
+
+    def __init__(self, file_obj: Any):
+        self._archive = zipfile.ZipFile(file_obj)
+        self.epoch = WINDOWS_EPOCH
+        self._sheet_paths: Dict[str, str] = {}
+
+        workbook_path = self._find_workbook_path()
+        self._read_workbook(workbook_path)
+        self._sheets: Dict[str, FastXlsxSheet] = {}
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return list(self._sheet_paths)
+
+    @cached_property
+    def shared_strings(self) -> List[str]:
+        """Shared string table, loaded when the first sheet is read."""
+        return self._read_shared_strings()
+
+    @cached_property
+    def _style_formats(self) -> Tuple[Set[str], Set[str]]:
+        return self._read_date_styles()
+
+    @property
+    def date_styles(self) -> Set[str]:
+        return self._style_formats[0]
+
+    @property
+    def timedelta_styles(self) -> Set[str]:
+        return self._style_formats[1]
+
+    def __getitem__(self, name: str) -> FastXlsxSheet:
+        sheet = self._sheets.get(name)
+        if sheet is None:
+            if name not in self._sheet_paths:
+                raise KeyError(f"Worksheet {name} does not exist.")
+            sheet = FastXlsxSheet(self, name, self._sheet_paths[name])
+            self._sheets[name] = sheet
+        return sheet
+
+    def sheet_fingerprint(self, name: str) -> str:
+        """
+        SHA-256 of a worksheet part and the workbook parts its values use.
+
+        Covers the date epoch, the shared strings and styles parts and the
+        raw worksheet XML, without parsing any of them.
+        """
+        if name not in self._sheet_paths:
+            raise KeyError(f"Worksheet {name} does not exist.")
+        digest = hashlib.sha256(self._shared_parts_digest)
+        self._update_digest(digest, self._sheet_paths[name])
+        return digest.hexdigest()
+
+    @cached_property
+    def _shared_parts_digest(self) -> bytes:
+        digest = hashlib.sha256(b"1904" if self.epoch == MAC_EPOCH else b"1900")
+        for path in (self._shared_strings_path, self._styles_path):
+            if path:
+                self._update_digest(digest, path)
+            digest.update(b"\0")
+        return digest.digest()
+
+    def _update_digest(self, digest: Any, path: str) -> None:
+        with self._archive.open(path) as source:
+            for chunk in iter(lambda: source.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+    def close(self) -> None:
+        self._archive.close()
+
+    def _read_relationships(self, part_path: str) -> Dict[str, Tuple[str, str]]:
+        """Return {rel id: (type, absolute target)} for a package part."""
+        folder, name = posixpath.split(part_path)
+        rels_path = posixpath.join(folder, "_rels", f"{name}.rels")
+        if rels_path not in self._archive.namelist():
+            return {}
+
+        rels: Dict[str, Tuple[str, str]] = {}
+        with self._archive.open(rels_path) as source:
+            for _, element in iterparse(source):
+                if element.tag != f"{{{PKG_REL_NS}}}Relationship":
+                    continue
+                target = element.get("Target", "")
+                if target.startswith("/"):
+                    target = target.lstrip("/")
+                else:
+                    target = posixpath.normpath(posixpath.join(folder, target))
+                rels[element.get("Id")] = (element.get("Type", ""), target)
+        return rels
+
+    def _find_workbook_path(self) -> str:
+        for rel_type, target in self._read_relationships("").values():
+            if rel_type == OFFICE_DOCUMENT_REL_TYPE:
+                return target
+        return "xl/workbook.xml"
+
+    def _read_workbook(self, workbook_path: str) -> None:
+        """Collect worksheet names and parts, and the date epoch."""
+        rels = self._read_relationships(workbook_path)
+        with self._archive.open(workbook_path) as source:
+            for _, element in iterparse(source):
+                if element.tag == f"{{{SHEET_MAIN_NS}}}workbookPr":
+                    if element.get("date1904") in ("1", "true"):
+                        self.epoch = MAC_EPOCH
+                elif element.tag == f"{{{SHEET_MAIN_NS}}}sheet":
+                    rel = rels.get(element.get(f"{{{REL_NS}}}id"))
+                    if rel and rel[0] == WORKSHEET_REL_TYPE:
+                        self._sheet_paths[element.get("name")] = rel[1]
+
+        self._shared_strings_path = None
+        self._styles_path = None
+        for rel_type, target in rels.values():
+            if rel_type.endswith("/sharedStrings"):
+                self._shared_strings_path = target
+            elif rel_type.endswith("/styles"):
+                self._styles_path = target
+
+    def _read_shared_strings(self) -> List[str]:
+        """Load the shared string table as a flat list indexed by position."""
+        strings: List[str] = []
+        if not self._shared_strings_path:
+            return strings
+        with self._archive.open(self._shared_strings_path) as source:
+            for _, element in iterparse(source):
+                if element.tag == SHARED_STRING_TAG:
+                    strings.append(_text_content(element).replace("x005F_", ""))
+                    element.clear()
+        return strings
+
+    def _read_date_styles(self) -> Tuple[Set[str], Set[str]]:
+        """
+        Return indexes of cell styles holding date and timedelta formats.
+
+        Indexes are kept as strings so they can be matched against the raw
+        ``s`` attribute of each cell without conversion.
+        """
+        date_styles: Set[str] = set()
+        timedelta_styles: Set[str] = set()
+        if not self._styles_path:
+            return date_styles, timedelta_styles
+
+        custom_formats: Dict[int, str] = {}
+        xf_format_ids: List[int] = []
+        with self._archive.open(self._styles_path) as source:
+            for _, element in iterparse(source):
+                tag = element.tag
+                if tag == f"{{{SHEET_MAIN_NS}}}numFmt":
+                    custom_formats[int(element.get("numFmtId"))] = element.get(
+                        "formatCode", ""
+                    )
+                elif tag == f"{{{SHEET_MAIN_NS}}}cellXfs":
+                    xf_format_ids = [
+                        int(xf.get("numFmtId", 0))
+                        for xf in element
+                        if xf.tag == f"{{{SHEET_MAIN_NS}}}xf"
+                    ]
+
+        for idx, format_id in enumerate(xf_format_ids):
+            fmt = custom_formats.get(format_id) or BUILTIN_FORMATS.get(format_id)
+            if not fmt:
+                continue
+            if is_date_format(fmt):
+                date_styles.add(str(idx))
+            if is_timedelta_format(fmt):
+                timedelta_styles.add(str(idx))
+        return date_styles, timedelta_styles
+
+
+def open_fast_xlsx(file_obj: Any) -> FastXlsxWorkbook:
+    """
+    Open .xlsx content with the fast streaming engine.
+
+    Args:
+        file_obj: Path or binary file-like object of the .xlsx archive.
+
+    Returns:
+        FastXlsxWorkbook exposing a read-only, values-only sheet API.
+
+    Raises:
+        zipfile.BadZipFile: If the content is not a ZIP archive.
+        KeyError: If a required workbook part is missing.
+    """
+    return FastXlsxWorkbook(file_obj)
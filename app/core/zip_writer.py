@@ -0,0 +1,108 @@
+"""Incremental writing of ZIP archives of conversion results."""
+
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+def zip_compression(level: int) -> Tuple[int, Optional[int]]:
+    """
+    Map a compression level to zipfile arguments.
+
+    Args:
+        level: 0 stores entries uncompressed (ZIP_STORED, fastest),
+            1-9 are deflate levels.
+
+    Returns:
+        Tuple of (compression, compresslevel) for zipfile.ZipFile.
+    """
+    if level == 0:
+        return zipfile.ZIP_STORED, None
+    return zipfile.ZIP_DEFLATED, level
+
+
+def open_zip(target: Union[Path, BinaryIO], level: int) -> zipfile.ZipFile:
+    """
+    Open a ZIP archive for writing with the given compression level.
+
+    Args:
+        target: Path or writable binary stream; non-seekable streams are
+            supported (entries then carry data descriptors).
+        level: Compression level, see zip_compression.
+
+    Returns:
+        Writable ZipFile.
+    """
+    compression, compresslevel = zip_compression(level)
+    return zipfile.ZipFile(target, "w", compression, compresslevel=compresslevel)
+
+
+class TeeWriter:
+    """
+    Binary stream duplicating every write into a second binary stream.
+
+    Lets a converter write a sheet to its result file and into an open
+    ZIP archive entry in one pass, instead of re-reading the file later.
+    Both get the same already encoded bytes.
+    """
+
+    def __init__(self, fp: BinaryIO, raw: BinaryIO):
+        self.fp = fp
+        self.raw = raw
+
+    def write(self, data: bytes) -> int:
+        self.fp.write(data)
+        self.raw.write(data)
+        return len(data)
+
+
+class _ChunkSink:
+    """Non-seekable binary stream collecting written bytes."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self.chunks = self.chunks, []
+        yield from chunks
+
+
+def iter_zip(
+    files: Iterable[Path],
+    level: int,
+    chunk_size: int = 1024 * 1024,
+) -> Iterator[bytes]:
+    """
+    Generate a ZIP archive of files piece by piece.
+
+    Nothing is written to disk and at most about one chunk of each file is
+    held in memory, so archives of any size can be streamed to a client.
+
+    Args:
+        files: Files to archive, stored under their names.
+        level: Compression level, see zip_compression.
+        chunk_size: Bytes read from the files at a time.
+
+    Yields:
+        Consecutive pieces of the archive.
+    """
+    sink = _ChunkSink()
+    with open_zip(sink, level) as archive:
+        for path in files:
+            # The entry size is not known up front when streaming
+            force_zip64 = path.stat().st_size * 1.05 > zipfile.ZIP64_LIMIT
+            with open(path, "rb") as source, archive.open(
+                path.name, "w", force_zip64=force_zip64
+            ) as entry:
+                for chunk in iter(lambda: source.read(chunk_size), b""):
+                    entry.write(chunk)
+                    yield from sink.drain()
+            yield from sink.drain()
+    yield from sink.drain()
@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import time
 from pathlib import Path
 from urllib.parse import unquote
 
@@ -9,10 +10,13 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from loguru import logger
 
-from app.api.routes import convert, health, tasks
+from app.api.routes import convert, health, inspect, tasks
 from app.config import settings
 from app.core.exceptions import Excel2MarkdownError
 from app.services.conversion_service import conversion_service
+from app.services.file_handler import file_handler
+from app.services.metrics import REQUEST_SECONDS
+from app.services.task_events import task_events
 
 # Application setup
 app = FastAPI(
@@ -31,9 +35,26 @@ templates = Jinja2Templates(directory=templates_dir)
 # Include routers
 app.include_router(health.router)
 app.include_router(convert.router)
+app.include_router(inspect.router)
 app.include_router(tasks.router)
 
 
+@app.middleware("http")
+async def observe_request(request: Request, call_next):
+    """Record request latency per route template, not per raw path."""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = getattr(request.scope.get("route"), "path", "unmatched")
+        REQUEST_SECONDS.labels(request.method, route, status).observe(
+            time.perf_counter() - start
+        )
+
+
 # Exception handlers
 @app.exception_handler(Excel2MarkdownError)
 async def excel_error_handler(request: Request, exc: Excel2MarkdownError):
@@ -88,7 +109,7 @@ async def progress_page(request: Request, task_id: str):
 
 
 @app.get("/result/{task_id}", response_class=HTMLResponse)
-async def result_page(request: Request, task_id: str):
+def result_page(request: Request, task_id: str):
     """Render the conversion result page."""
     result = conversion_service.get_task_result(task_id)
 
@@ -96,6 +117,31 @@ async def result_page(request: Request, task_id: str):
         # Task not complete, redirect to progress
         return RedirectResponse(url=f"/progress/{task_id}")
 
+    # The task result is a manifest: show each sheet's preview, read from
+    # the result file; the page loads further lines from the sheet
+    # endpoint on demand
+    sheets = {}
+    for sheet_name, sheet_data in result.get("sheets", {}).items():
+        sheet_data = dict(sheet_data)
+        if "file" in sheet_data:
+            try:
+                preview = file_handler.read_result_preview(task_id, sheet_data["file"])
+            except FileNotFoundError:
+                logger.warning("Result file missing for task {}: {}", task_id, sheet_data["file"])
+                continue
+            (
+                sheet_data["preview"],
+                sheet_data["preview_lines"],
+                has_more,
+                sheet_data["truncated"],
+            ) = preview
+        else:
+            # Content stored inline in the result backend
+            sheet_data["preview"], has_more = sheet_data.get("content", ""), False
+        sheet_data["has_more"] = has_more
+        sheets[sheet_name] = sheet_data
+    result = {**result, "sheets": sheets}
+
     return templates.TemplateResponse(
         "result.html",
         {
@@ -135,3 +181,5 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on application shutdown."""
     logger.info("Shutting down {}", settings.app_name)
+    await task_events.close()
+    await conversion_service.close()
@@ -1,6 +1,6 @@
 """Request schemas for API endpoints."""
 
-from typing import Literal
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -12,7 +12,29 @@ class ConversionOptions(BaseModel):
         default=True,
         description="Treat first row as headers",
     )
-    output_format: Literal["markdown", "json"] = Field(
+    output_format: Literal["markdown", "json", "ndjson"] = Field(
         default="markdown",
         description="Output format for conversion",
     )
+    sheets: Optional[List[str]] = Field(
+        default=None,
+        description="Sheet names to convert (default: all sheets)",
+    )
+    sheet_indices: Optional[List[int]] = Field(
+        default=None,
+        description="0-based sheet positions to convert",
+    )
+    cell_range: Optional[str] = Field(
+        default=None,
+        alias="range",
+        description="A1-style cell range applied to every sheet, e.g. A1:D100",
+    )
+
+
+class TaskStatusBatchRequest(BaseModel):
+    """Task IDs for a batch status lookup."""
+
+    task_ids: List[str] = Field(
+        min_length=1,
+        description="Task IDs to check (at most STATUS_BATCH_MAX)",
+    )
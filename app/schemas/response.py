@@ -12,6 +12,16 @@ class HealthResponse(BaseModel):
     version: str
 
 
+class CacheStatsResponse(BaseModel):
+    """Result cache counters."""
+
+    enabled: bool
+    hits: int = 0
+    misses: int = 0
+    sheet_hits: int = 0
+    sheet_misses: int = 0
+
+
 class TaskCreatedResponse(BaseModel):
     """Response when a conversion task is created."""
 
@@ -24,7 +34,7 @@ class TaskStatusResponse(BaseModel):
     """Response for task status polling."""
 
     task_id: str
-    status: Literal["PENDING", "PROGRESS", "SUCCESS", "FAILURE"]
+    status: Literal["PENDING", "STARTED", "PROGRESS", "SUCCESS", "FAILURE"]
     progress: int = Field(default=0, ge=0, le=100)
     message: Optional[str] = None
     current_sheet: Optional[str] = None
@@ -33,11 +43,46 @@ class TaskStatusResponse(BaseModel):
     error: Optional[str] = None
 
 
+class TaskStatusSummary(BaseModel):
+    """Compact task status for batch lookups (no result manifest)."""
+
+    status: Literal["PENDING", "STARTED", "PROGRESS", "SUCCESS", "FAILURE"]
+    progress: int = Field(default=0, ge=0, le=100)
+    current_sheet: Optional[str] = None
+    error: Optional[str] = None
+
+
+class TaskStatusBatchResponse(BaseModel):
+    """Response for batch task status polling."""
+
+    tasks: Dict[str, TaskStatusSummary]
+
+
 class SheetResult(BaseModel):
     """Result for a single sheet conversion."""
 
+    sheet_name: str
+    content: Optional[str] = None
+    row_count: int
+    column_count: int
+    file: Optional[str] = None
+    size: Optional[int] = None
+    sha256: Optional[str] = None
+    offset: int = 0
+    has_more: bool = False
+
+
+class SheetPageResponse(BaseModel):
+    """A window of lines of one converted sheet."""
+
+    task_id: str
     sheet_name: str
     content: str
+    offset: int
+    limit: int
+    has_more: bool
+    next_offset: Optional[int] = None
+    line_count: Optional[int] = None
     row_count: int
     column_count: int
 
@@ -53,6 +98,27 @@ class ConversionResultResponse(BaseModel):
     has_zip: bool = False
 
 
+class SheetInfoResponse(BaseModel):
+    """Declared size of a single sheet."""
+
+    name: str
+    index: int
+    dimension: Optional[str] = None
+    row_count: Optional[int] = None
+    column_count: Optional[int] = None
+    estimated_cells: Optional[int] = None
+
+
+class WorkbookInfoResponse(BaseModel):
+    """Workbook metadata returned by the inspect endpoint."""
+
+    filename: str
+    format: str
+    sheets: List[SheetInfoResponse]
+    total_sheets: int
+    estimated_cells: int
+
+
 class ErrorResponse(BaseModel):
     """Error response schema."""
 
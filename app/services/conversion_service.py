@@ -1,17 +1,45 @@
 """Conversion orchestration service."""
 
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
+import redis.asyncio as aioredis
 from celery.result import AsyncResult
 from loguru import logger
 
 from app.celery_app import celery_app
-from app.core.exceptions import TaskNotFoundError
-from app.tasks.conversion_tasks import convert_to_markdown, convert_to_json
+from app.config import settings
+from app.core.excel_reader import inspect_workbook
+from app.core.exceptions import (
+    ConversionError,
+    Excel2MarkdownError,
+    FileTooLargeError,
+    TaskNotFoundError,
+)
+from app.services.result_cache import result_cache
+from app.tasks.conversion_tasks import (
+    convert_to_json,
+    convert_to_markdown,
+    run_conversion,
+)
 
 
 class ConversionService:
-    """Service for managing conversion tasks."""
+    """
+    Service for managing conversion tasks.
+
+    Status lookups come in two flavours: the synchronous ones go through
+    Celery's AsyncResult and suit worker threads; the ``*_async`` ones read
+    the task meta from the Redis result backend with an async client, so
+    async routes never block the event loop. The async client draws from a
+    bounded connection pool (REDIS_POOL_SIZE); callers beyond it wait for
+    a free connection instead of opening more.
+    """
+
+    def __init__(self, redis_url: str, pool_size: int):
+        self.redis_url = redis_url
+        self.pool_size = pool_size
+        self._redis: Optional[aioredis.Redis] = None
 
     def start_markdown_conversion(
         self,
@@ -19,23 +47,46 @@ class ConversionService:
         original_filename: str,
         task_id: str,
         use_headers: bool = True,
+        sheets: Optional[List[str]] = None,
+        sheet_indices: Optional[List[int]] = None,
+        cell_range: Optional[str] = None,
+        file_hash: Optional[str] = None,
     ) -> str:
         """
         Start a markdown conversion task.
 
+        When the result cache holds the same file converted with the same
+        options, the task is completed immediately from the cache.
+
         Args:
             file_path: Path to the uploaded file.
             original_filename: Original filename.
             task_id: Pre-generated task ID.
             use_headers: Whether to treat first row as headers.
+            sheets: Optional sheet names to convert (default: all).
+            sheet_indices: Optional 0-based sheet positions to convert.
+            cell_range: Optional A1-style range applied to every sheet.
+            file_hash: Optional SHA-256 of the upload, enables the result cache.
 
         Returns:
             Task ID.
         """
+        cache_key = self._cache_key(
+            file_hash, "markdown", use_headers, sheets, sheet_indices, cell_range
+        )
+        if self._complete_from_cache(cache_key, task_id, original_filename):
+            return task_id
+
         logger.info("Starting markdown conversion task: {}", task_id)
 
         convert_to_markdown.apply_async(
             args=[file_path, original_filename, use_headers],
+            kwargs={
+                "sheets": sheets,
+                "sheet_indices": sheet_indices,
+                "cell_range": cell_range,
+                "cache_key": cache_key,
+            },
             task_id=task_id,
         )
 
@@ -47,28 +98,208 @@ class ConversionService:
         original_filename: str,
         task_id: str,
         use_headers: bool = True,
+        sheets: Optional[List[str]] = None,
+        sheet_indices: Optional[List[int]] = None,
+        cell_range: Optional[str] = None,
+        json_format: str = "json",
+        file_hash: Optional[str] = None,
     ) -> str:
         """
         Start a JSON conversion task.
 
+        When the result cache holds the same file converted with the same
+        options, the task is completed immediately from the cache.
+
         Args:
             file_path: Path to the uploaded file.
             original_filename: Original filename.
             task_id: Pre-generated task ID.
             use_headers: Whether to treat first row as headers.
+            sheets: Optional sheet names to convert (default: all).
+            sheet_indices: Optional 0-based sheet positions to convert.
+            cell_range: Optional A1-style range applied to every sheet.
+            json_format: "json" (pretty-printed array) or "ndjson".
+            file_hash: Optional SHA-256 of the upload, enables the result cache.
 
         Returns:
             Task ID.
         """
+        cache_key = self._cache_key(
+            file_hash, json_format, use_headers, sheets, sheet_indices, cell_range
+        )
+        if self._complete_from_cache(cache_key, task_id, original_filename):
+            return task_id
+
         logger.info("Starting JSON conversion task: {}", task_id)
 
         convert_to_json.apply_async(
             args=[file_path, original_filename, use_headers],
+            kwargs={
+                "sheets": sheets,
+                "sheet_indices": sheet_indices,
+                "cell_range": cell_range,
+                "json_format": json_format,
+                "cache_key": cache_key,
+            },
             task_id=task_id,
         )
 
         return task_id
 
+    def should_convert_inline(self, file_path: str, mode: str) -> bool:
+        """
+        Decide whether a conversion runs in the API process.
+
+        Both "sync" and "auto" are held to the sync budget
+        (SYNC_MAX_FILE_KB, SYNC_MAX_CELLS). Inspecting the workbook reads
+        it, so async callers should run this in a thread pool.
+
+        Args:
+            file_path: Path to the uploaded file.
+            mode: "sync" (inline, rejected over the budget), "async"
+                (always a worker task) or "auto" (inline when the file is
+                within the budget, a worker task otherwise).
+
+        Returns:
+            True if the conversion should run inline.
+
+        Raises:
+            FileTooLargeError: If mode is "sync" and the file is over budget.
+        """
+        if mode == "async":
+            return False
+
+        path = Path(file_path)
+        if path.stat().st_size > settings.sync_max_file_kb * 1024:
+            return self._over_sync_budget(
+                mode, f"File exceeds the {settings.sync_max_file_kb} KB sync limit"
+            )
+        try:
+            with open(path, "rb") as f:
+                cells = inspect_workbook(f, path.name)["estimated_cells"]
+        except Exception:
+            # Unreadable files are not inlined in auto mode: let the worker
+            # report the error as usual. A sync conversion reports it itself.
+            return mode == "sync"
+        # Sheets without declared dimensions count as 0 cells; the size
+        # limit still applies to them
+        if cells > settings.sync_max_cells:
+            return self._over_sync_budget(
+                mode,
+                f"Workbook has about {cells} cells, over the "
+                f"{settings.sync_max_cells} cell sync limit",
+            )
+        return True
+
+    @staticmethod
+    def _over_sync_budget(mode: str, reason: str) -> bool:
+        """Queue an over-budget file in auto mode, reject it in sync mode."""
+        if mode == "sync":
+            raise FileTooLargeError(f"{reason}; use mode=async or mode=auto")
+        return False
+
+    def convert_inline(
+        self,
+        file_path: str,
+        original_filename: str,
+        task_id: str,
+        output_format: str = "markdown",
+        use_headers: bool = True,
+        sheets: Optional[List[str]] = None,
+        sheet_indices: Optional[List[int]] = None,
+        cell_range: Optional[str] = None,
+        file_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Convert a file in the calling thread instead of a worker task.
+
+        The result is stored as the result of ``task_id``, so status,
+        result and download endpoints work as for queued conversions.
+
+        Args:
+            file_path: Path to the uploaded file.
+            original_filename: Original filename.
+            task_id: Pre-generated task ID.
+            output_format: Output format (markdown, json or ndjson).
+            use_headers: Whether to treat first row as headers.
+            sheets: Optional sheet names to convert (default: all).
+            sheet_indices: Optional 0-based sheet positions to convert.
+            cell_range: Optional A1-style range applied to every sheet.
+            file_hash: Optional SHA-256 of the upload, enables the result cache.
+
+        Returns:
+            Conversion result.
+
+        Raises:
+            Excel2MarkdownError: If the file cannot be converted. The task
+                is marked as failed first; unexpected errors are raised as
+                ConversionError.
+        """
+        cache_key = self._cache_key(
+            file_hash, output_format, use_headers, sheets, sheet_indices, cell_range
+        )
+        result = None
+        if cache_key is not None:
+            result = result_cache.restore(cache_key, task_id, original_filename)
+
+        if result is None:
+            logger.info("Converting {} inline for task {}", original_filename, task_id)
+            try:
+                result = run_conversion(
+                    file_path,
+                    original_filename,
+                    task_id,
+                    output_format,
+                    use_headers,
+                    sheets=sheets,
+                    sheet_indices=sheet_indices,
+                    cell_range=cell_range,
+                    cache_key=cache_key,
+                )
+            except Excel2MarkdownError as e:
+                celery_app.backend.mark_as_failure(task_id, e)
+                raise
+            except Exception as e:
+                logger.exception("Inline conversion failed for task {}", task_id)
+                celery_app.backend.mark_as_failure(task_id, e)
+                raise ConversionError(f"Conversion failed: {e}") from e
+
+        celery_app.backend.store_result(task_id, result, "SUCCESS")
+        return result
+
+    @staticmethod
+    def _cache_key(
+        file_hash: Optional[str],
+        output_format: str,
+        use_headers: bool,
+        sheets: Optional[List[str]],
+        sheet_indices: Optional[List[int]],
+        cell_range: Optional[str],
+    ) -> Optional[str]:
+        """Return the result cache key, or None if caching does not apply."""
+        if not file_hash or not settings.result_cache_enabled:
+            return None
+        return result_cache.make_key(
+            file_hash, output_format, use_headers, sheets, sheet_indices, cell_range
+        )
+
+    @staticmethod
+    def _complete_from_cache(
+        cache_key: Optional[str],
+        task_id: str,
+        original_filename: str,
+    ) -> bool:
+        """Store a cached result as the task's result; False on a miss."""
+        if cache_key is None:
+            return False
+
+        result = result_cache.restore(cache_key, task_id, original_filename)
+        if result is None:
+            return False
+
+        celery_app.backend.store_result(task_id, result, "SUCCESS")
+        return True
+
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """
         Get the current status of a conversion task.
@@ -80,10 +311,69 @@ class ConversionService:
             Dictionary with task status information.
         """
         result = AsyncResult(task_id, app=celery_app)
+        return self.status_from_meta(
+            task_id, {"status": result.status, "result": result.result}
+        )
+
+    async def get_task_status_async(self, task_id: str) -> Dict[str, Any]:
+        """
+        Get the current status of a conversion task without blocking.
+
+        Args:
+            task_id: The task ID to check.
+
+        Returns:
+            Dictionary with task status information.
+        """
+        meta = await self._get_task_meta_async(task_id)
+        return self.status_from_meta(task_id, meta)
+
+    async def get_task_statuses_async(
+        self, task_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the current status of many tasks in one Redis round trip.
+
+        Args:
+            task_ids: The task IDs to check (duplicates are looked up once).
+
+        Returns:
+            Task status information by task ID, in request order.
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        if not task_ids:
+            return {}
+
+        backend = celery_app.backend
+        keys = [backend.get_key_for_task(task_id) for task_id in task_ids]
+        stored = await self._async_client().mget(keys)
+        return {
+            task_id: self.status_from_meta(
+                task_id,
+                backend.decode_result(value) if value else {"status": "PENDING"},
+            )
+            for task_id, value in zip(task_ids, stored)
+        }
+
+    @staticmethod
+    def status_from_meta(task_id: str, meta: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build task status information from result backend task meta.
+
+        Args:
+            task_id: The task ID.
+            meta: Decoded task meta with "status" and "result" (progress
+                info, task result or exception, depending on the status).
+
+        Returns:
+            Dictionary with task status information.
+        """
+        state = meta.get("status", "PENDING")
+        payload = meta.get("result")
 
         status_info = {
             "task_id": task_id,
-            "status": result.status,
+            "status": state,
             "progress": 0,
             "message": None,
             "current_sheet": None,
@@ -92,24 +382,27 @@ class ConversionService:
             "error": None,
         }
 
-        if result.status == "PENDING":
+        if state == "PENDING":
             status_info["message"] = "Task is pending"
 
-        elif result.status == "PROGRESS":
-            info = result.info or {}
+        elif state == "STARTED":
+            status_info["message"] = "Task started"
+
+        elif state == "PROGRESS":
+            info = payload or {}
             status_info["progress"] = info.get("progress", 0)
             status_info["message"] = info.get("message", "Processing")
             status_info["current_sheet"] = info.get("current_sheet")
             status_info["total_sheets"] = info.get("total_sheets", 0)
 
-        elif result.status == "SUCCESS":
+        elif state == "SUCCESS":
             status_info["progress"] = 100
             status_info["message"] = "Conversion completed"
-            status_info["result"] = result.result
+            status_info["result"] = payload
 
-        elif result.status == "FAILURE":
+        elif state == "FAILURE":
             status_info["message"] = "Conversion failed"
-            status_info["error"] = str(result.result) if result.result else "Unknown error"
+            status_info["error"] = str(payload) if payload else "Unknown error"
 
         return status_info
 
@@ -135,5 +428,51 @@ class ConversionService:
         else:
             return None
 
+    async def get_task_result_async(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the result of a completed task without blocking.
+
+        Args:
+            task_id: The task ID.
+
+        Returns:
+            Task result if completed, None otherwise.
+
+        Raises:
+            TaskNotFoundError: If task result is not available.
+        """
+        meta = await self._get_task_meta_async(task_id)
+
+        if meta["status"] == "SUCCESS":
+            return meta["result"]
+        elif meta["status"] == "FAILURE":
+            raise TaskNotFoundError(f"Task {task_id} failed: {meta['result']}")
+        else:
+            return None
+
+    async def close(self) -> None:
+        """Release the connections of the async Redis client."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def _get_task_meta_async(self, task_id: str) -> Dict[str, Any]:
+        """Read and decode a task's meta from the Redis result backend."""
+        backend = celery_app.backend
+        stored = await self._async_client().get(backend.get_key_for_task(task_id))
+        if not stored:
+            return {"status": "PENDING", "result": None}
+        return backend.decode_result(stored)
+
+    def _async_client(self) -> aioredis.Redis:
+        if self._redis is None:
+            pool = aioredis.BlockingConnectionPool.from_url(
+                self.redis_url, max_connections=self.pool_size
+            )
+            self._redis = aioredis.Redis.from_pool(pool)
+        return self._redis
+
 
-conversion_service = ConversionService()
+conversion_service = ConversionService(
+    settings.celery_result_backend, settings.redis_pool_size
+)
@@ -1,14 +1,28 @@
 """File upload and download handling service."""
 
+import hashlib
+import os
+import tempfile
 import uuid
+from itertools import islice
 from pathlib import Path
-from typing import BinaryIO, Tuple
+from typing import BinaryIO, Dict, Optional, Tuple
 
 from fastapi import UploadFile
 from loguru import logger
+from starlette.concurrency import run_in_threadpool
 
 from app.config import settings
+from app.core.compression import ENCODING_SUFFIXES, compressed_path
 from app.core.exceptions import FileTooLargeError, InvalidFileFormatError
+from app.core.line_index import read_line_window
+from app.services.metrics import UPLOAD_BYTES
+
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Upper bound of the sheet preview embedded in the result page
+PREVIEW_MAX_CHARS = 64 * 1024
 
 
 class FileHandler:
@@ -51,16 +65,25 @@ class FileHandler:
         self,
         file: UploadFile,
         task_id: str,
-    ) -> Tuple[Path, str]:
+    ) -> Tuple[Path, str, str]:
         """
         Save uploaded file to storage.
 
+        The upload is copied in chunks to a temporary file next to its
+        final location, so it is never held in memory as a whole. The size
+        limit is enforced while copying, and the file only appears under
+        its final name once complete.
+
         Args:
             file: The uploaded file.
             task_id: Task ID to associate with the file.
 
         Returns:
-            Tuple of (file_path, original_filename).
+            Tuple of (file_path, original_filename, sha256 hex digest).
+
+        Raises:
+            InvalidFileFormatError: If the filename is missing.
+            FileTooLargeError: If the upload exceeds the size limit.
         """
         if not file.filename:
             raise InvalidFileFormatError("Filename is required")
@@ -71,18 +94,29 @@ class FileHandler:
 
         # Save file with original name
         file_path = upload_dir / file.filename
-        content = await file.read()
-
-        # Additional size check after reading
-        if len(content) > settings.max_file_size_bytes:
-            raise FileTooLargeError(
-                f"File size exceeds maximum allowed size of {settings.max_file_size_mb}MB"
-            )
-
-        file_path.write_bytes(content)
-        logger.info("Saved uploaded file: {}", file_path)
-
-        return file_path, file.filename
+        digest = hashlib.sha256()
+        size = 0
+
+        fd, temp_name = tempfile.mkstemp(dir=upload_dir, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > settings.max_file_size_bytes:
+                        raise FileTooLargeError(
+                            f"File size exceeds maximum allowed size of {settings.max_file_size_mb}MB"
+                        )
+                    digest.update(chunk)
+                    await run_in_threadpool(out.write, chunk)
+            os.replace(temp_name, file_path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+        logger.info("Saved uploaded file: {} ({} bytes)", file_path, size)
+        UPLOAD_BYTES.observe(size)
+
+        return file_path, file.filename, digest.hexdigest()
 
     def get_result_file(self, task_id: str, filename: str) -> Path:
         """
@@ -103,6 +137,111 @@ class FileHandler:
             raise FileNotFoundError(f"Result file not found: {filename}")
         return file_path
 
+    def read_result_text(
+        self,
+        task_id: str,
+        filename: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[str, bool]:
+        """
+        Read a result file from storage, optionally a window of its lines.
+
+        Args:
+            task_id: Task ID.
+            filename: Name of the result file.
+            offset: Number of lines to skip.
+            limit: Maximum number of lines to return (default: all).
+
+        Returns:
+            Tuple of (text, has_more) where has_more tells whether lines
+            remain after the returned window.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+        """
+        if not offset and limit is None:
+            file_path = self.get_result_file(task_id, filename)
+            return file_path.read_text(encoding="utf-8"), False
+
+        text, has_more, _ = self.read_result_window(task_id, filename, offset, limit)
+        return text, has_more
+
+    def read_result_preview(
+        self, task_id: str, filename: str
+    ) -> Tuple[str, int, bool, bool]:
+        """
+        Read the preview of a result file shown on the result page.
+
+        The preview holds the first PREVIEW_LINES lines, cut to whole lines
+        within PREVIEW_MAX_CHARS so it ends where "load more" starts. A
+        first line longer than the bound is shown truncated and counts as
+        zero lines, so "load more" fetches it again in full.
+
+        Args:
+            task_id: Task ID.
+            filename: Name of the result file.
+
+        Returns:
+            Tuple of (text, line_count, has_more, truncated) where
+            line_count is the number of whole lines in the preview and
+            truncated tells that text is only the start of the first line.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+        """
+        text, has_more, _ = self.read_result_window(
+            task_id, filename, 0, settings.preview_lines
+        )
+        if len(text) > PREVIEW_MAX_CHARS:
+            end = text.rfind("\n", 0, PREVIEW_MAX_CHARS) + 1
+            if end:
+                # Only whole lines; the dropped ones are loaded on demand
+                text, has_more = text[:end], True
+            else:
+                # The first line alone exceeds the bound
+                return text[:PREVIEW_MAX_CHARS], 0, True, True
+        lines = text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+        return text, lines, has_more, False
+
+    def read_result_window(
+        self,
+        task_id: str,
+        filename: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[str, bool, Optional[int]]:
+        """
+        Read a window of lines of a result file.
+
+        Files with a line index (written during conversion) are read with
+        a single seek; older results are scanned up to the window.
+
+        Args:
+            task_id: Task ID.
+            filename: Name of the result file.
+            offset: Number of lines to skip.
+            limit: Maximum number of lines to return (default: all).
+
+        Returns:
+            Tuple of (text, has_more, line_count); line_count is None for
+            files without an index.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+        """
+        file_path = self.get_result_file(task_id, filename)
+
+        window = read_line_window(file_path, offset, limit)
+        if window is not None:
+            return window
+
+        with open(file_path, encoding="utf-8", newline="") as f:
+            lines = islice(f, offset, None if limit is None else offset + limit)
+            text = "".join(lines)
+            has_more = limit is not None and f.readline() != ""
+        return text, has_more, None
+
     def get_result_zip(self, task_id: str) -> Path:
         """
         Get path to the ZIP archive for a task.
@@ -136,10 +275,86 @@ class FileHandler:
             return []
         return [f.name for f in result_dir.iterdir() if f.is_file()]
 
+    @staticmethod
+    def negotiate_encoding(path: Path, accept_encoding: Optional[str]) -> Optional[str]:
+        """
+        Pick the pre-compressed copy of a result file to serve.
+
+        Args:
+            path: Uncompressed result file.
+            accept_encoding: Accept-Encoding request header.
+
+        Returns:
+            The accepted content encoding with a compressed copy on disk
+            (brotli before gzip at equal quality), or None to serve the
+            file as is.
+        """
+        accepted = _parse_accept_encoding(accept_encoding or "")
+        chosen, chosen_quality = None, 0.0
+        for encoding in ENCODING_SUFFIXES:
+            quality = accepted.get(encoding, accepted.get("*", 0.0))
+            if quality > chosen_quality and compressed_path(path, encoding).is_file():
+                chosen, chosen_quality = encoding, quality
+        return chosen
+
+    @staticmethod
+    def make_etag(
+        path: Path,
+        digest: Optional[str] = None,
+        encoding: Optional[str] = None,
+    ) -> str:
+        """
+        Build the strong ETag of a result file as served.
+
+        Args:
+            path: Uncompressed result file.
+            digest: SHA-256 of the content from the result manifest; the
+                file's mtime and size are used when unknown.
+            encoding: Content encoding the file is served with.
+
+        Returns:
+            Quoted ETag, distinct for every encoding of the same content.
+        """
+        if digest:
+            tag = digest[:32]
+        else:
+            stat = path.stat()
+            tag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        return f'"{tag}-{encoding}"' if encoding else f'"{tag}"'
+
+    @staticmethod
+    def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """Whether an If-None-Match header matches an ETag (weak comparison)."""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or any(
+            tag[2:] == etag if tag.startswith("W/") else tag == etag for tag in tags
+        )
+
     @staticmethod
     def generate_task_id() -> str:
         """Generate a unique task ID."""
         return str(uuid.uuid4())
 
 
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into quality values by coding."""
+    accepted: Dict[str, float] = {}
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip().lower()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
 file_handler = FileHandler()
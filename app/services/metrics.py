@@ -0,0 +1,225 @@
+"""Prometheus metrics of the API and the conversion workers.
+
+Metrics are module-level objects updated where the work happens. With
+PROMETHEUS_MULTIPROC_DIR set, prometheus_client keeps their values in
+per-process files in that directory, so every uvicorn worker and every
+prefork Celery child reports into the same place. Expose them with
+``collect_metrics`` (API ``/metrics``) or ``start_worker_server``.
+"""
+
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, TextIO, Union
+
+import redis
+from loguru import logger
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from app.config import settings
+from app.services.result_cache import result_cache
+
+# The directory must exist before the first metric value is created
+if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+REQUEST_SECONDS = Histogram(
+    "excel2md_http_request_duration_seconds",
+    "Latency of HTTP requests by route.",
+    ["method", "route", "status"],
+)
+UPLOAD_BYTES = Histogram(
+    "excel2md_upload_bytes",
+    "Size of uploaded Excel files.",
+    buckets=[2**exponent for exponent in range(10, 27, 2)],
+)
+TASK_SECONDS = Histogram(
+    "excel2md_task_duration_seconds",
+    "Duration of Celery tasks.",
+    ["task", "state"],
+    buckets=[0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600],
+)
+STAGE_SECONDS = Histogram(
+    "excel2md_conversion_stage_seconds",
+    "Time spent per conversion stage (read, render, write, zip, compress).",
+    ["stage"],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300],
+)
+CELLS_PER_SECOND = Histogram(
+    "excel2md_conversion_cells_per_second",
+    "Conversion throughput per sheet.",
+    ["format"],
+    buckets=[10**exponent for exponent in range(2, 8)],
+)
+RESULT_BYTES = Histogram(
+    "excel2md_result_file_bytes",
+    "Size of converted sheet files.",
+    ["format"],
+    buckets=[2**exponent for exponent in range(10, 31, 2)],
+)
+WORKER_RSS_BYTES = Gauge(
+    "excel2md_worker_resident_memory_bytes",
+    "Resident memory of worker processes, updated after each task.",
+    multiprocess_mode="liveall",
+)
+
+
+class StageTimer:
+    """
+    Accumulate the time a conversion spends in each stage.
+
+    Reading, rendering and writing are interleaved while a sheet streams
+    from the reader to its output, so the stages are timed from the
+    inside: rows are timed as they are pulled from the reader, writes as
+    they reach the file or the ZIP archive, and rendering is the rest.
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = defaultdict(float)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block of code as part of stage ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - start
+
+    def timed_rows(self, rows: Iterable[Any], name: str = "read") -> Iterator[Any]:
+        """Yield from ``rows``, timing each step as stage ``name``."""
+        iterator = iter(rows)
+        while True:
+            start = time.perf_counter()
+            try:
+                row = next(iterator)
+            except StopIteration:
+                self.seconds[name] += time.perf_counter() - start
+                return
+            self.seconds[name] += time.perf_counter() - start
+            yield row
+
+    def timed_writer(self, fp: Union[TextIO, BinaryIO], name: str) -> "_TimedWriter":
+        """Wrap a stream so its writes are timed as stage ``name``."""
+        return _TimedWriter(fp, self, name)
+
+    def observe(self, total: Optional[float] = None) -> None:
+        """
+        Record the stage times in STAGE_SECONDS.
+
+        Args:
+            total: Wall time of the timed work; the part not spent in any
+                other stage is recorded as "render".
+        """
+        if total is not None:
+            measured = sum(self.seconds.values())
+            self.seconds["render"] += max(total - measured, 0.0)
+        for name, seconds in self.seconds.items():
+            STAGE_SECONDS.labels(name).observe(seconds)
+
+
+class _TimedWriter:
+    def __init__(self, fp: Union[TextIO, BinaryIO], timer: StageTimer, name: str):
+        self.fp = fp
+        self.timer = timer
+        self.name = name
+
+    def write(self, data: Any) -> int:
+        start = time.perf_counter()
+        try:
+            return self.fp.write(data)
+        finally:
+            self.timer.seconds[self.name] += time.perf_counter() - start
+
+
+def record_worker_rss() -> None:
+    """Update WORKER_RSS_BYTES with the resident memory of this process."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        # Not on Linux: no cheap way to read the current RSS
+        return
+    WORKER_RSS_BYTES.set(pages * os.sysconf("SC_PAGE_SIZE"))
+
+
+class _BackendCollector:
+    """Metrics read from Redis at scrape time: queue depth and cache counters."""
+
+    def __init__(self, broker_url: str, queue: str):
+        self.broker_url = broker_url
+        self.queue = queue
+        self._redis: Optional[redis.Redis] = None
+
+    def collect(self) -> Iterator[Any]:
+        try:
+            depth = self._client().llen(self.queue)
+        except redis.RedisError as e:
+            logger.warning("Cannot read queue depth: {}", e)
+        else:
+            queue_depth = GaugeMetricFamily(
+                "excel2md_queue_depth",
+                "Conversion tasks waiting in the broker queue.",
+                labels=["queue"],
+            )
+            queue_depth.add_metric([self.queue], depth)
+            yield queue_depth
+
+        stats = result_cache.stats()
+        lookups = CounterMetricFamily(
+            "excel2md_result_cache_lookups",
+            "Result cache lookups by entry kind and outcome.",
+            labels=["kind", "outcome"],
+        )
+        lookups.add_metric(["workbook", "hit"], stats["hits"])
+        lookups.add_metric(["workbook", "miss"], stats["misses"])
+        lookups.add_metric(["sheet", "hit"], stats["sheet_hits"])
+        lookups.add_metric(["sheet", "miss"], stats["sheet_misses"])
+        yield lookups
+
+    def _client(self) -> redis.Redis:
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(self.broker_url)
+        return self._redis
+
+
+def _registry() -> CollectorRegistry:
+    """Registry of this process's metrics, or of all processes' ones."""
+    registry = CollectorRegistry()
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry.register(REGISTRY)
+    return registry
+
+
+_backend_collector = _BackendCollector(settings.celery_broker_url, "celery")
+
+
+def collect_metrics() -> bytes:
+    """Render the API's metrics, including queue depth and cache counters."""
+    registry = _registry()
+    registry.register(_backend_collector)
+    return generate_latest(registry)
+
+
+def start_worker_server(port: int) -> None:
+    """Serve the metrics of all worker processes on ``port``."""
+    start_http_server(port, registry=_registry())
+    logger.info("Serving worker metrics on port {}", port)
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop the live-only values of an exited process (multiprocess mode)."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,339 @@
+"""Content-addressed cache of conversion results."""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import redis
+from loguru import logger
+
+from app.config import settings
+
+# Bump when the output of the converters changes, so stale entries miss
+CACHE_VERSION = 1
+
+MANIFEST_NAME = "manifest.json"
+
+# Stores between directory scans only add to a size estimate; other
+# processes' stores are picked up by a scan at least this often
+EVICT_INTERVAL_SECONDS = 60.0
+
+
+class ResultCache:
+    """
+    Cache of converted result files keyed by upload hash and options.
+
+    Whole conversions are keyed by the upload hash; single sheets are keyed
+    by the sheet fingerprint, so an unchanged sheet of an edited workbook
+    is reused. Each entry is a directory under ``cache_dir`` holding the
+    output files of one conversion or sheet (hard-linked, so no extra disk
+    is used while the original task's results exist) and a manifest with
+    the task result. The manifest's mtime records the last use: entries
+    are evicted least recently used first once the cache exceeds
+    ``max_bytes``. Stores do not scan the cache directory each time: the
+    size found by the last scan plus the entries this process stored since
+    is checked against the limit, and a scan runs when it is exceeded or
+    EVICT_INTERVAL_SECONDS have passed. Hit and miss counters are kept in
+    Redis so they are shared by all processes.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int, redis_url: str):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.redis_url = redis_url
+        self._redis: Optional[redis.Redis] = None
+        # Cache size as of the last scan plus this process's stores since
+        self._estimated_bytes: Optional[int] = None
+        self._last_scan = 0.0
+
+    @staticmethod
+    def make_key(
+        file_hash: str,
+        output_format: str,
+        use_headers: bool = True,
+        sheets: Optional[List[str]] = None,
+        sheet_indices: Optional[List[int]] = None,
+        cell_range: Optional[str] = None,
+    ) -> str:
+        """
+        Build the cache key of a conversion.
+
+        Args:
+            file_hash: SHA-256 hex digest of the uploaded file.
+            output_format: Output format (markdown, json or ndjson).
+            use_headers: Whether the first row is treated as headers.
+            sheets: Selected sheet names.
+            sheet_indices: Selected 0-based sheet positions.
+            cell_range: A1-style cell range.
+
+        Returns:
+            Hex digest identifying the conversion.
+        """
+        options = {
+            "version": CACHE_VERSION,
+            "file": file_hash,
+            "output_format": output_format,
+            "use_headers": use_headers,
+            # Sheets are always converted in workbook order
+            "sheets": sorted(set(sheets or [])),
+            "sheet_indices": sorted(set(sheet_indices or [])),
+            "cell_range": cell_range.upper() if cell_range else None,
+            "xlsx_engine": settings.xlsx_engine,
+        }
+        encoded = json.dumps(options, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def restore(
+        self,
+        key: str,
+        task_id: str,
+        original_filename: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Materialize a cached result as the result of a new task.
+
+        Args:
+            key: Cache key from make_key.
+            task_id: ID of the task to satisfy.
+            original_filename: Name of the new upload.
+
+        Returns:
+            Task result for ``task_id``, or None on a cache miss.
+        """
+        entry_dir = self.cache_dir / key
+        manifest_path = entry_dir / MANIFEST_NAME
+
+        try:
+            cached = json.loads(manifest_path.read_text(encoding="utf-8"))
+            result_dir = settings.results_dir / task_id
+            result_dir.mkdir(parents=True, exist_ok=True)
+            for name in cached["files"]:
+                _link_or_copy(entry_dir / name, result_dir / name)
+            os.utime(manifest_path)
+        except (OSError, ValueError, KeyError):
+            self._count("misses")
+            return None
+
+        self._count("hits")
+        logger.info("Result cache hit for task {} ({})", task_id, key[:12])
+
+        result = dict(cached["result"])
+        result.update(
+            task_id=task_id,
+            original_filename=original_filename,
+            result_dir=str(result_dir),
+            zip_path=str(result_dir / "result.zip") if result.get("zip_path") else None,
+        )
+        return result
+
+    def store(self, key: str, result_dir: Path, result: Dict[str, Any]) -> None:
+        """
+        Add the output of a finished conversion to the cache.
+
+        Args:
+            key: Cache key from make_key.
+            result_dir: Directory holding the conversion output files.
+            result: Task result returned by the conversion task.
+        """
+        files = [path for path in result_dir.iterdir() if path.is_file()]
+        self._store_entry(key, files, result)
+
+    @staticmethod
+    def make_sheet_key(
+        fingerprint: str,
+        output_format: str,
+        use_headers: bool = True,
+        cell_range: Optional[str] = None,
+    ) -> str:
+        """
+        Build the cache key of one converted sheet.
+
+        Args:
+            fingerprint: Sheet fingerprint from sheet_fingerprints.
+            output_format: Output format (markdown, json or ndjson).
+            use_headers: Whether the first row is treated as headers.
+            cell_range: A1-style cell range.
+
+        Returns:
+            Hex digest identifying the sheet conversion.
+        """
+        options = {
+            "version": CACHE_VERSION,
+            "sheet": fingerprint,
+            "output_format": output_format,
+            "use_headers": use_headers,
+            "cell_range": cell_range.upper() if cell_range else None,
+            "xlsx_engine": settings.xlsx_engine,
+        }
+        encoded = json.dumps(options, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def restore_sheet(self, key: str, target: Path) -> Optional[Dict[str, Any]]:
+        """
+        Materialize a cached sheet output at ``target``.
+
+        Args:
+            key: Cache key from make_sheet_key.
+            target: Path of the output file to create.
+
+        Returns:
+            Sheet result with ``file`` set to the target name, or None on a
+            cache miss. Companion files stored with the output are restored
+            next to ``target`` with the same suffix.
+        """
+        entry_dir = self.cache_dir / key
+        manifest_path = entry_dir / MANIFEST_NAME
+
+        try:
+            cached = json.loads(manifest_path.read_text(encoding="utf-8"))
+            name, *companions = cached["files"]
+            _link_or_copy(entry_dir / name, target)
+            for companion in companions:
+                suffix = companion[len(name) :]
+                _link_or_copy(
+                    entry_dir / companion, target.with_name(target.name + suffix)
+                )
+            os.utime(manifest_path)
+        except (OSError, ValueError, KeyError):
+            self._count("sheet_misses")
+            return None
+
+        self._count("sheet_hits")
+        return {**cached["result"], "file": target.name}
+
+    def store_sheet(
+        self,
+        key: str,
+        path: Path,
+        sheet_result: Dict[str, Any],
+        companions: Sequence[Path] = (),
+    ) -> None:
+        """
+        Add one converted sheet to the cache.
+
+        Args:
+            key: Cache key from make_sheet_key.
+            path: Output file of the sheet.
+            sheet_result: Sheet entry of the task result.
+            companions: Files derived from the output, named after it with
+                an extra suffix (e.g. its line index).
+        """
+        self._store_entry(key, [path, *companions], sheet_result)
+
+    def _store_entry(self, key: str, files: List[Path], result: Dict[str, Any]) -> None:
+        entry_dir = self.cache_dir / key
+        if (entry_dir / MANIFEST_NAME).exists():
+            return
+
+        temp_dir = self.cache_dir / f".{key}.{os.getpid()}"
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        temp_dir.mkdir(parents=True)
+        try:
+            for path in files:
+                _link_or_copy(path, temp_dir / path.name)
+            (temp_dir / MANIFEST_NAME).write_text(
+                json.dumps(
+                    {"files": [path.name for path in files], "result": result},
+                    ensure_ascii=False,
+                ),
+                encoding="utf-8",
+            )
+            size = sum(path.stat().st_size for path in temp_dir.iterdir())
+            os.replace(temp_dir, entry_dir)
+        except OSError:
+            # Another worker stored the same entry first
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return
+
+        logger.debug("Stored result cache entry {}", key[:12])
+        if self._estimated_bytes is not None:
+            self._estimated_bytes += size
+            if (
+                self._estimated_bytes <= self.max_bytes
+                and time.monotonic() - self._last_scan < EVICT_INTERVAL_SECONDS
+            ):
+                return
+        self.evict()
+
+    def evict(self, max_age_seconds: Optional[float] = None) -> int:
+        """
+        Remove least recently used entries until the cache fits its limit.
+
+        Scans the whole cache directory; the size left is the new base of
+        the estimate checked by stores.
+
+        Args:
+            max_age_seconds: Also remove entries unused for this long.
+
+        Returns:
+            Number of entries removed.
+        """
+        self._last_scan = time.monotonic()
+        if not self.cache_dir.exists():
+            self._estimated_bytes = 0
+            return 0
+
+        entries = []
+        total = 0
+        for entry_dir in self.cache_dir.iterdir():
+            manifest_path = entry_dir / MANIFEST_NAME
+            if not manifest_path.is_file():
+                continue
+            size = sum(path.stat().st_size for path in entry_dir.iterdir())
+            entries.append((manifest_path.stat().st_mtime, size, entry_dir))
+            total += size
+
+        cutoff = time.time() - max_age_seconds if max_age_seconds is not None else None
+        removed = 0
+        for last_used, size, entry_dir in sorted(entries):
+            if total <= self.max_bytes and (cutoff is None or last_used >= cutoff):
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            removed += 1
+
+        self._estimated_bytes = total
+        if removed:
+            logger.info("Evicted {} result cache entries", removed)
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit and miss counters (zero if Redis is unavailable)."""
+        names = ("hits", "misses", "sheet_hits", "sheet_misses")
+        try:
+            values = self._client().mget(*(f"result_cache:{name}" for name in names))
+        except redis.RedisError as e:
+            logger.warning("Cannot read result cache counters: {}", e)
+            values = [None] * len(names)
+        return {name: int(value or 0) for name, value in zip(names, values)}
+
+    def _count(self, name: str) -> None:
+        try:
+            self._client().incr(f"result_cache:{name}")
+        except redis.RedisError as e:
+            logger.warning("Cannot update result cache counter: {}", e)
+
+    def _client(self) -> redis.Redis:
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(self.redis_url)
+        return self._redis
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Hard-link a file, copying it when links are not possible."""
+    target.unlink(missing_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+result_cache = ResultCache(
+    settings.cache_dir,
+    settings.result_cache_max_mb * 1024 * 1024,
+    settings.redis_url,
+)
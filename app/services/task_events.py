@@ -0,0 +1,157 @@
+"""Push-based task status updates from the result backend's pub/sub."""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+import redis.asyncio as aioredis
+from loguru import logger
+from redis.asyncio.client import PubSub
+
+from app.celery_app import celery_app
+from app.config import settings
+from app.services.conversion_service import ConversionService, conversion_service
+
+# States after which a task's status no longer changes
+TERMINAL_STATES = ("SUCCESS", "FAILURE")
+
+
+class TaskEvents:
+    """
+    Stream status changes of conversion tasks.
+
+    Celery's Redis result backend publishes every stored task state
+    (PROGRESS updates from ``update_state``, SUCCESS and FAILURE) on a
+    channel named after the task's meta key. Subscribing to that channel
+    replaces status polling.
+
+    All watchers of the process share one subscriber connection, separate
+    from the status lookup pool: a listener task reads its messages and
+    fans them out to the watchers of each channel, so open event streams
+    never hold pooled connections.
+    """
+
+    def __init__(self, redis_url: str, service: ConversionService):
+        self.redis_url = redis_url
+        self.service = service
+        self._redis: Optional[aioredis.Redis] = None
+        self._pubsub: Optional[PubSub] = None
+        self._listener: Optional["asyncio.Task[None]"] = None
+        self._watchers: Dict[bytes, Set["asyncio.Queue[bytes]"]] = {}
+
+    async def watch(
+        self,
+        task_id: str,
+        heartbeat: float = 15.0,
+        timeout: float = 300.0,
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield the status of a task now and after every change.
+
+        The stream ends after a SUCCESS or FAILURE status, or after
+        ``timeout`` seconds (clients reconnect and get the current status).
+
+        Args:
+            task_id: The task ID to watch.
+            heartbeat: Seconds without a change after which None is yielded,
+                so callers can keep idle connections alive.
+            timeout: Maximum lifetime of the stream in seconds.
+
+        Yields:
+            Task status dictionaries (see ConversionService.get_task_status),
+            or None as a heartbeat.
+        """
+        backend = celery_app.backend
+        channel = backend.get_key_for_task(task_id)
+        queue: "asyncio.Queue[bytes]" = asyncio.Queue()
+        try:
+            # Subscribe before reading the current state so no update is lost
+            await self._add_watcher(channel, queue)
+            status = await self.service.get_task_status_async(task_id)
+            yield status
+
+            deadline = time.monotonic() + timeout
+            while status["status"] not in TERMINAL_STATES:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    data = await asyncio.wait_for(
+                        queue.get(), timeout=min(heartbeat, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                meta = backend.decode_result(data)
+                status = self.service.status_from_meta(task_id, meta)
+                yield status
+        finally:
+            await self._remove_watcher(channel, queue)
+
+    async def close(self) -> None:
+        """Stop the listener and release the subscriber connection."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+        self._watchers.clear()
+
+    async def _add_watcher(self, channel: bytes, queue: "asyncio.Queue[bytes]") -> None:
+        self._watchers.setdefault(channel, set()).add(queue)
+        # SUBSCRIBE is idempotent, so every watcher waits for its own
+        # confirmation instead of tracking subscriptions in flight
+        await self._subscriber().subscribe(channel)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _remove_watcher(
+        self, channel: bytes, queue: "asyncio.Queue[bytes]"
+    ) -> None:
+        watchers = self._watchers.get(channel)
+        if watchers is None:
+            return
+        watchers.discard(queue)
+        if watchers:
+            return
+        del self._watchers[channel]
+        try:
+            await self._subscriber().unsubscribe(channel)
+        except aioredis.RedisError as e:
+            logger.debug("Cannot close task event subscription: {}", e)
+
+    async def _listen(self) -> None:
+        """Forward published task states to the watchers of their channel."""
+        pubsub = self._subscriber()
+        while True:
+            try:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except aioredis.RedisError as e:
+                # The connection resubscribes its channels when it reconnects;
+                # watchers meanwhile send heartbeats
+                logger.warning("Task event subscription failed: {}", e)
+                await asyncio.sleep(1.0)
+                continue
+            if message is None or message["type"] != "message":
+                continue
+            for queue in self._watchers.get(message["channel"], ()):
+                queue.put_nowait(message["data"])
+
+    def _subscriber(self) -> PubSub:
+        if self._pubsub is None:
+            self._redis = aioredis.Redis.from_url(self.redis_url)
+            self._pubsub = self._redis.pubsub()
+        return self._pubsub
+
+
+task_events = TaskEvents(settings.celery_result_backend, conversion_service)
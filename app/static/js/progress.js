@@ -18,6 +18,43 @@
     var maxRetries = 300; // 5 minutes max
     var retryCount = 0;
 
+    function handleStatus(data) {
+        updateProgress(data);
+
+        if (data.status === 'SUCCESS') {
+            // Redirect to result page
+            window.location.href = '/result/' + taskId;
+            return true;
+        }
+        if (data.status === 'FAILURE') {
+            showError(data.error || 'Conversion failed');
+            return true;
+        }
+        return false;
+    }
+
+    function watchEvents() {
+        // Status changes are pushed by the server; polling is the fallback
+        var source = new EventSource('/api/v1/tasks/' + taskId + '/events');
+        var received = false;
+
+        source.onmessage = function(event) {
+            received = true;
+            if (handleStatus(JSON.parse(event.data))) {
+                source.close();
+            }
+        };
+
+        source.onerror = function() {
+            // The browser reconnects by itself after a stream that worked
+            // ended; give up on events if none ever arrived
+            if (!received) {
+                source.close();
+                pollStatus();
+            }
+        };
+    }
+
     function pollStatus() {
         fetch('/api/v1/tasks/' + taskId + '/status')
             .then(function(response) {
@@ -27,14 +64,10 @@
                 return response.json();
             })
             .then(function(data) {
-                updateProgress(data);
-
-                if (data.status === 'SUCCESS') {
-                    // Redirect to result page
-                    window.location.href = '/result/' + taskId;
-                } else if (data.status === 'FAILURE') {
-                    showError(data.error || 'Conversion failed');
-                } else if (retryCount < maxRetries) {
+                if (handleStatus(data)) {
+                    return;
+                }
+                if (retryCount < maxRetries) {
                     // Continue polling
                     retryCount++;
                     setTimeout(pollStatus, pollInterval);
@@ -74,6 +107,10 @@
         errorText.textContent = message;
     }
 
-    // Start polling
-    pollStatus();
+    // Start watching
+    if (window.EventSource) {
+        watchEvents();
+    } else {
+        pollStatus();
+    }
 })();
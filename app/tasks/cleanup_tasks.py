@@ -8,6 +8,7 @@ from loguru import logger
 
 from app.celery_app import celery_app
 from app.config import settings
+from app.services.result_cache import result_cache
 
 
 @celery_app.task(name="app.tasks.cleanup_tasks.cleanup_old_files")
@@ -33,6 +34,7 @@ def cleanup_old_files() -> dict:
     stats = {
         "uploads_removed": 0,
         "results_removed": 0,
+        "cache_entries_removed": 0,
         "errors": [],
     }
 
@@ -69,11 +71,24 @@ def cleanup_old_files() -> dict:
                 logger.error(error_msg)
                 stats["errors"].append(error_msg)
 
+    # Result cache: drop entries unused for the retention period, then
+    # enforce its size limit
+    try:
+        stats["cache_entries_removed"] = result_cache.evict(
+            max_age_seconds=max_age_days * 86400
+        )
+    except Exception as e:
+        error_msg = f"Failed to evict result cache entries: {e}"
+        logger.error(error_msg)
+        stats["errors"].append(error_msg)
+
     total_removed = stats["uploads_removed"] + stats["results_removed"]
     logger.info(
-        "Cleanup completed: {} uploads removed, {} results removed",
+        "Cleanup completed: {} uploads removed, {} results removed, "
+        "{} cache entries removed",
         stats["uploads_removed"],
         stats["results_removed"],
+        stats["cache_entries_removed"],
     )
 
     if stats["errors"]:
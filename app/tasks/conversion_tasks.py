@@ -1,135 +1,704 @@
 """Celery tasks for file conversion."""
 
+import hashlib
+import time
 import zipfile
+from contextlib import ExitStack
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
 
+import redis
+from celery import chord, group
+from celery.exceptions import Ignore
 from loguru import logger
 
 from app.celery_app import celery_app
 from app.config import settings
-from app.core.excel_reader import get_excel_data_from_path
-from app.core.markdown_converter import get_markdown_data
+from app.core.compression import encoding_supported, write_compressed
+from app.core.excel_reader import (
+    inspect_workbook,
+    iter_excel_sheets_from_path,
+    select_sheet_names,
+    sheet_fingerprints,
+)
+from app.core.exceptions import EmptyFileError
+from app.core.json_converter import (
+    JSON_FORMATS,
+    write_json_records,
+    write_ndjson_records,
+)
+from app.core.line_index import LineIndexWriter, index_path
+from app.core.markdown_converter import write_markdown_table
+from app.core.zip_writer import TeeWriter, open_zip
+from app.services.metrics import CELLS_PER_SECOND, RESULT_BYTES, StageTimer
+from app.services.result_cache import result_cache
+
+
+def _file_manifest(path: Path, chunk_size: int = 1024 * 1024) -> Dict[str, Any]:
+    """Return size and SHA-256 checksum of a result file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return {"size": path.stat().st_size, "sha256": digest.hexdigest()}
+
+
+def _store_in_cache(cache_key: str, result_dir: Path, result: Dict[str, Any]) -> None:
+    """Add a finished conversion to the result cache; never fails the task."""
+    try:
+        result_cache.store(cache_key, result_dir, result)
+    except Exception as e:
+        logger.warning("Cannot store result in cache: {}", e)
 
 
-@celery_app.task(bind=True, name="app.tasks.conversion_tasks.convert_to_markdown")
-def convert_to_markdown(
-    self,
+def _selected_sheet_names(
+    file_path: str,
+    sheets: Optional[List[str]] = None,
+    sheet_indices: Optional[List[int]] = None,
+) -> List[str]:
+    """Return the names of the sheets to convert, without reading cells."""
+    path = Path(file_path)
+    with open(path, "rb") as f:
+        info = inspect_workbook(f, path.name)
+    names = [sheet["name"] for sheet in info["sheets"]]
+    return select_sheet_names(names, sheets, sheet_indices)
+
+
+def _sheet_cache_keys(
+    file_path: str,
+    names: List[str],
+    output_format: str,
+    use_headers: bool,
+    cell_range: Optional[str],
+) -> Dict[str, str]:
+    """Return sheet cache keys by name; empty when the cache cannot be used."""
+    if not settings.result_cache_enabled:
+        return {}
+    path = Path(file_path)
+    try:
+        with open(path, "rb") as f:
+            fingerprints = sheet_fingerprints(f, path.name)
+    except Exception as e:
+        logger.warning("Cannot fingerprint sheets of {}: {}", path.name, e)
+        return {}
+    return {
+        name: result_cache.make_sheet_key(
+            fingerprints[name], output_format, use_headers, cell_range
+        )
+        for name in names
+        if name in fingerprints
+    }
+
+
+def _store_sheet_in_cache(key: str, path: Path, sheet_result: Dict[str, Any]) -> None:
+    """Add a converted sheet to the result cache; never fails the task."""
+    try:
+        result_cache.store_sheet(key, path, sheet_result, [index_path(path)])
+    except Exception as e:
+        logger.warning("Cannot store sheet in cache: {}", e)
+
+
+def _precompress(result_dir: Path, results: Dict[str, Dict[str, Any]]) -> None:
+    """Write the pre-compressed copies of sheet outputs set in settings."""
+    encodings = []
+    for encoding in settings.result_precompress:
+        if encoding_supported(encoding):
+            encodings.append(encoding)
+        else:
+            logger.warning(
+                "Cannot pre-compress results as {}: brotli is not installed",
+                encoding,
+            )
+    for sheet_result in results.values():
+        for encoding in encodings:
+            write_compressed(result_dir / sheet_result["file"], encoding)
+
+
+def _timed_sheets(
+    streams: Iterator[Dict[str, Any]],
+) -> Iterator[Tuple[Dict[str, Any], StageTimer, float]]:
+    """
+    Yield each sheet with its stage timer and start time.
+
+    Getting the next sheet from the reader (opening it, skipping to its
+    data) is charged to that sheet as "read".
+    """
+    while True:
+        timer = StageTimer()
+        start = time.perf_counter()
+        with timer.stage("read"):
+            sheet = next(streams, None)
+        if sheet is None:
+            return
+        yield sheet, timer, start
+
+
+def _write_markdown(sheet: Dict[str, Any], fp: TextIO) -> int:
+    return write_markdown_table(
+        sheet["headers"], sheet["rows"], fp, column_count=sheet["column_count"]
+    )
+
+
+def _write_json(sheet: Dict[str, Any], fp: TextIO) -> int:
+    return write_json_records(sheet["headers"], sheet["rows"], fp)
+
+
+def _write_ndjson(sheet: Dict[str, Any], fp: TextIO) -> int:
+    return write_ndjson_records(sheet["headers"], sheet["rows"], fp)
+
+
+# Output format -> (file extension, sheet writer returning the row count)
+OUTPUT_WRITERS: Dict[str, Tuple[str, Callable[[Dict[str, Any], TextIO], int]]] = {
+    "markdown": ("md", _write_markdown),
+    "json": ("json", _write_json),
+    "ndjson": ("ndjson", _write_ndjson),
+}
+
+ProgressCallback = Callable[[int, str, Optional[str], int], None]
+
+# Redis counter of finished sheet subtasks, keyed by the conversion task ID
+_SHEETS_DONE_KEY = "conversion:{}:sheets_done"
+
+_redis: Optional[redis.Redis] = None
+
+
+def _redis_client() -> redis.Redis:
+    global _redis
+    if _redis is None:
+        _redis = redis.Redis.from_url(settings.redis_url)
+    return _redis
+
+
+def _plan_conversion(
+    file_path: str,
+    task_id: str,
+    output_format: str,
+    report_progress: ProgressCallback,
+    use_headers: bool = True,
+    sheets: Optional[List[str]] = None,
+    sheet_indices: Optional[List[int]] = None,
+    cell_range: Optional[str] = None,
+) -> Tuple[List[str], Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """
+    Select the sheets to convert and restore the ones found in the cache.
+
+    Returns:
+        Selected sheet names in workbook order, sheet results restored
+        from the result cache, and sheet cache keys by name.
+    """
+    extension, _ = OUTPUT_WRITERS[output_format]
+
+    report_progress(0, "Reading Excel file", None, 0)
+
+    # Select sheets from workbook metadata only
+    names = _selected_sheet_names(file_path, sheets, sheet_indices)
+    total_sheets = len(names)
+
+    logger.info("Found {} sheets in file", total_sheets)
+    report_progress(10, f"Found {total_sheets} sheet(s)", None, total_sheets)
+
+    # Create results directory for this task
+    result_dir = settings.results_dir / task_id
+    result_dir.mkdir(parents=True, exist_ok=True)
+
+    # Reuse sheets converted before from identical sheet data
+    restored: Dict[str, Dict[str, Any]] = {}
+    sheet_keys = _sheet_cache_keys(
+        file_path, names, output_format, use_headers, cell_range
+    )
+    for name, key in sheet_keys.items():
+        sheet_result = result_cache.restore_sheet(
+            key, result_dir / f"{name}.{extension}"
+        )
+        if sheet_result is not None:
+            restored[name] = sheet_result
+    if restored:
+        logger.info(
+            "Reused {} of {} sheets from cache for task {}",
+            len(restored),
+            total_sheets,
+            task_id,
+        )
+
+    return names, restored, sheet_keys
+
+
+def _convert_sheets(
     file_path: str,
+    task_id: str,
+    output_format: str,
+    names: List[str],
+    sheet_keys: Dict[str, str],
+    use_headers: bool = True,
+    cell_range: Optional[str] = None,
+    on_sheet: Optional[Callable[[str], None]] = None,
+    archive: Optional[zipfile.ZipFile] = None,
+) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """
+    Stream the named sheets straight into their output files.
+
+    Args:
+        file_path: Path to the uploaded Excel file.
+        task_id: ID of the task, names the results directory.
+        output_format: One of OUTPUT_WRITERS.
+        names: Sheets to convert.
+        sheet_keys: Sheet cache keys; converted sheets are cached under them.
+        use_headers: Whether to treat first row as headers.
+        cell_range: Optional A1-style range applied to every sheet.
+        on_sheet: Called with the sheet name before each sheet is converted.
+        archive: Open result ZIP; each output is also written into it as
+            it is produced.
+
+    Returns:
+        Sheet results by name, and the number of sheets holding data.
+    """
+    extension, write_sheet = OUTPUT_WRITERS[output_format]
+    # Markdown has no representation of a sheet without rows
+    skip_empty = output_format == "markdown"
+    result_dir = settings.results_dir / task_id
+
+    results: Dict[str, Dict[str, Any]] = {}
+    found = 0
+    streams = iter_excel_sheets_from_path(
+        file_path,
+        use_headers,
+        xlsx_engine=settings.xlsx_engine,
+        sheets=names,
+        cell_range=cell_range,
+    )
+    try:
+        for sheet, timer, start in _timed_sheets(iter(streams)):
+            sheet_name = sheet["sheetname"]
+            found += 1
+            if on_sheet:
+                on_sheet(sheet_name)
+
+            # Look at the first row so empty sheets are skipped before any
+            # output (or archive entry) is created
+            rows = timer.timed_rows(sheet["rows"])
+            first_row = next(rows, None)
+            if skip_empty and first_row is None:
+                logger.warning("Empty data for sheet {}, skipping", sheet_name)
+                continue
+            if first_row is not None:
+                rows = chain([first_row], rows)
+            sheet = {**sheet, "rows": rows}
+
+            file_path_out = result_dir / f"{sheet_name}.{extension}"
+            with ExitStack() as stack:
+                # Text is encoded once, by the LineIndexWriter below; the
+                # file, the ZIP entry and the index all get its bytes
+                fp = timer.timed_writer(
+                    stack.enter_context(open(file_path_out, "wb")), "write"
+                )
+                if archive is not None:
+                    # The entry size is not known up front: always allow
+                    # entries over 4 GiB
+                    entry = stack.enter_context(
+                        archive.open(file_path_out.name, "w", force_zip64=True)
+                    )
+                    fp = TeeWriter(fp, timer.timed_writer(entry, "zip"))
+                # Line offsets for windowed reads of the result
+                index = stack.enter_context(open(index_path(file_path_out), "wb"))
+                writer = LineIndexWriter(fp, timer.timed_writer(index, "write"))
+                row_count = write_sheet(sheet, writer)
+                writer.finish()
+            elapsed = time.perf_counter() - start
+            timer.observe(elapsed)
+
+            # Only the manifest goes to the result backend; content is
+            # served from storage
+            results[sheet_name] = {
+                "file": file_path_out.name,
+                **_file_manifest(file_path_out),
+                "row_count": row_count,
+                "column_count": sheet["column_count"],
+                "line_count": writer.line_count,
+            }
+            cells = row_count * sheet["column_count"]
+            if elapsed > 0:
+                CELLS_PER_SECOND.labels(output_format).observe(cells / elapsed)
+            RESULT_BYTES.labels(output_format).observe(results[sheet_name]["size"])
+            if sheet_name in sheet_keys:
+                _store_sheet_in_cache(
+                    sheet_keys[sheet_name], file_path_out, results[sheet_name]
+                )
+    except EmptyFileError:
+        # None of the named sheets holds data; the caller decides whether
+        # the workbook as a whole is empty
+        pass
+
+    return results, found
+
+
+def _finish_conversion(
     original_filename: str,
+    task_id: str,
+    names: List[str],
+    results: Dict[str, Dict[str, Any]],
+    report_progress: ProgressCallback,
+    cache_key: Optional[str] = None,
+    archive: Optional[zipfile.ZipFile] = None,
+) -> Dict[str, Any]:
+    """
+    Order sheet results, complete the ZIP and assemble the task result.
+
+    Workbooks with several sheets get a ZIP of all outputs. Sheets already
+    written into ``archive`` are not read again; without an archive it is
+    built from the result files. With ZIP_ON_DOWNLOAD no archive is stored
+    and the download endpoint streams one instead. Pre-compressed copies
+    of the outputs are written last (RESULT_PRECOMPRESS).
+    """
+    result_dir = settings.results_dir / task_id
+    zip_path = result_dir / "result.zip"
+
+    # Keep workbook order whether sheets were reused or converted
+    results = {name: results[name] for name in names if name in results}
+    has_zip = len(results) > 1
+    store_zip = has_zip and not settings.zip_on_download
+    timer = StageTimer()
+
+    if archive is not None:
+        # Sheets restored from the cache were not written into the archive
+        archived = set(archive.namelist())
+        missing = [
+            sheet_result["file"]
+            for sheet_result in results.values()
+            if sheet_result["file"] not in archived
+        ]
+        with timer.stage("zip"):
+            if has_zip and missing:
+                report_progress(95, "Adding sheets to ZIP archive", None, len(names))
+                for file_name in missing:
+                    archive.write(result_dir / file_name, file_name)
+            archive.close()
+        if not has_zip:
+            zip_path.unlink()
+    elif store_zip:
+        report_progress(95, "Creating ZIP archive", None, len(names))
+        with timer.stage("zip"), open_zip(
+            zip_path, settings.zip_compress_level
+        ) as archive:
+            for sheet_result in results.values():
+                file_name = sheet_result["file"]
+                archive.write(result_dir / file_name, file_name)
+
+    if settings.result_precompress:
+        with timer.stage("compress"):
+            _precompress(result_dir, results)
+    timer.observe()
+
+    result = {
+        "status": "success",
+        "task_id": task_id,
+        "original_filename": original_filename,
+        "result_dir": str(result_dir),
+        "sheets": results,
+        "total_sheets": len(results),
+        "has_zip": has_zip,
+        "zip_path": str(zip_path) if store_zip else None,
+    }
+    if cache_key:
+        _store_in_cache(cache_key, result_dir, result)
+
+    return result
+
+
+def _sheet_progress(
+    report_progress: ProgressCallback,
+    done: int,
+    total_sheets: int,
+) -> Callable[[str], None]:
+    """Report each sheet's start as a share of the selected sheets."""
+
+    def on_sheet(sheet_name: str) -> None:
+        nonlocal done
+        progress = 10 + int((done / max(total_sheets, 1)) * 80)
+        report_progress(
+            progress, f"Converting sheet: {sheet_name}", sheet_name, total_sheets
+        )
+        done += 1
+
+    return on_sheet
+
+
+def run_conversion(
+    file_path: str,
+    original_filename: str,
+    task_id: str,
+    output_format: str,
     use_headers: bool = True,
+    sheets: Optional[List[str]] = None,
+    sheet_indices: Optional[List[int]] = None,
+    cell_range: Optional[str] = None,
+    cache_key: Optional[str] = None,
+    report_progress: Optional[ProgressCallback] = None,
 ) -> Dict[str, Any]:
     """
-    Convert Excel file to Markdown format.
+    Convert the selected sheets of a workbook in the calling thread.
+
+    Same pipeline as the conversion tasks (sheet cache, per-sheet files,
+    ZIP, result cache) without a worker, for conversions run inline.
 
     Args:
         file_path: Path to the uploaded Excel file.
         original_filename: Original name of the uploaded file.
+        task_id: ID of the conversion, names the results directory.
+        output_format: One of OUTPUT_WRITERS.
         use_headers: Whether to treat first row as headers.
+        sheets: Optional sheet names to convert (default: all).
+        sheet_indices: Optional 0-based sheet positions to convert.
+        cell_range: Optional A1-style range applied to every sheet.
+        cache_key: Optional result cache key; the output is cached under it.
+        report_progress: Optional callback receiving progress, message,
+            current sheet and total sheet count.
 
     Returns:
         Dictionary with conversion result info.
     """
-    task_id = self.request.id
-    logger.info("Starting markdown conversion for task {}", task_id)
+    report_progress = report_progress or (lambda *args: None)
+    names, restored, sheet_keys = _plan_conversion(
+        file_path,
+        task_id,
+        output_format,
+        report_progress,
+        use_headers,
+        sheets,
+        sheet_indices,
+        cell_range,
+    )
+    return _convert_pending(
+        file_path,
+        original_filename,
+        task_id,
+        output_format,
+        report_progress,
+        names,
+        restored,
+        sheet_keys,
+        use_headers,
+        cell_range,
+        cache_key,
+    )
+
+
+def _convert_pending(
+    file_path: str,
+    original_filename: str,
+    task_id: str,
+    output_format: str,
+    report_progress: ProgressCallback,
+    names: List[str],
+    restored: Dict[str, Dict[str, Any]],
+    sheet_keys: Dict[str, str],
+    use_headers: bool = True,
+    cell_range: Optional[str] = None,
+    cache_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Convert the sheets not restored from the cache, one after another.
 
+    When several sheets are selected, outputs are written into the result
+    ZIP as they are produced (unless ZIP_ON_DOWNLOAD is set).
+    """
+    pending = [name for name in names if name not in restored]
+    archive = None
+    if len(names) > 1 and pending and not settings.zip_on_download:
+        archive = open_zip(
+            settings.results_dir / task_id / "result.zip",
+            settings.zip_compress_level,
+        )
     try:
-        # Update state: starting
-        self.update_state(
-            state="PROGRESS",
-            meta={
-                "progress": 0,
-                "message": "Reading Excel file",
-                "current_sheet": None,
-                "total_sheets": 0,
-            },
+        converted, found = _convert_sheets(
+            file_path,
+            task_id,
+            output_format,
+            pending,
+            sheet_keys,
+            use_headers,
+            cell_range,
+            _sheet_progress(report_progress, len(restored), len(names)),
+            archive,
+        )
+        if not found and not restored:
+            raise EmptyFileError("Excel file contains no data")
+
+        return _finish_conversion(
+            original_filename,
+            task_id,
+            names,
+            {**restored, **converted},
+            report_progress,
+            cache_key,
+            archive,
         )
+    finally:
+        if archive is not None:
+            # Already closed unless the conversion failed
+            archive.close()
+
+
+def _use_sheet_fanout(file_path: str, pending_count: int) -> bool:
+    """Whether to convert sheets in parallel subtasks (see settings)."""
+    if not settings.parallel_sheets_enabled or pending_count < 2:
+        return False
+    min_bytes = settings.parallel_sheets_min_mb * 1024 * 1024
+    return (
+        pending_count >= settings.parallel_sheets_min_count
+        or Path(file_path).stat().st_size >= min_bytes
+    )
+
 
-        # Read Excel data
-        excel_data = get_excel_data_from_path(file_path, use_headers)
-        total_sheets = len(excel_data)
+def _start_conversion(
+    task: Any,
+    file_path: str,
+    original_filename: str,
+    output_format: str,
+    use_headers: bool = True,
+    sheets: Optional[List[str]] = None,
+    sheet_indices: Optional[List[int]] = None,
+    cell_range: Optional[str] = None,
+    cache_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run a conversion task, fanning out to per-sheet subtasks when large.
 
-        logger.info("Found {} sheets in file", total_sheets)
+    Above the parallel thresholds the task is replaced by a chord of one
+    convert_sheet subtask per pending sheet and an assemble_conversion
+    callback, which inherits the task ID, so clients keep polling the
+    same task. Otherwise the sheets are converted in this task.
+    """
+    task_id = task.request.id
+    report_progress = _progress_reporter(task)
+
+    names, restored, sheet_keys = _plan_conversion(
+        file_path,
+        task_id,
+        output_format,
+        report_progress,
+        use_headers,
+        sheets,
+        sheet_indices,
+        cell_range,
+    )
+    pending = [name for name in names if name not in restored]
+
+    if not _use_sheet_fanout(file_path, len(pending)):
+        return _convert_pending(
+            file_path,
+            original_filename,
+            task_id,
+            output_format,
+            report_progress,
+            names,
+            restored,
+            sheet_keys,
+            use_headers,
+            cell_range,
+            cache_key,
+        )
 
-        # Update state: processing
-        self.update_state(
+    logger.info(
+        "Converting {} sheets in parallel subtasks for task {}", len(pending), task_id
+    )
+    report_progress(
+        10 + int((len(restored) / len(names)) * 80),
+        f"Converting {len(pending)} sheet(s) in parallel",
+        None,
+        len(names),
+    )
+    _redis_client().delete(_SHEETS_DONE_KEY.format(task_id))
+
+    header = group(
+        convert_sheet.s(
+            file_path,
+            task_id,
+            output_format,
+            name,
+            use_headers,
+            cell_range,
+            sheet_keys.get(name),
+            len(restored),
+            len(names),
+        )
+        for name in pending
+    )
+    callback = assemble_conversion.s(
+        original_filename, task_id, names, restored, cache_key
+    )
+    return task.replace(chord(header, callback))
+
+
+def _progress_reporter(task: Any) -> ProgressCallback:
+    """Report pipeline progress as the PROGRESS state of a Celery task."""
+
+    def report(
+        progress: int,
+        message: str,
+        current_sheet: Optional[str],
+        total_sheets: int,
+    ) -> None:
+        task.update_state(
             state="PROGRESS",
             meta={
-                "progress": 10,
-                "message": f"Found {total_sheets} sheet(s)",
-                "current_sheet": None,
+                "progress": progress,
+                "message": message,
+                "current_sheet": current_sheet,
                 "total_sheets": total_sheets,
             },
         )
 
-        # Create results directory for this task
-        result_dir = settings.results_dir / task_id
-        result_dir.mkdir(parents=True, exist_ok=True)
+    return report
 
-        # Convert each sheet
-        results = {}
-        for i, sheet in enumerate(excel_data):
-            sheet_name = sheet["sheetname"]
-            progress = 10 + int((i / total_sheets) * 80)
-
-            self.update_state(
-                state="PROGRESS",
-                meta={
-                    "progress": progress,
-                    "message": f"Converting sheet: {sheet_name}",
-                    "current_sheet": sheet_name,
-                    "total_sheets": total_sheets,
-                },
-            )
 
-            # Convert to markdown
-            md_data = get_markdown_data([sheet])
-            if sheet_name in md_data:
-                md_content = md_data[sheet_name]
-                results[sheet_name] = {
-                    "content": md_content,
-                    "row_count": len(sheet["data"]),
-                    "column_count": len(sheet["headers"]) if sheet["headers"] else (
-                        len(sheet["data"][0]) if sheet["data"] else 0
-                    ),
-                }
-
-                # Save individual markdown file
-                md_file_path = result_dir / f"{sheet_name}.md"
-                md_file_path.write_text(md_content, encoding="utf-8")
-
-        # Create ZIP if multiple sheets
-        zip_path = None
-        if len(results) > 1:
-            self.update_state(
-                state="PROGRESS",
-                meta={
-                    "progress": 95,
-                    "message": "Creating ZIP archive",
-                    "current_sheet": None,
-                    "total_sheets": total_sheets,
-                },
-            )
+@celery_app.task(bind=True, name="app.tasks.conversion_tasks.convert_to_markdown")
+def convert_to_markdown(
+    self,
+    file_path: str,
+    original_filename: str,
+    use_headers: bool = True,
+    sheets: Optional[List[str]] = None,
+    sheet_indices: Optional[List[int]] = None,
+    cell_range: Optional[str] = None,
+    cache_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Convert Excel file to Markdown format.
 
-            zip_path = result_dir / "result.zip"
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                for sheet_name in results:
-                    md_file = result_dir / f"{sheet_name}.md"
-                    zf.write(md_file, f"{sheet_name}.md")
+    Args:
+        file_path: Path to the uploaded Excel file.
+        original_filename: Original name of the uploaded file.
+        use_headers: Whether to treat first row as headers.
+        sheets: Optional sheet names to convert (default: all).
+        sheet_indices: Optional 0-based sheet positions to convert.
+        cell_range: Optional A1-style range applied to every sheet.
+        cache_key: Optional result cache key; the output is cached under it.
 
-        logger.info("Conversion completed for task {}", task_id)
+    Returns:
+        Dictionary with conversion result info.
+    """
+    task_id = self.request.id
+    logger.info("Starting markdown conversion for task {}", task_id)
 
-        return {
-            "status": "success",
-            "task_id": task_id,
-            "original_filename": original_filename,
-            "result_dir": str(result_dir),
-            "sheets": results,
-            "total_sheets": len(results),
-            "has_zip": zip_path is not None,
-            "zip_path": str(zip_path) if zip_path else None,
-        }
+    try:
+        result = _start_conversion(
+            self,
+            file_path,
+            original_filename,
+            "markdown",
+            use_headers=use_headers,
+            sheets=sheets,
+            sheet_indices=sheet_indices,
+            cell_range=cell_range,
+            cache_key=cache_key,
+        )
+        logger.info("Conversion completed for task {}", task_id)
+        return result
 
+    except Ignore:
+        # Replaced by a parallel conversion
+        raise
     except Exception as e:
         logger.error("Conversion failed for task {}: {}", task_id, str(e))
         raise
@@ -141,6 +710,11 @@ def convert_to_json(
     file_path: str,
     original_filename: str,
     use_headers: bool = True,
+    sheets: Optional[List[str]] = None,
+    sheet_indices: Optional[List[int]] = None,
+    cell_range: Optional[str] = None,
+    json_format: str = "json",
+    cache_key: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Convert Excel file to JSON format.
@@ -149,6 +723,12 @@ def convert_to_json(
         file_path: Path to the uploaded Excel file.
         original_filename: Original name of the uploaded file.
         use_headers: Whether to treat first row as headers.
+        sheets: Optional sheet names to convert (default: all).
+        sheet_indices: Optional 0-based sheet positions to convert.
+        cell_range: Optional A1-style range applied to every sheet.
+        json_format: "json" for a pretty-printed array per sheet, or
+            "ndjson" for one compact record per line.
+        cache_key: Optional result cache key; the output is cached under it.
 
     Returns:
         Dictionary with conversion result info.
@@ -157,115 +737,148 @@ def convert_to_json(
     logger.info("Starting JSON conversion for task {}", task_id)
 
     try:
-        self.update_state(
-            state="PROGRESS",
-            meta={
-                "progress": 0,
-                "message": "Reading Excel file",
-                "current_sheet": None,
-                "total_sheets": 0,
-            },
+        if json_format not in JSON_FORMATS:
+            raise ValueError(f"Unknown JSON format: {json_format}")
+
+        result = _start_conversion(
+            self,
+            file_path,
+            original_filename,
+            json_format,
+            use_headers=use_headers,
+            sheets=sheets,
+            sheet_indices=sheet_indices,
+            cell_range=cell_range,
+            cache_key=cache_key,
         )
+        logger.info("JSON conversion completed for task {}", task_id)
+        return result
 
-        # Read Excel data
-        excel_data = get_excel_data_from_path(file_path, use_headers)
-        total_sheets = len(excel_data)
+    except Ignore:
+        # Replaced by a parallel conversion
+        raise
+    except Exception as e:
+        logger.error("JSON conversion failed for task {}: {}", task_id, str(e))
+        raise
 
-        self.update_state(
-            state="PROGRESS",
-            meta={
-                "progress": 10,
-                "message": f"Found {total_sheets} sheet(s)",
-                "current_sheet": None,
+
+@celery_app.task(bind=True, name="app.tasks.conversion_tasks.convert_sheet")
+def convert_sheet(
+    self,
+    file_path: str,
+    parent_id: str,
+    output_format: str,
+    sheet_name: str,
+    use_headers: bool = True,
+    cell_range: Optional[str] = None,
+    sheet_key: Optional[str] = None,
+    done_before: int = 0,
+    total_sheets: int = 1,
+) -> Dict[str, Any]:
+    """
+    Convert one sheet of a workbook for a parallel conversion.
+
+    Reads only the given sheet and writes its output file into the results
+    directory of the parent task, whose progress it then advances.
+
+    Args:
+        file_path: Path to the uploaded Excel file.
+        parent_id: ID of the conversion task the sheet belongs to.
+        output_format: One of OUTPUT_WRITERS.
+        sheet_name: Sheet to convert.
+        use_headers: Whether to treat first row as headers.
+        cell_range: Optional A1-style range applied to the sheet.
+        sheet_key: Optional sheet cache key; the output is cached under it.
+        done_before: Sheets of the conversion restored from the cache.
+        total_sheets: Number of sheets selected for the conversion.
+
+    Returns:
+        Dictionary with the sheet name, whether the sheet holds data, and
+        its sheet result (None when the sheet is left out).
+    """
+    results, found = _convert_sheets(
+        file_path,
+        parent_id,
+        output_format,
+        [sheet_name],
+        {sheet_name: sheet_key} if sheet_key else {},
+        use_headers,
+        cell_range,
+    )
+
+    try:
+        done_key = _SHEETS_DONE_KEY.format(parent_id)
+        client = _redis_client()
+        done = done_before + client.incr(done_key)
+        client.expire(done_key, celery_app.conf.result_expires)
+    except redis.RedisError as e:
+        logger.warning("Cannot update progress of task {}: {}", parent_id, e)
+    else:
+        celery_app.backend.store_result(
+            parent_id,
+            {
+                "progress": 10 + int((done / max(total_sheets, 1)) * 80),
+                "message": f"Converted sheet: {sheet_name} ({done}/{total_sheets})",
+                "current_sheet": sheet_name,
                 "total_sheets": total_sheets,
             },
+            "PROGRESS",
         )
 
-        # Create results directory
-        result_dir = settings.results_dir / task_id
-        result_dir.mkdir(parents=True, exist_ok=True)
-
-        # Convert each sheet to JSON
-        import json
-        results = {}
+    return {
+        "sheet": sheet_name,
+        "found": bool(found),
+        "result": results.get(sheet_name),
+    }
 
-        for i, sheet in enumerate(excel_data):
-            sheet_name = sheet["sheetname"]
-            progress = 10 + int((i / total_sheets) * 80)
-
-            self.update_state(
-                state="PROGRESS",
-                meta={
-                    "progress": progress,
-                    "message": f"Converting sheet: {sheet_name}",
-                    "current_sheet": sheet_name,
-                    "total_sheets": total_sheets,
-                },
-            )
 
-            # Convert to JSON records format
-            headers = sheet["headers"]
-            data = sheet["data"]
-
-            if headers:
-                # Create list of dictionaries
-                json_data = []
-                for row in data:
-                    record = {}
-                    for j, header in enumerate(headers):
-                        key = header if header else f"column_{j}"
-                        value = row[j] if j < len(row) else None
-                        record[key] = value
-                    json_data.append(record)
-            else:
-                # No headers - use list of lists
-                json_data = data
-
-            json_content = json.dumps(json_data, ensure_ascii=False, indent=2)
-            results[sheet_name] = {
-                "content": json_content,
-                "row_count": len(data),
-                "column_count": len(headers) if headers else (
-                    len(data[0]) if data else 0
-                ),
-            }
+@celery_app.task(bind=True, name="app.tasks.conversion_tasks.assemble_conversion")
+def assemble_conversion(
+    self,
+    sheet_results: List[Dict[str, Any]],
+    original_filename: str,
+    task_id: str,
+    names: List[str],
+    restored: Dict[str, Dict[str, Any]],
+    cache_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Assemble the result of a parallel conversion from its sheet results.
 
-            # Save JSON file
-            json_file_path = result_dir / f"{sheet_name}.json"
-            json_file_path.write_text(json_content, encoding="utf-8")
-
-        # Create ZIP if multiple sheets
-        zip_path = None
-        if len(results) > 1:
-            self.update_state(
-                state="PROGRESS",
-                meta={
-                    "progress": 95,
-                    "message": "Creating ZIP archive",
-                    "current_sheet": None,
-                    "total_sheets": total_sheets,
-                },
-            )
+    Runs as the chord callback under the ID of the original conversion
+    task, so its return value is that task's result.
 
-            zip_path = result_dir / "result.zip"
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                for sheet_name in results:
-                    json_file = result_dir / f"{sheet_name}.json"
-                    zf.write(json_file, f"{sheet_name}.json")
+    Args:
+        sheet_results: Return values of the convert_sheet subtasks.
+        original_filename: Original name of the uploaded file.
+        task_id: ID of the conversion task.
+        names: Selected sheet names in workbook order.
+        restored: Sheet results restored from the cache.
+        cache_key: Optional result cache key; the output is cached under it.
 
-        logger.info("JSON conversion completed for task {}", task_id)
+    Returns:
+        Dictionary with conversion result info.
+    """
+    if not restored and not any(sheet["found"] for sheet in sheet_results):
+        raise EmptyFileError("Excel file contains no data")
 
-        return {
-            "status": "success",
-            "task_id": task_id,
-            "original_filename": original_filename,
-            "result_dir": str(result_dir),
-            "sheets": results,
-            "total_sheets": len(results),
-            "has_zip": zip_path is not None,
-            "zip_path": str(zip_path) if zip_path else None,
-        }
+    results = dict(restored)
+    for sheet in sheet_results:
+        if sheet["result"] is not None:
+            results[sheet["sheet"]] = sheet["result"]
 
-    except Exception as e:
-        logger.error("JSON conversion failed for task {}: {}", task_id, str(e))
-        raise
+    try:
+        _redis_client().delete(_SHEETS_DONE_KEY.format(task_id))
+    except redis.RedisError:
+        pass
+
+    result = _finish_conversion(
+        original_filename,
+        task_id,
+        names,
+        results,
+        _progress_reporter(self),
+        cache_key,
+    )
+    logger.info("Parallel conversion completed for task {}", task_id)
+    return result
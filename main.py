@@ -1,127 +1,293 @@
+"""Standalone CLI converting Excel files to Markdown tables."""
+
 import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from loguru import logger
-from xlrd import open_workbook
 
+from app.core.excel_reader import (
+    XLSX_ENGINES,
+    inspect_workbook,
+    iter_excel_sheets_from_path,
+)
+from app.core.exceptions import EmptyFileError, Excel2MarkdownError
+from app.core.markdown_converter import write_markdown_table
 
-def get_excel_data(excel_filename: str, use_headers: bool = True):
-    """
-    Open excel file and exctract table.
-    :param excel_filename:
-    :param use_headers:
-    :return:
-    """
-    result = []
-    xl_workbook = open_workbook(excel_filename)
-    sheet_names = xl_workbook.sheet_names()
-
-    for sheet_name in sheet_names:
-        xl_sheet = xl_workbook.sheet_by_name(sheet_name)
-        num_cols = xl_sheet.ncols
-        headers = []
-        data = []
-        start_row_idx = 0
-        if use_headers and xl_sheet.nrows:
-            start_row_idx = 1
-            for col_idx in range(0, num_cols):
-                cell_obj = xl_sheet.cell(0, col_idx)
-                headers.append(cell_obj.value)
-        for row_idx in range(start_row_idx, xl_sheet.nrows):
-            row_data = []
-            for col_idx in range(0, num_cols):
-                cell_obj = xl_sheet.cell(row_idx, col_idx)
-                row_data.append(cell_obj.value)
-            data.append(row_data)
-
-        result.append(
-            {
-                'sheetname': sheet_name,
-                'headers': headers,
-                'data': data
-            }
-        )
+EXCEL_SUFFIXES = (".xls", ".xlsx")
 
-    return result
+# (workbook, output directory, sheets to convert or None for all)
+Job = Tuple[Path, Path, Optional[List[str]]]
 
 
-def get_markdown_table(headers, data):
+def find_excel_files(paths: Iterable[str]) -> List[Tuple[Path, Path]]:
     """
-    Create markdown table
-    :param headers: List of table headers
-    :param data: List with table data: [[Row1Col1, Row1Col2], [Row2Col1, Row2Col2]]
-    :return: string with table in markdown format.
+    Expand files and directories into the workbooks to convert.
+
+    Directories are searched recursively; Excel lock files (``~$*``) are
+    skipped.
+
+    Args:
+        paths: Excel files and directories.
+
+    Returns:
+        Pairs of workbook path and its output location relative to the
+        output directory. The location keeps the directory layout and the
+        file name with its extension, so ``a.xls`` and ``a.xlsx`` do not
+        share one; locations still clashing (the same name given from
+        two directories) get a `` (2)``, `` (3)``... suffix.
     """
-    res = ''
+    files: Dict[Path, Path] = {}
+    for path in map(Path, paths):
+        if path.is_dir():
+            for file in sorted(path.rglob("*")):
+                if (
+                    file.suffix.lower() in EXCEL_SUFFIXES
+                    and not file.name.startswith("~$")
+                    and file.is_file()
+                ):
+                    files.setdefault(file, file.relative_to(path))
+        else:
+            files.setdefault(path, Path(path.name))
+    return _unique_targets(files.items())
 
-    if headers:
-        res += '|' + '|'.join(headers) + '|\n'
-        res += '|' + '|'.join(['-'] * len(headers)) + '|'
-    elif data:
-        max_col_count = len(max(data, key=len))
-        res += '|' + '|'.join([' '] * max_col_count) + '|\n'
-        res += '|' + '|'.join(['-'] * max_col_count) + '|'
-    if not data:
-        return res
-    for rec in data:
-        res += '\n|' + '|'.join(map(str, rec)) + '|'
 
-    return res
+def _unique_targets(files: Iterable[Tuple[Path, Path]]) -> List[Tuple[Path, Path]]:
+    """Rename output locations clashing with an earlier one."""
+    taken: Set[str] = set()
+    unique: List[Tuple[Path, Path]] = []
+    for file, target in files:
+        candidate = target
+        number = 1
+        # Compared case-insensitively for case-insensitive filesystems
+        while str(candidate).lower() in taken:
+            number += 1
+            candidate = target.with_name(f"{target.stem} ({number}){target.suffix}")
+        taken.add(str(candidate).lower())
+        unique.append((file, candidate))
+    return unique
 
 
-def get_markdown_data(excel_data):
+def plan_jobs(
+    files: List[Tuple[Path, Path]],
+    output_dir: Path,
+    jobs: int,
+) -> List[Job]:
     """
-    Convert data to markdown tables.
-    :param excel_data: List of dict in following format:
-        [{'sheetname': 'Name of excel sheet', 'headers': [], 'data': []}]
-    :return: dict with md sheet_name and md_table.
+    Split the conversion into units of work for the process pool.
+
+    With at least as many workbooks as jobs each workbook is one unit.
+    With fewer, workbooks are split into one unit per sheet so every
+    process has work.
+
+    Args:
+        files: Workbooks and their relative output locations.
+        output_dir: Directory receiving the Markdown files.
+        jobs: Number of worker processes.
+
+    Returns:
+        Units of work in workbook and sheet order.
     """
-    result = {}
-    for rec in excel_data:
-        sheetname = rec.get('sheetname')
-        if not sheetname:
-            logger.warning('Empty sheetname')
+    planned: List[Job] = []
+    for file, relative in files:
+        # A single workbook writes straight into the output directory
+        target = output_dir if len(files) == 1 else output_dir / relative
+        if len(files) >= jobs:
+            planned.append((file, target, None))
             continue
-        headers = rec.get('headers')
-        data = rec.get('data')
-        if not data:
-            logger.warning('Empty data for sheet {}', sheetname)
+        try:
+            with open(file, "rb") as f:
+                info = inspect_workbook(f, file.name)
+            names = [sheet["name"] for sheet in info["sheets"]]
+        except Exception:
+            # Reported by the worker converting the whole workbook
+            planned.append((file, target, None))
             continue
-        md_data = get_markdown_table(headers, data)
-        result[sheetname] = md_data
-    return result
+        planned.extend((file, target, [name]) for name in names)
+    return planned
+
+
+def convert_workbook(
+    file_path: Path,
+    output_dir: Path,
+    sheets: Optional[List[str]] = None,
+    use_headers: bool = True,
+    xlsx_engine: str = "openpyxl",
+) -> Dict[str, Any]:
+    """
+    Convert sheets of a workbook into ``<sheet>.md`` files.
+
+    Rows are streamed from the reader into the files, so memory use does
+    not grow with the sheet size. Sheets without rows are skipped.
 
+    Args:
+        file_path: Excel file to convert.
+        output_dir: Directory receiving the Markdown files.
+        sheets: Sheets to convert (default: all).
+        use_headers: Whether to treat first row as headers.
+        xlsx_engine: Reader engine for .xlsx files, one of XLSX_ENGINES.
 
-def save_to_markdown_files(data):
+    Returns:
+        Dictionary with the row count of each written sheet, the elapsed
+        time and an error message if the conversion failed.
     """
-    Save data to md-files with table.
-    :param data: Dict in following format: {sheet_name: md_data}.
-    :return: list with name of created files.
+    started = time.perf_counter()
+    written: Dict[str, int] = {}
+    error = None
+
+    try:
+        streams = iter_excel_sheets_from_path(
+            str(file_path), use_headers, xlsx_engine=xlsx_engine, sheets=sheets
+        )
+        for sheet in streams:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            md_path = output_dir / f"{sheet['sheetname']}.md"
+            with open(md_path, "w", encoding="utf-8") as fp:
+                row_count = write_markdown_table(
+                    sheet["headers"],
+                    sheet["rows"],
+                    fp,
+                    column_count=sheet["column_count"],
+                )
+            if not row_count:
+                logger.warning("Empty data for sheet {}", sheet["sheetname"])
+                md_path.unlink()
+                continue
+            written[sheet["sheetname"]] = row_count
+    except EmptyFileError:
+        logger.warning("No data in {}", file_path)
+    except (OSError, Excel2MarkdownError) as e:
+        error = str(e)
+    except Exception as e:
+        # Raised in a worker process, this would abort the whole batch
+        logger.exception("Unexpected error converting {}", file_path)
+        error = f"{type(e).__name__}: {e}"
+
+    return {
+        "sheets": written,
+        "seconds": time.perf_counter() - started,
+        "error": error,
+    }
+
+
+def run(
+    paths: Iterable[str],
+    output_dir: Path,
+    jobs: int = 1,
+    use_headers: bool = True,
+    xlsx_engine: str = "openpyxl",
+) -> Dict[Path, Dict[str, Any]]:
+    """
+    Convert Excel files and directories, in parallel when ``jobs`` > 1.
+
+    Args:
+        paths: Excel files and directories.
+        output_dir: Directory receiving the Markdown files.
+        jobs: Number of worker processes.
+        use_headers: Whether to treat first row as headers.
+        xlsx_engine: Reader engine for .xlsx files, one of XLSX_ENGINES.
+
+    Returns:
+        Conversion summary per workbook, in input order: row counts by
+        sheet, conversion time (summed over its units) and errors.
     """
-    md_filenames = []
-    for sheetname, md_data in data.items():
-        md_filename = sheetname + '.md'
-        with open(md_filename, "w") as f:
-            f.write(md_data)
-        md_filenames.append(md_filename)
-    return md_filenames
+    planned = plan_jobs(find_excel_files(paths), output_dir, jobs)
+    args = [
+        (file, target, sheets, use_headers, xlsx_engine)
+        for file, target, sheets in planned
+    ]
+
+    if jobs > 1 and len(planned) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            outcomes = list(executor.map(convert_workbook, *zip(*args)))
+    else:
+        outcomes = [convert_workbook(*unit) for unit in args]
+
+    summary: Dict[Path, Dict[str, Any]] = {}
+    for (file, _, _), outcome in zip(planned, outcomes):
+        entry = summary.setdefault(file, {"sheets": {}, "seconds": 0.0, "errors": []})
+        entry["sheets"].update(outcome["sheets"])
+        entry["seconds"] += outcome["seconds"]
+        if outcome["error"]:
+            entry["errors"].append(outcome["error"])
+    return summary
+
+
+def print_summary(summary: Dict[Path, Dict[str, Any]]) -> None:
+    """Print the per-file timing summary as a table."""
+    print(f"{'seconds':>9}  {'sheets':>6}  {'rows':>9}  file")
+    for file, entry in summary.items():
+        rows = sum(entry["sheets"].values())
+        sheets = len(entry["sheets"])
+        line = f"{entry['seconds']:9.2f}  {sheets:6d}  {rows:9d}  {file}"
+        if entry["errors"]:
+            line += f"  FAILED: {'; '.join(entry['errors'])}"
+        print(line)
 
 
 def __main():
     logger.info("It is CLI-program for extracting Excel-tables to md-files")
-    parser = argparse.ArgumentParser(description='Converting Excel to mdf')
-    parser.add_argument('excel_filename', type=str,
-                        help='An excel-table filename')
+    parser = argparse.ArgumentParser(description="Converting Excel to Markdown")
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="Excel files (.xls, .xlsx) or directories to search for them",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        default=Path("."),
+        help="Directory for the md-files; with several workbooks each gets "
+        "its own subdirectory (default: current directory)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--no-headers",
+        action="store_true",
+        help="Do not treat the first row as table headers",
+    )
+    parser.add_argument(
+        "--xlsx-engine",
+        choices=XLSX_ENGINES,
+        default="openpyxl",
+        help="Reader for .xlsx files (default: openpyxl)",
+    )
     args = parser.parse_args()
-    excel_filename = args.excel_filename
-    if not excel_filename:
-        logger.error('It is neccessary to provide excel filename')
-        return
-    logger.info("Excel file is {}", excel_filename)
-
-    excel_data = get_excel_data(excel_filename)
-    md_data = get_markdown_data(excel_data)
-    files = save_to_markdown_files(md_data)
-    logger.info('Saved to {}', files)
+    jobs = max(args.jobs, 1)
+
+    started = time.perf_counter()
+    summary = run(
+        args.paths,
+        args.output_dir,
+        jobs,
+        use_headers=not args.no_headers,
+        xlsx_engine=args.xlsx_engine,
+    )
+    elapsed = time.perf_counter() - started
+
+    print_summary(summary)
+    failed = sum(1 for entry in summary.values() if entry["errors"])
+    logger.info(
+        "Converted {} of {} file(s) into {} in {:.2f}s with {} job(s)",
+        len(summary) - failed,
+        len(summary),
+        args.output_dir,
+        elapsed,
+        jobs,
+    )
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
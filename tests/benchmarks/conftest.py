@@ -0,0 +1,34 @@
+"""Pytest configuration for performance benchmarks.
+
+Benchmarks are slow and machine dependent, so they are skipped unless
+the RUN_BENCHMARKS environment variable is set:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks -s
+"""
+
+import os
+import time
+from typing import Any, Callable
+
+import pytest
+
+
+def pytest_runtest_setup(item):
+    """Skip benchmarks unless explicitly enabled."""
+    if not os.environ.get("RUN_BENCHMARKS"):
+        pytest.skip("Benchmarks are disabled, set RUN_BENCHMARKS=1 to run them")
+
+
+@pytest.fixture
+def best_of() -> Callable[..., float]:
+    """Return a helper timing the best of several runs of a callable."""
+
+    def run(func: Callable[..., Any], *args: Any, repeat: int = 3) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(*args)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    return run
@@ -0,0 +1,104 @@
+"""End-to-end latency of inline (mode=sync) vs queued (mode=async) conversion.
+
+Needs the full stack (API, Redis and a Celery worker), e.g. started with
+``docker-compose up``. Point BENCHMARK_API_URL at the API if it does not
+listen on http://localhost:8000. The same file is uploaded repeatedly,
+so run the API with RESULT_CACHE_ENABLED=false to time real conversions:
+
+    RUN_BENCHMARKS=1 BENCHMARK_API_URL=http://localhost pytest \
+        tests/benchmarks/test_convert_latency_benchmark.py -s
+"""
+
+import os
+import statistics
+import time
+from io import BytesIO
+
+import httpx
+import pytest
+from openpyxl import Workbook
+
+pytestmark = pytest.mark.benchmark
+
+API_URL = os.environ.get("BENCHMARK_API_URL", "http://localhost:8000")
+RUNS = 20
+# Status polling interval of the progress page (progress.js)
+POLL_INTERVAL = 1.0
+
+
+@pytest.fixture(scope="module")
+def client():
+    with httpx.Client(base_url=API_URL, timeout=60) as client:
+        try:
+            client.get("/health").raise_for_status()
+        except httpx.HTTPError as e:
+            pytest.skip(f"API is not reachable at {API_URL}: {e}")
+        yield client
+
+
+@pytest.fixture(scope="module")
+def small_xlsx() -> bytes:
+    """About 20 KB workbook: 2 sheets of 200 x 8 cells."""
+    workbook = Workbook()
+    for index in range(2):
+        sheet = workbook.active if index == 0 else workbook.create_sheet()
+        sheet.append([f"Column {c}" for c in range(8)])
+        for r in range(200):
+            sheet.append([r * 8 + c if c % 2 else f"text {r}" for c in range(8)])
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _convert(client, content, mode, poll_interval=POLL_INTERVAL):
+    """Upload a file and wait until its markdown content is available."""
+    response = client.post(
+        "/api/v1/convert",
+        files={"file": ("small.xlsx", content)},
+        data={"mode": mode},
+    )
+    response.raise_for_status()
+    body = response.json()
+    if "sheets" in body:
+        return body
+
+    task_id = body["task_id"]
+    while True:
+        status = client.get(f"/api/v1/tasks/{task_id}/status").json()
+        if status["status"] == "SUCCESS":
+            break
+        if status["status"] == "FAILURE":
+            raise AssertionError(status["error"])
+        time.sleep(poll_interval)
+    return client.get(f"/api/v1/tasks/{task_id}/result").json()
+
+
+def _latencies(client, content, mode, **kwargs):
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = _convert(client, content, mode, **kwargs)
+        timings.append(time.perf_counter() - start)
+        assert result["sheets"]
+    return timings
+
+
+def test_sync_vs_async_latency(client, small_xlsx):
+    # Warm up both paths (imports, worker pool, connections)
+    _convert(client, small_xlsx, "sync")
+    _convert(client, small_xlsx, "async", poll_interval=0.05)
+
+    results = {
+        "sync": _latencies(client, small_xlsx, "sync"),
+        f"async, {POLL_INTERVAL:g}s polling": _latencies(client, small_xlsx, "async"),
+        "async, 50ms polling": _latencies(
+            client, small_xlsx, "async", poll_interval=0.05
+        ),
+    }
+
+    print(f"\n{len(small_xlsx) // 1024} KB workbook, {RUNS} runs")
+    for name, timings in results.items():
+        print(
+            f"{name:>22}: median {statistics.median(timings) * 1000:7.1f} ms, "
+            f"max {max(timings) * 1000:7.1f} ms"
+        )
@@ -0,0 +1,110 @@
+"""Benchmarks for markdown table rendering."""
+
+import pytest
+
+from app.core.markdown_converter import get_markdown_table
+
+pytestmark = pytest.mark.benchmark
+
+ROWS = 50_000
+COLS = 20
+
+
+def _legacy_escape(value):
+    text = str(value) if value is not None else ""
+    text = text.replace("|", "\\|")
+    text = text.replace("\n", "<br>")
+    return text
+
+
+def _legacy_table(headers, data):
+    """String-concatenating builder used before the list/join rewrite."""
+    result = "|" + "|".join([_legacy_escape(h) for h in headers]) + "|\n"
+    result += "|" + "|".join(["-"] * len(headers)) + "|"
+    for row in data:
+        escaped_row = [_legacy_escape(cell) for cell in row]
+        result += "\n|" + "|".join(escaped_row) + "|"
+    return result
+
+
+def _paired_timings(best_of, headers, data, slice_rows=1000, rounds=3):
+    """
+    Time both builders over the table, alternating slice by slice.
+
+    Load on a shared machine changes over seconds; comparing per slice of
+    rows (best of a few rounds each) makes such changes hit both builders
+    alike. Returns the summed (legacy, current) seconds.
+    """
+    before = after = 0.0
+    for start in range(0, len(data), slice_rows):
+        rows = data[start : start + slice_rows]
+        legacy = current = float("inf")
+        for _ in range(rounds):
+            legacy = min(legacy, best_of(_legacy_table, headers, rows, repeat=1))
+            current = min(current, best_of(get_markdown_table, headers, rows, repeat=1))
+        before += legacy
+        after += current
+    return before, after
+
+
+@pytest.fixture(scope="module")
+def million_cell_table():
+    """Headers and 50000 x 20 rows of mixed cell values (1M cells)."""
+    headers = [f"Column {c}" for c in range(COLS)]
+    data = [
+        [
+            r * COLS + c if c % 3 == 0 else
+            r * 0.5 if c % 3 == 1 else
+            f"text {r} | {c}" if c == 2 else f"text {c}"
+            for c in range(COLS)
+        ]
+        for r in range(ROWS)
+    ]
+    return headers, data
+
+
+def test_markdown_table_rendering(million_cell_table, best_of):
+    headers, data = million_cell_table
+    cells = ROWS * COLS
+
+    before, after = _paired_timings(best_of, headers, data)
+
+    print(
+        f"\nmarkdown rendering per cell: before {before / cells * 1e9:.1f} ns, "
+        f"after {after / cells * 1e9:.1f} ns ({before / after:.1f}x)"
+    )
+    assert after < before
+
+
+@pytest.fixture(scope="module")
+def xls_style_table():
+    """Headers and 50000 x 20 rows as xlrd returns them: numbers as floats."""
+    headers = [f"Column {c}" for c in range(COLS)]
+    data = [
+        [
+            float(r % 500) if c % 2 == 0 else
+            r * 0.25 if c % 4 == 1 else
+            f"category {c % 5}"
+            for c in range(COLS)
+        ]
+        for r in range(ROWS)
+    ]
+    return headers, data
+
+
+def test_markdown_float_table(xls_style_table, best_of):
+    """
+    500 distinct integral floats repeat down half the columns: they are
+    formatted as ints once, then served from CellFormatter's float cache.
+    """
+    headers, data = xls_style_table
+    cells = ROWS * COLS
+
+    before, after = _paired_timings(best_of, headers, data)
+
+    print(
+        f"\nfloat-heavy rendering per cell: before {before / cells * 1e9:.1f} ns, "
+        f"after {after / cells * 1e9:.1f} ns ({before / after:.1f}x)"
+    )
+    assert after < before
+    assert "|1|" in get_markdown_table(headers, data[:2])
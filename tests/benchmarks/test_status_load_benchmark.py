@@ -0,0 +1,103 @@
+"""Event-loop latency under many concurrent task status pollers.
+
+Compares the async status lookup (async Redis client, bounded pool) with
+the blocking AsyncResult lookup called straight from coroutines, as the
+status route used to do. A monitor coroutine measures how late the event
+loop wakes it up; with the async lookup the lag stays flat as pollers
+are added. Needs a Redis server at CELERY_RESULT_BACKEND:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_status_load_benchmark.py -s
+"""
+
+import asyncio
+import statistics
+import time
+import uuid
+
+import pytest
+import redis
+
+from app.celery_app import celery_app
+from app.config import settings
+from app.services.conversion_service import ConversionService, conversion_service
+
+pytestmark = pytest.mark.benchmark
+
+POLLERS = 500
+ROUNDS = 10
+# Wake-up interval of the lag monitor
+TICK = 0.005
+
+
+@pytest.fixture(scope="module")
+def task_id():
+    try:
+        redis.Redis.from_url(settings.celery_result_backend).ping()
+    except redis.RedisError as e:
+        pytest.skip(f"Redis is not reachable: {e}")
+
+    task_id = str(uuid.uuid4())
+    celery_app.backend.store_result(
+        task_id, {"progress": 50, "message": "Converting"}, "PROGRESS"
+    )
+    yield task_id
+    celery_app.backend.forget(task_id)
+
+
+async def _measure(poll) -> dict:
+    """Run POLLERS concurrent pollers and record event-loop lag meanwhile."""
+    lags = []
+    done = asyncio.Event()
+
+    async def monitor():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append(time.perf_counter() - start - TICK)
+
+    async def poller():
+        for _ in range(ROUNDS):
+            status = await poll()
+            assert status["status"] == "PROGRESS"
+
+    watcher = asyncio.create_task(monitor())
+    start = time.perf_counter()
+    await asyncio.gather(*(poller() for _ in range(POLLERS)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await watcher
+
+    lags.sort()
+    return {
+        "elapsed": elapsed,
+        "p50": statistics.median(lags),
+        "p99": lags[int(len(lags) * 0.99)],
+        "max": lags[-1],
+    }
+
+
+def test_event_loop_lag(task_id):
+    async def blocking():
+        return conversion_service.get_task_status(task_id)
+
+    async def run_async():
+        service = ConversionService(
+            settings.celery_result_backend, settings.redis_pool_size
+        )
+        try:
+            return await _measure(lambda: service.get_task_status_async(task_id))
+        finally:
+            await service.close()
+
+    results = {
+        "blocking AsyncResult": asyncio.run(_measure(blocking)),
+        f"async, pool of {settings.redis_pool_size}": asyncio.run(run_async()),
+    }
+
+    print(f"\n{POLLERS} pollers x {ROUNDS} status lookups")
+    for name, stats in results.items():
+        print(
+            f"{name:>22}: {stats['elapsed']:6.2f}s total, loop lag "
+            f"p50 {stats['p50'] * 1000:6.2f} ms, p99 {stats['p99'] * 1000:6.2f} ms, "
+            f"max {stats['max'] * 1000:7.2f} ms"
+        )
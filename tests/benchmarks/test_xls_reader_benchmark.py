@@ -0,0 +1,66 @@
+"""Benchmarks for .xls row extraction."""
+
+from datetime import datetime, timedelta
+from io import BytesIO
+
+import pytest
+
+from app.core.excel_reader import _iter_xls_rows
+
+pytestmark = pytest.mark.benchmark
+
+# .xls (BIFF8) sheets are capped at 65536 rows, so 100k rows cannot be
+# stored in a single sheet; use the format maximum instead.
+ROWS = 65535
+COLS = 20
+
+
+def _legacy_rows(sheet):
+    """Per-cell extraction used by read_excel_xls before bulk row access."""
+    data = []
+    for row_idx in range(sheet.nrows):
+        row_data = []
+        for col_idx in range(sheet.ncols):
+            row_data.append(sheet.cell(row_idx, col_idx).value)
+        data.append(row_data)
+    return data
+
+
+@pytest.fixture(scope="module")
+def large_xls_sheet():
+    """Generated 65535 x 20 .xls sheet with one date column."""
+    xlwt = pytest.importorskip("xlwt")
+    import xlrd
+
+    workbook = xlwt.Workbook()
+    sheet = workbook.add_sheet("Data")
+    date_style = xlwt.easyxf(num_format_str="YYYY-MM-DD")
+    start = datetime(2020, 1, 1)
+    for r in range(ROWS):
+        row = sheet.row(r)
+        row.write(0, start + timedelta(days=r % 3650), date_style)
+        for c in range(1, COLS):
+            row.write(c, r * COLS + c if c % 2 else f"text {c}")
+        if r % 1000 == 0:
+            sheet.flush_row_data()
+    buffer = BytesIO()
+    workbook.save(buffer)
+
+    book = xlrd.open_workbook(file_contents=buffer.getvalue())
+    return book.sheet_by_index(0), book.datemode
+
+
+def test_xls_row_extraction_speedup(large_xls_sheet, best_of):
+    sheet, datemode = large_xls_sheet
+    cells = ROWS * COLS
+
+    bounds = (1, 1, sheet.ncols, sheet.nrows)
+
+    before = best_of(_legacy_rows, sheet)
+    after = best_of(lambda: list(_iter_xls_rows(sheet, datemode, bounds)))
+
+    print(
+        f"\nxls extraction per cell: before {before / cells * 1e9:.1f} ns, "
+        f"after {after / cells * 1e9:.1f} ns ({before / after:.1f}x)"
+    )
+    assert after < before
@@ -0,0 +1,110 @@
+"""Benchmarks for .xlsx trailing-column trimming."""
+
+from io import BytesIO
+
+import pytest
+from openpyxl import Workbook
+
+from app.core.excel_reader import _trim_xlsx_rows, iter_excel_xlsx, read_excel_xlsx
+
+pytestmark = pytest.mark.benchmark
+
+USED_COLS = 100
+TOTAL_COLS = 120
+ROWS = 2000
+# The fast engine has to beat openpyxl by a clear margin, not just match it
+MIN_ENGINE_SPEEDUP = 1.15
+
+
+def _legacy_trim(rows):
+    """Two-pass trimming used by read_excel_xlsx before single-pass mode."""
+    rows = list(rows)
+    max_cols = 0
+    for row in rows:
+        for i, cell in enumerate(row):
+            if cell is not None:
+                max_cols = max(max_cols, i + 1)
+    data = []
+    for row in rows:
+        row_data = list(row[:max_cols])
+        row_data = [cell if cell is not None else "" for cell in row_data]
+        data.append(row_data)
+    return data, max_cols
+
+
+def _single_pass_trim(rows):
+    data, max_cols = _trim_xlsx_rows(rows)
+    for row in data:
+        if len(row) < max_cols:
+            row.extend([""] * (max_cols - len(row)))
+    return data, max_cols
+
+
+@pytest.fixture(scope="module")
+def wide_rows():
+    """Raw rows as openpyxl yields them: 100 used columns padded to 120."""
+    padding = (None,) * (TOTAL_COLS - USED_COLS)
+    return [
+        tuple(
+            None if (r + c) % 7 == 0 else f"r{r}c{c}" for c in range(USED_COLS)
+        ) + padding
+        for r in range(ROWS)
+    ]
+
+
+@pytest.fixture(scope="module")
+def wide_xlsx():
+    """Generated .xlsx with 100 used and 20 blank-but-declared columns."""
+    workbook = Workbook()
+    sheet = workbook.active
+    for r in range(ROWS):
+        sheet.append([r * USED_COLS + c for c in range(USED_COLS)])
+    # Touch a far column so the declared dimension is wider than the data
+    sheet.cell(row=1, column=TOTAL_COLS).number_format = "0.00"
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def test_trim_per_cell_cost(wide_rows, best_of):
+    cells = ROWS * TOTAL_COLS
+    assert _single_pass_trim(wide_rows) == _legacy_trim(wide_rows)
+
+    before = best_of(_legacy_trim, wide_rows)
+    after = best_of(_single_pass_trim, wide_rows)
+
+    print(
+        f"\ntrim per cell: before {before / cells * 1e9:.1f} ns, "
+        f"after {after / cells * 1e9:.1f} ns ({before / after:.1f}x)"
+    )
+    assert after < before
+
+
+def test_read_excel_xlsx_per_cell_cost(wide_xlsx, best_of):
+    sheets = read_excel_xlsx(wide_xlsx)
+    assert len(sheets[0]["headers"]) == USED_COLS
+    for engine in ("openpyxl", "fast"):
+        streamed = next(iter_excel_xlsx(wide_xlsx, engine=engine))
+        assert streamed["column_count"] == USED_COLS
+        assert list(streamed["rows"]) == sheets[0]["data"]
+
+    elapsed = best_of(read_excel_xlsx, wide_xlsx, repeat=1)
+    print(f"\nread_excel_xlsx per cell: {elapsed / (ROWS * TOTAL_COLS) * 1e9:.1f} ns")
+
+
+def test_fast_engine_per_cell_cost(wide_xlsx, best_of):
+    cells = ROWS * TOTAL_COLS
+    assert read_excel_xlsx(wide_xlsx, engine="fast") == read_excel_xlsx(wide_xlsx)
+
+    before = after = float("inf")
+    for _ in range(3):
+        before = min(
+            before, best_of(read_excel_xlsx, wide_xlsx, True, "openpyxl", repeat=1)
+        )
+        after = min(after, best_of(read_excel_xlsx, wide_xlsx, True, "fast", repeat=1))
+
+    print(
+        f"\nxlsx engine per cell: openpyxl {before / cells * 1e9:.1f} ns, "
+        f"fast {after / cells * 1e9:.1f} ns ({before / after:.2f}x)"
+    )
+    assert before / after >= MIN_ENGINE_SPEEDUP
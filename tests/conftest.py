@@ -1,8 +1,11 @@
 """Pytest configuration and fixtures for Excel2Markdown tests."""
 
-import pytest
+import zipfile
+from io import BytesIO
 from pathlib import Path
 
+import pytest
+
 
 @pytest.fixture
 def fixtures_dir() -> Path:
@@ -16,6 +19,37 @@ def sample_xlsx_path(fixtures_dir: Path) -> Path:
     return fixtures_dir / "sample.xlsx"
 
 
+@pytest.fixture
+def sample_xls_path(fixtures_dir: Path) -> Path:
+    """Return path to sample .xls test file (same cells as sample.xlsx)."""
+    return fixtures_dir / "sample.xls"
+
+
+@pytest.fixture(params=["truncated", "bad-header"])
+def corrupt_xls(request, sample_xls_path: Path) -> bytes:
+    """Return .xls content whose OLE container xlrd cannot parse."""
+    content = sample_xls_path.read_bytes()
+    if request.param == "truncated":
+        return content[: len(content) // 2]
+    return content[:8] + b"\xff" * 600
+
+
+@pytest.fixture(params=["malformed-sheet", "missing-sheet"])
+def corrupt_xlsx(request, sample_xlsx_path: Path) -> bytes:
+    """Return .xlsx content with a broken first worksheet part."""
+    source = zipfile.ZipFile(sample_xlsx_path)
+    buffer = BytesIO()
+    with source, zipfile.ZipFile(buffer, "w") as target:
+        for item in source.infolist():
+            data = source.read(item)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                if request.param == "missing-sheet":
+                    continue
+                data = b"<worksheet><dimension"
+            target.writestr(item, data)
+    return buffer.getvalue()
+
+
 @pytest.fixture
 def sample_sheet_data():
     """Return sample SheetData for testing."""
@@ -0,0 +1,15 @@
+"""Fixtures for the API integration tests."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch) -> TestClient:
+    """Return a test client storing uploads and results under tmp_path."""
+    monkeypatch.setattr(settings, "uploads_dir", tmp_path / "uploads")
+    monkeypatch.setattr(settings, "results_dir", tmp_path / "results")
+    return TestClient(app)
@@ -0,0 +1,92 @@
+"""Integration tests for the conversion endpoints."""
+
+from unittest import mock
+
+import pytest
+
+from app.celery_app import celery_app
+from app.config import settings
+from app.services.conversion_service import conversion_service
+
+
+@pytest.fixture
+def start_conversion(monkeypatch) -> mock.Mock:
+    """Replace task queuing, which needs a broker."""
+    start = mock.Mock()
+    monkeypatch.setattr(conversion_service, "start_markdown_conversion", start)
+    return start
+
+
+def test_api_auto_mode_queues_corrupt_xls(client, corrupt_xls, start_conversion):
+    response = client.post(
+        "/api/v1/convert",
+        files={"file": ("broken.xls", corrupt_xls)},
+        data={"mode": "auto"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+    start_conversion.assert_called_once()
+
+
+def test_api_auto_mode_queues_corrupt_xlsx(client, corrupt_xlsx, start_conversion):
+    response = client.post(
+        "/api/v1/convert",
+        files={"file": ("broken.xlsx", corrupt_xlsx)},
+        data={"mode": "auto"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+    start_conversion.assert_called_once()
+
+
+def test_form_queues_corrupt_xlsx(client, corrupt_xlsx, start_conversion):
+    response = client.post(
+        "/convert",
+        files={"file": ("broken.xlsx", corrupt_xlsx)},
+        follow_redirects=False,
+    )
+
+    assert response.status_code == 302
+    assert response.headers["location"].startswith("/progress/")
+    start_conversion.assert_called_once()
+
+
+def test_api_sync_mode_rejects_over_budget(
+    client, sample_xlsx_path, start_conversion, monkeypatch
+):
+    monkeypatch.setattr(settings, "sync_max_file_kb", 1)
+    with open(sample_xlsx_path, "rb") as f:
+        response = client.post(
+            "/api/v1/convert",
+            files={"file": ("sample.xlsx", f)},
+            data={"mode": "sync"},
+        )
+
+    assert response.status_code == 413
+    assert "sync limit" in response.json()["detail"]
+    start_conversion.assert_not_called()
+
+
+def test_api_sync_mode_reports_unexpected_errors(
+    client, sample_xlsx_path, monkeypatch
+):
+    monkeypatch.setattr(settings, "result_cache_enabled", False)
+    monkeypatch.setattr(
+        "app.services.conversion_service.run_conversion",
+        mock.Mock(side_effect=RuntimeError("boom")),
+    )
+    # The backend is per thread and the conversion runs in the thread pool
+    with mock.patch.object(
+        type(celery_app.backend), "mark_as_failure"
+    ) as mark_as_failure, open(sample_xlsx_path, "rb") as f:
+        response = client.post(
+            "/api/v1/convert",
+            files={"file": ("sample.xlsx", f)},
+            data={"mode": "sync"},
+        )
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Conversion failed: boom"
+    mark_as_failure.assert_called_once()
@@ -0,0 +1,27 @@
+"""Integration tests for the workbook inspection endpoint."""
+
+
+def test_inspect_sample(client, sample_xlsx_path):
+    response = client.post(
+        "/api/v1/inspect",
+        files={"file": ("sample.xlsx", sample_xlsx_path.read_bytes())},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["total_sheets"] == 4
+
+
+def test_corrupt_xls_is_rejected(client, corrupt_xls):
+    response = client.post(
+        "/api/v1/inspect", files={"file": ("broken.xls", corrupt_xls)}
+    )
+
+    assert response.status_code == 400
+
+
+def test_corrupt_xlsx_is_rejected(client, corrupt_xlsx):
+    response = client.post(
+        "/api/v1/inspect", files={"file": ("broken.xlsx", corrupt_xlsx)}
+    )
+
+    assert response.status_code == 400
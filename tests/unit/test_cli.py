@@ -0,0 +1,135 @@
+"""Unit tests for the standalone CLI."""
+
+import shutil
+from unittest import mock
+
+import pytest
+
+import main
+from app.core.excel_reader import get_excel_data_from_path
+from app.core.markdown_converter import get_markdown_table
+
+
+@pytest.fixture
+def workbooks(tmp_path, sample_xls_path, sample_xlsx_path):
+    source = tmp_path / "in"
+    (source / "nested").mkdir(parents=True)
+    shutil.copy(sample_xls_path, source / "a.xls")
+    shutil.copy(sample_xlsx_path, source / "nested" / "b.xlsx")
+    (source / "~$b.xlsx").write_bytes(b"lock file")
+    (source / "notes.txt").write_text("not a workbook")
+    return source
+
+
+class TestFindExcelFiles:
+    """Tests for main.find_excel_files."""
+
+    def test_directories_keep_layout(self, workbooks, sample_xls_path):
+        files = main.find_excel_files([str(workbooks), str(sample_xls_path)])
+
+        assert [(file.name, str(target)) for file, target in files] == [
+            ("a.xls", "a.xls"),
+            ("b.xlsx", "nested/b.xlsx"),
+            ("sample.xls", "sample.xls"),
+        ]
+
+    def test_same_stem_different_extension(self, workbooks, sample_xlsx_path):
+        shutil.copy(sample_xlsx_path, workbooks / "a.xlsx")
+        files = main.find_excel_files([str(workbooks)])
+
+        assert [str(target) for _, target in files] == [
+            "a.xls",
+            "a.xlsx",
+            "nested/b.xlsx",
+        ]
+
+    def test_same_name_from_different_directories(self, tmp_path, sample_xlsx_path):
+        for folder in ("q1", "q2", "q3"):
+            (tmp_path / folder).mkdir()
+            shutil.copy(sample_xlsx_path, tmp_path / folder / "report.xlsx")
+        files = main.find_excel_files(
+            [
+                str(tmp_path / "q1" / "report.xlsx"),
+                str(tmp_path / "q2" / "report.xlsx"),
+                str(tmp_path / "q3"),
+            ]
+        )
+
+        assert [str(target) for _, target in files] == [
+            "report.xlsx",
+            "report (2).xlsx",
+            "report (3).xlsx",
+        ]
+
+
+class TestRun:
+    """Tests for main.run."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_matches_in_memory_conversion(self, workbooks, tmp_path, jobs):
+        output_dir = tmp_path / "out"
+        summary = main.run([str(workbooks)], output_dir, jobs)
+
+        for file, target in main.find_excel_files([str(workbooks)]):
+            assert summary[file]["errors"] == []
+            expected = get_excel_data_from_path(str(file))
+            assert list(summary[file]["sheets"]) == [s["sheetname"] for s in expected]
+            for sheet in expected:
+                md_path = output_dir / target / f"{sheet['sheetname']}.md"
+                assert md_path.read_text(encoding="utf-8") == get_markdown_table(
+                    sheet["headers"], sheet["data"]
+                )
+
+    def test_same_stem_outputs_kept_apart(self, workbooks, sample_xlsx_path, tmp_path):
+        shutil.copy(sample_xlsx_path, workbooks / "a.xlsx")
+        output_dir = tmp_path / "out"
+        main.run([str(workbooks)], output_dir, 1)
+
+        for name in ("a.xls", "a.xlsx"):
+            sheets = get_excel_data_from_path(str(workbooks / name))
+            assert sorted(p.name for p in (output_dir / name).iterdir()) == sorted(
+                f"{sheet['sheetname']}.md" for sheet in sheets
+            )
+
+    def test_single_workbook_split_into_sheets(self, sample_xlsx_path, tmp_path):
+        files = main.find_excel_files([str(sample_xlsx_path)])
+        planned = main.plan_jobs(files, tmp_path, jobs=4)
+
+        assert [sheets for _, _, sheets in planned] == [
+            ["Sheet 1"],
+            ["Лист1"],
+            ["Лист номер 2"],
+            ["Sheet2"],
+        ]
+        assert all(target == tmp_path for _, target, _ in planned)
+
+    def test_invalid_file_reported(self, tmp_path):
+        bad = tmp_path / "bad.xlsx"
+        bad.write_bytes(b"not an excel file")
+
+        summary = main.run([str(bad)], tmp_path / "out")
+
+        assert summary[bad]["errors"]
+        assert not (tmp_path / "out").exists()
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_corrupt_file_in_batch(self, workbooks, corrupt_xls, tmp_path, jobs):
+        broken = workbooks / "broken.xls"
+        broken.write_bytes(corrupt_xls)
+
+        summary = main.run([str(workbooks)], tmp_path / "out", jobs)
+
+        assert summary[broken]["errors"]
+        for file in summary:
+            if file != broken:
+                assert summary[file]["errors"] == []
+                assert summary[file]["sheets"]
+
+    def test_unexpected_error_reported(self, sample_xlsx_path, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            main, "iter_excel_sheets_from_path", mock.Mock(side_effect=KeyError("x"))
+        )
+
+        summary = main.run([str(sample_xlsx_path)], tmp_path / "out")
+
+        assert summary[sample_xlsx_path]["errors"] == ["KeyError: 'x'"]
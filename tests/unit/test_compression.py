@@ -0,0 +1,53 @@
+"""Unit tests for pre-compressed result copies."""
+
+import gzip
+
+import pytest
+
+from app.core import compression
+from app.core.compression import compressed_path, encoding_supported, write_compressed
+
+
+@pytest.fixture
+def result_file(tmp_path):
+    path = tmp_path / "Лист1.md"
+    text = "| A | B |\n| --- | --- |\n" + "| 1 | 2 |\n" * 1000
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestWriteCompressed:
+    """Tests for write_compressed."""
+
+    def test_gzip(self, result_file):
+        target = write_compressed(result_file, "gzip", chunk_size=1024)
+
+        assert target == compressed_path(result_file, "gzip")
+        assert target.name == "Лист1.md.gz"
+        assert gzip.decompress(target.read_bytes()) == result_file.read_bytes()
+        assert target.stat().st_size < result_file.stat().st_size // 10
+
+    def test_gzip_is_reproducible(self, result_file):
+        first = write_compressed(result_file, "gzip").read_bytes()
+        assert write_compressed(result_file, "gzip").read_bytes() == first
+
+    def test_brotli(self, result_file):
+        brotli = pytest.importorskip("brotli")
+
+        target = write_compressed(result_file, "br", chunk_size=1024)
+
+        assert target.name == "Лист1.md.br"
+        assert brotli.decompress(target.read_bytes()) == result_file.read_bytes()
+
+    def test_brotli_missing(self, result_file, monkeypatch):
+        monkeypatch.setattr(compression, "brotli", None)
+
+        assert not encoding_supported("br")
+        with pytest.raises(ValueError):
+            write_compressed(result_file, "br")
+        assert not compressed_path(result_file, "br").exists()
+
+    def test_unknown_encoding(self, result_file):
+        assert not encoding_supported("zstd")
+        with pytest.raises(ValueError):
+            write_compressed(result_file, "zstd")
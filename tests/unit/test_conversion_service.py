@@ -0,0 +1,219 @@
+"""Unit tests for conversion service."""
+
+import asyncio
+import shutil
+from unittest import mock
+
+import pytest
+
+from app.celery_app import celery_app
+from app.config import settings
+from app.core.exceptions import (
+    ConversionError,
+    EmptyFileError,
+    FileTooLargeError,
+    SheetNotFoundError,
+    TaskNotFoundError,
+)
+from app.services.conversion_service import ConversionService, conversion_service
+from app.services.result_cache import result_cache
+
+
+@pytest.fixture
+def upload(tmp_path, sample_xlsx_path, monkeypatch):
+    monkeypatch.setattr(settings, "results_dir", tmp_path / "results")
+    monkeypatch.setattr(settings, "result_cache_enabled", False)
+    path = tmp_path / "upload.xlsx"
+    shutil.copy(sample_xlsx_path, path)
+    return path
+
+
+class TestShouldConvertInline:
+    """Tests for ConversionService.should_convert_inline."""
+
+    def test_explicit_modes(self, upload):
+        assert conversion_service.should_convert_inline(str(upload), "sync")
+        assert not conversion_service.should_convert_inline(str(upload), "async")
+
+    def test_auto_within_budget(self, upload, monkeypatch):
+        monkeypatch.setattr(settings, "sync_max_file_kb", 256)
+        monkeypatch.setattr(settings, "sync_max_cells", 1000)
+        assert conversion_service.should_convert_inline(str(upload), "auto")
+
+    def test_auto_over_size(self, upload, monkeypatch):
+        monkeypatch.setattr(settings, "sync_max_file_kb", 1)
+        assert not conversion_service.should_convert_inline(str(upload), "auto")
+
+    def test_auto_over_cells(self, upload, monkeypatch):
+        monkeypatch.setattr(settings, "sync_max_cells", 10)
+        assert not conversion_service.should_convert_inline(str(upload), "auto")
+
+    def test_auto_invalid_file_goes_to_worker(self, tmp_path):
+        path = tmp_path / "broken.xlsx"
+        path.write_bytes(b"not an excel file")
+        assert not conversion_service.should_convert_inline(str(path), "auto")
+
+    def test_auto_inspection_crash_goes_to_worker(self, upload, monkeypatch):
+        monkeypatch.setattr(
+            "app.services.conversion_service.inspect_workbook",
+            mock.Mock(side_effect=KeyError("xl/worksheets/sheet1.xml")),
+        )
+        assert not conversion_service.should_convert_inline(str(upload), "auto")
+
+    def test_sync_over_size_rejected(self, upload, monkeypatch):
+        monkeypatch.setattr(settings, "sync_max_file_kb", 1)
+        with pytest.raises(FileTooLargeError, match="1 KB sync limit"):
+            conversion_service.should_convert_inline(str(upload), "sync")
+
+    def test_sync_over_cells_rejected(self, upload, monkeypatch):
+        monkeypatch.setattr(settings, "sync_max_cells", 10)
+        with pytest.raises(FileTooLargeError, match="10 cell sync limit"):
+            conversion_service.should_convert_inline(str(upload), "sync")
+
+    def test_sync_invalid_file_converts_inline(self, tmp_path):
+        path = tmp_path / "broken.xlsx"
+        path.write_bytes(b"not an excel file")
+        assert conversion_service.should_convert_inline(str(path), "sync")
+
+
+class TestConvertInline:
+    """Tests for ConversionService.convert_inline."""
+
+    def test_stores_result_for_task(self, upload):
+        with mock.patch.object(celery_app.backend, "store_result") as store_result:
+            result = conversion_service.convert_inline(
+                str(upload), "sample.xlsx", "task-1", "markdown"
+            )
+
+        assert result["task_id"] == "task-1"
+        assert list(result["sheets"]) == [
+            "Sheet 1",
+            "Лист1",
+            "Лист номер 2",
+            "Sheet2",
+        ]
+        assert (settings.results_dir / "task-1" / "Sheet 1.md").exists()
+        store_result.assert_called_once_with("task-1", result, "SUCCESS")
+
+    def test_restores_cached_result(self, upload, monkeypatch):
+        monkeypatch.setattr(settings, "result_cache_enabled", True)
+        cached = {"task_id": "task-2", "sheets": {}}
+        with mock.patch.object(
+            result_cache, "restore", return_value=cached
+        ), mock.patch.object(celery_app.backend, "store_result"):
+            result = conversion_service.convert_inline(
+                str(upload), "sample.xlsx", "task-2", file_hash="abc"
+            )
+
+        assert result is cached
+
+    def test_errors_fail_task(self, upload):
+        with mock.patch.object(
+            celery_app.backend, "mark_as_failure"
+        ) as mark_as_failure, pytest.raises(SheetNotFoundError) as error:
+            conversion_service.convert_inline(
+                str(upload), "sample.xlsx", "task-3", sheets=["Missing"]
+            )
+
+        mark_as_failure.assert_called_once_with("task-3", error.value)
+
+    def test_unexpected_errors_fail_task(self, upload):
+        crash = RuntimeError("boom")
+        with mock.patch(
+            "app.services.conversion_service.run_conversion", side_effect=crash
+        ), mock.patch.object(
+            celery_app.backend, "mark_as_failure"
+        ) as mark_as_failure, pytest.raises(ConversionError, match="boom"):
+            conversion_service.convert_inline(str(upload), "sample.xlsx", "task-4")
+
+        mark_as_failure.assert_called_once_with("task-4", crash)
+
+
+
+class FakeRedis:
+    """Async Redis stand-in holding task meta by key."""
+
+    def __init__(self, stored=None):
+        self.stored = stored or {}
+
+    async def get(self, key):
+        return self.stored.get(key)
+
+    async def mget(self, keys):
+        self.mget_calls = getattr(self, "mget_calls", 0) + 1
+        return [self.stored.get(key) for key in keys]
+
+
+def service_with_meta(task_id, status, result):
+    """Build a service whose async client returns the given task meta."""
+    backend = celery_app.backend
+    meta = backend.encode(
+        {"status": status, "result": result, "task_id": task_id, "traceback": None}
+    )
+    service = ConversionService("redis://localhost:6379/1", 2)
+    service._redis = FakeRedis({backend.get_key_for_task(task_id): meta})
+    return service
+
+
+class TestAsyncLookups:
+    """Tests for the non-blocking status and result lookups."""
+
+    def test_unknown_task_is_pending(self):
+        service = ConversionService("redis://localhost:6379/1", 2)
+        service._redis = FakeRedis()
+
+        status = asyncio.run(service.get_task_status_async("missing"))
+
+        assert status["status"] == "PENDING"
+        assert asyncio.run(service.get_task_result_async("missing")) is None
+
+    def test_progress(self):
+        info = {"progress": 40, "message": "Converting", "total_sheets": 3}
+        service = service_with_meta("task-1", "PROGRESS", info)
+
+        status = asyncio.run(service.get_task_status_async("task-1"))
+
+        assert status["progress"] == 40
+        assert status["message"] == "Converting"
+        assert status["total_sheets"] == 3
+
+    def test_started(self):
+        service = service_with_meta("task-1", "STARTED", {"pid": 1})
+
+        status = asyncio.run(service.get_task_status_async("task-1"))
+
+        assert status["status"] == "STARTED"
+        assert status["message"] == "Task started"
+
+    def test_success(self):
+        result = {"task_id": "task-1", "sheets": {}}
+        service = service_with_meta("task-1", "SUCCESS", result)
+
+        status = asyncio.run(service.get_task_status_async("task-1"))
+
+        assert status["progress"] == 100
+        assert status["result"] == result
+        assert asyncio.run(service.get_task_result_async("task-1")) == result
+
+    def test_failure(self):
+        error = celery_app.backend.prepare_exception(EmptyFileError("No data"))
+        service = service_with_meta("task-1", "FAILURE", error)
+
+        status = asyncio.run(service.get_task_status_async("task-1"))
+
+        assert status["status"] == "FAILURE"
+        assert status["error"] == "No data"
+        with pytest.raises(TaskNotFoundError):
+            asyncio.run(service.get_task_result_async("task-1"))
+
+    def test_batch_statuses(self):
+        service = service_with_meta("task-1", "PROGRESS", {"progress": 40})
+
+        statuses = asyncio.run(
+            service.get_task_statuses_async(["task-1", "missing", "task-1"])
+        )
+
+        assert list(statuses) == ["task-1", "missing"]
+        assert statuses["task-1"]["progress"] == 40
+        assert statuses["missing"]["status"] == "PENDING"
+        assert service._redis.mget_calls == 1
@@ -0,0 +1,271 @@
+"""Unit tests for conversion task helpers."""
+
+import gzip
+import shutil
+import zipfile
+from unittest import mock
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.config import settings
+from app.core.exceptions import EmptyFileError
+from app.core.line_index import read_line_window
+from app.services import metrics
+from app.tasks import conversion_tasks
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the commands used by the tasks."""
+
+    def __init__(self):
+        self.values = {}
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "results_dir", tmp_path)
+    monkeypatch.setattr(conversion_tasks, "_redis", FakeRedis())
+    return tmp_path
+
+
+class TestUseSheetFanout:
+    """Tests for the parallel conversion thresholds."""
+
+    @pytest.fixture
+    def workbook(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "parallel_sheets_enabled", True)
+        monkeypatch.setattr(settings, "parallel_sheets_min_count", 4)
+        monkeypatch.setattr(settings, "parallel_sheets_min_mb", 1)
+        path = tmp_path / "book.xlsx"
+        path.write_bytes(b"x" * 1024)
+        return path
+
+    def test_sheet_count_threshold(self, workbook):
+        assert not conversion_tasks._use_sheet_fanout(str(workbook), 3)
+        assert conversion_tasks._use_sheet_fanout(str(workbook), 4)
+
+    def test_size_threshold(self, workbook):
+        workbook.write_bytes(b"x" * 1024 * 1024)
+        assert conversion_tasks._use_sheet_fanout(str(workbook), 2)
+        # A single sheet has nothing to split
+        assert not conversion_tasks._use_sheet_fanout(str(workbook), 1)
+
+    def test_disabled(self, workbook, monkeypatch):
+        monkeypatch.setattr(settings, "parallel_sheets_enabled", False)
+        assert not conversion_tasks._use_sheet_fanout(str(workbook), 10)
+
+
+class TestAssembleConversion:
+    """Tests for the callback of parallel conversions."""
+
+    def run(self, sheet_results, restored=None):
+        task = conversion_tasks.assemble_conversion
+        with mock.patch.object(task, "update_state"):
+            return task.run(
+                sheet_results, "book.xlsx", "task-1", ["A", "B", "C"], restored or {}
+            )
+
+    def test_keeps_workbook_order(self, results_dir):
+        result_dir = results_dir / "task-1"
+        result_dir.mkdir()
+        for name in "ABC":
+            (result_dir / f"{name}.md").write_text(name, encoding="utf-8")
+
+        result = self.run(
+            [
+                {"sheet": "C", "found": True, "result": {"file": "C.md"}},
+                {"sheet": "B", "found": True, "result": None},
+            ],
+            restored={"A": {"file": "A.md"}},
+        )
+
+        assert list(result["sheets"]) == ["A", "C"]
+        assert result["task_id"] == "task-1"
+        assert result["has_zip"]
+
+    def test_all_sheets_empty(self, results_dir):
+        with pytest.raises(EmptyFileError):
+            self.run([{"sheet": "A", "found": False, "result": None}])
+
+
+class TestResultZip:
+    """Tests for the result ZIP of multi-sheet conversions."""
+
+    @pytest.fixture
+    def upload(self, results_dir, tmp_path, sample_xlsx_path, monkeypatch):
+        monkeypatch.setattr(settings, "result_cache_enabled", False)
+        path = tmp_path / "upload.xlsx"
+        shutil.copy(sample_xlsx_path, path)
+        return str(path)
+
+    def test_outputs_written_into_zip(self, upload, results_dir, monkeypatch):
+        monkeypatch.setattr(settings, "zip_compress_level", 0)
+
+        result = conversion_tasks.run_conversion(
+            upload, "sample.xlsx", "task-1", "markdown"
+        )
+
+        assert result["has_zip"]
+        result_dir = results_dir / "task-1"
+        with zipfile.ZipFile(result["zip_path"]) as archive:
+            assert archive.namelist() == [
+                sheet["file"] for sheet in result["sheets"].values()
+            ]
+            for info in archive.infolist():
+                assert info.compress_type == zipfile.ZIP_STORED
+                # Streamed entries may grow past 4 GiB
+                assert info.extract_version >= zipfile.ZIP64_VERSION
+                assert archive.read(info) == (result_dir / info.filename).read_bytes()
+
+    def test_restored_sheets_added_to_zip(self, upload, results_dir):
+        restored = {"Sheet2": {"file": "Sheet2.md", "row_count": 1}}
+        result_dir = results_dir / "task-1"
+        result_dir.mkdir()
+        (result_dir / "Sheet2.md").write_text("| cached |", encoding="utf-8")
+
+        with mock.patch.object(
+            conversion_tasks,
+            "_plan_conversion",
+            return_value=(["Sheet 1", "Sheet2"], restored, {}),
+        ):
+            result = conversion_tasks.run_conversion(
+                upload, "sample.xlsx", "task-1", "markdown"
+            )
+
+        with zipfile.ZipFile(result["zip_path"]) as archive:
+            assert sorted(archive.namelist()) == ["Sheet 1.md", "Sheet2.md"]
+            assert archive.read("Sheet2.md") == b"| cached |"
+
+    def test_single_sheet_has_no_zip(self, upload, results_dir):
+        result = conversion_tasks.run_conversion(
+            upload, "sample.xlsx", "task-1", "markdown", sheets=["Sheet2"]
+        )
+
+        assert not result["has_zip"]
+        assert not (results_dir / "task-1" / "result.zip").exists()
+
+    def test_zip_on_download(self, upload, results_dir, monkeypatch):
+        monkeypatch.setattr(settings, "zip_on_download", True)
+
+        result = conversion_tasks.run_conversion(
+            upload, "sample.xlsx", "task-1", "markdown"
+        )
+
+        assert result["has_zip"]
+        assert result["zip_path"] is None
+        assert not (results_dir / "task-1" / "result.zip").exists()
+
+
+class TestPrecompress:
+    """Tests for pre-compressed copies of sheet outputs."""
+
+    @pytest.fixture
+    def upload(self, results_dir, tmp_path, sample_xlsx_path, monkeypatch):
+        monkeypatch.setattr(settings, "result_cache_enabled", False)
+        path = tmp_path / "upload.xlsx"
+        shutil.copy(sample_xlsx_path, path)
+        return str(path)
+
+    def test_gzip_copies(self, upload, results_dir, monkeypatch):
+        monkeypatch.setattr(settings, "result_precompress", ["gzip"])
+
+        result = conversion_tasks.run_conversion(
+            upload, "sample.xlsx", "task-1", "markdown"
+        )
+
+        result_dir = results_dir / "task-1"
+        for sheet in result["sheets"].values():
+            plain = (result_dir / sheet["file"]).read_bytes()
+            copy = result_dir / f"{sheet['file']}.gz"
+            assert gzip.decompress(copy.read_bytes()) == plain
+        assert not list(result_dir.glob("*.br"))
+
+    def test_disabled_by_default(self, upload, results_dir):
+        conversion_tasks.run_conversion(upload, "sample.xlsx", "task-1", "markdown")
+
+        assert not list((results_dir / "task-1").glob("*.gz"))
+
+
+class TestLineIndexes:
+    """Tests for the line indexes written with sheet outputs."""
+
+    @pytest.mark.parametrize("output_format", ["markdown", "json", "ndjson"])
+    def test_index_matches_output(
+        self, results_dir, tmp_path, sample_xlsx_path, monkeypatch, output_format
+    ):
+        monkeypatch.setattr(settings, "result_cache_enabled", False)
+        path = tmp_path / "upload.xlsx"
+        shutil.copy(sample_xlsx_path, path)
+
+        result = conversion_tasks.run_conversion(
+            str(path), "sample.xlsx", "task-1", output_format
+        )
+
+        for sheet in result["sheets"].values():
+            output = results_dir / "task-1" / sheet["file"]
+            lines = output.read_text(encoding="utf-8").splitlines(keepends=True)
+            assert read_line_window(output, 1, 2) == (
+                "".join(lines[1:3]),
+                len(lines) > 3,
+                len(lines),
+            )
+
+
+class TestSheetManifest:
+    """Tests for the sheet manifests kept in the result backend."""
+
+    def test_no_content(self, results_dir, tmp_path, sample_xlsx_path, monkeypatch):
+        monkeypatch.setattr(settings, "result_cache_enabled", False)
+        path = tmp_path / "upload.xlsx"
+        shutil.copy(sample_xlsx_path, path)
+
+        result = conversion_tasks.run_conversion(
+            str(path), "sample.xlsx", "task-1", "markdown"
+        )
+
+        for sheet in result["sheets"].values():
+            text = (results_dir / "task-1" / sheet["file"]).read_text(encoding="utf-8")
+            assert sheet["line_count"] == len(text.splitlines())
+            assert "preview" not in sheet
+            assert "content" not in sheet
+
+
+class TestConversionMetrics:
+    """Tests for the metrics recorded while converting."""
+
+    def test_stages_and_throughput(
+        self, results_dir, tmp_path, sample_xlsx_path, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "result_cache_enabled", False)
+        path = tmp_path / "upload.xlsx"
+        shutil.copy(sample_xlsx_path, path)
+        observed = []
+
+        def observe(timer, total=None):
+            observed.append((dict(timer.seconds), total))
+
+        monkeypatch.setattr(metrics.StageTimer, "observe", observe)
+
+        result = conversion_tasks.run_conversion(
+            str(path), "sample.xlsx", "task-1", "json"
+        )
+
+        def sample(name):
+            return REGISTRY.get_sample_value(name, {"format": "json"}) or 0.0
+
+        # One timer per sheet, then one for the ZIP of the workbook
+        sheet_timers = observed[: len(result["sheets"])]
+        for seconds, total in sheet_timers:
+            assert {"read", "write"} <= set(seconds)
+            assert total > 0
+        assert "zip" in observed[-1][0]
+        assert sample("excel2md_conversion_cells_per_second_count") >= len(
+            result["sheets"]
+        )
+        assert sample("excel2md_result_file_bytes_sum") >= sum(
+            sheet["size"] for sheet in result["sheets"].values()
+        )
@@ -1,13 +1,27 @@
 """Unit tests for excel reader module."""
 
+import types
+from datetime import datetime, time
+
 import pytest
 from io import BytesIO
 
 from app.core.excel_reader import (
     detect_excel_format,
     get_excel_data,
+    get_excel_data_from_path,
+    inspect_workbook,
+    iter_excel_sheets,
+    iter_excel_sheets_from_path,
+    parse_cell_range,
+    sheet_fingerprints,
+)
+from app.core.exceptions import (
+    EmptyFileError,
+    InvalidFileFormatError,
+    InvalidRangeError,
+    SheetNotFoundError,
 )
-from app.core.exceptions import InvalidFileFormatError
 
 
 class TestDetectExcelFormat:
@@ -56,3 +70,309 @@ class TestGetExcelData:
         """Test that unsupported extension raises error."""
         with pytest.raises(InvalidFileFormatError):
             get_excel_data(b"content", "test.csv")
+
+
+class TestIterExcelSheets:
+    """Tests for the streaming iter_excel_sheets API."""
+
+    @pytest.mark.parametrize("fixture_name", ["sample_xlsx_path", "sample_xls_path"])
+    def test_matches_get_excel_data(self, fixture_name, request):
+        path = request.getfixturevalue(fixture_name)
+        expected = get_excel_data_from_path(str(path))
+
+        streamed = [
+            {
+                "sheetname": sheet["sheetname"],
+                "headers": sheet["headers"],
+                "data": list(sheet["rows"]),
+            }
+            for sheet in iter_excel_sheets_from_path(str(path))
+        ]
+
+        assert streamed == expected
+
+    def test_rows_are_lazy(self, sample_xlsx_path):
+        sheets = iter_excel_sheets(sample_xlsx_path.read_bytes(), "sample.xlsx")
+        sheet = next(sheets)
+        assert isinstance(sheet["rows"], types.GeneratorType)
+        assert sheet["headers"] == ["Header1", "", "Header 2", "Header №4", ""]
+        assert sheet["column_count"] == 5
+        sheets.close()
+
+    def test_without_headers(self, sample_xlsx_path):
+        with open(sample_xlsx_path, "rb") as f:
+            sheets = iter_excel_sheets(f, "sample.xlsx", use_headers=False)
+            sheet = next(sheets)
+            rows = list(sheet["rows"])
+        assert sheet["headers"] == []
+        assert rows[0] == ["Header1", "", "Header 2", "Header №4", ""]
+        assert all(len(row) == sheet["column_count"] for row in rows)
+
+    def test_invalid_file_content(self):
+        with pytest.raises(InvalidFileFormatError):
+            next(iter_excel_sheets(b"not excel content", "test.xlsx"))
+
+    def test_corrupt_xls(self, corrupt_xls):
+        with pytest.raises(InvalidFileFormatError):
+            next(iter_excel_sheets(corrupt_xls, "broken.xls"))
+
+
+class TestXlsxColumnTrimming:
+    """Tests for trailing-column handling of .xlsx sheets."""
+
+    @pytest.fixture
+    def padded_xlsx(self) -> bytes:
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["a", "b", None, "d"])
+        sheet.append([1, 2])
+        # Styled but empty cell widens the declared dimension to column H
+        sheet.cell(row=3, column=8).font = Font(bold=True)
+        buffer = BytesIO()
+        workbook.save(buffer)
+        return buffer.getvalue()
+
+    def test_read_trims_trailing_columns(self, padded_xlsx):
+        sheet = get_excel_data(padded_xlsx, "padded.xlsx")[0]
+        assert sheet["headers"] == ["a", "b", "", "d"]
+        assert sheet["data"] == [[1, 2, "", ""], ["", "", "", ""]]
+
+    @pytest.mark.parametrize("engine", ["openpyxl", "fast"])
+    def test_stream_matches_read(self, padded_xlsx, engine):
+        expected = get_excel_data(padded_xlsx, "padded.xlsx")
+        sheet = next(iter_excel_sheets(padded_xlsx, "padded.xlsx", xlsx_engine=engine))
+
+        assert sheet["column_count"] == 4
+        assert [
+            {
+                "sheetname": sheet["sheetname"],
+                "headers": sheet["headers"],
+                "data": list(sheet["rows"]),
+            }
+        ] == expected
+
+    @pytest.mark.parametrize("engine", ["openpyxl", "fast"])
+    def test_formatted_only_sheet_has_no_data(self, engine):
+        from openpyxl import Workbook
+        from openpyxl.styles import PatternFill
+
+        workbook = Workbook()
+        workbook.active["A1"] = "a"
+        blank = workbook.create_sheet("Blank")
+        for cell in ("B2", "J5"):
+            blank[cell].fill = PatternFill("solid", fgColor="FFFF00")
+        buffer = BytesIO()
+        workbook.save(buffer)
+
+        sheets = iter_excel_sheets(buffer.getvalue(), "book.xlsx", xlsx_engine=engine)
+
+        assert [sheet["sheetname"] for sheet in sheets] == ["Sheet"]
+
+
+class TestXlsDates:
+    """Tests for typed date conversion in the .xls reader."""
+
+    @pytest.fixture
+    def dated_xls(self) -> bytes:
+        xlwt = pytest.importorskip("xlwt")
+
+        workbook = xlwt.Workbook()
+        sheet = workbook.add_sheet("Dates")
+        date_style = xlwt.easyxf(num_format_str="YYYY-MM-DD")
+        time_style = xlwt.easyxf(num_format_str="HH:MM")
+        sheet.write(0, 0, "When")
+        sheet.write(0, 1, "Amount")
+        sheet.write(0, 2, "At")
+        sheet.write(1, 0, datetime(2024, 3, 15), date_style)
+        sheet.write(1, 1, 10.5)
+        sheet.write(1, 2, time(9, 30), time_style)
+        sheet.write(2, 0, "n/a")
+        sheet.write(2, 1, 2)
+        buffer = BytesIO()
+        workbook.save(buffer)
+        return buffer.getvalue()
+
+    def test_date_columns_converted(self, dated_xls):
+        sheet = get_excel_data(dated_xls, "dates.xls")[0]
+        assert sheet["headers"] == ["When", "Amount", "At"]
+        assert sheet["data"] == [
+            [datetime(2024, 3, 15), 10.5, time(9, 30)],
+            ["n/a", 2.0, ""],
+        ]
+
+
+class TestSheetSelection:
+    """Tests for selective sheet and cell-range loading."""
+
+    @pytest.fixture(params=["xlsx", "xlsx-fast", "xls"])
+    def load(self, request, sample_xlsx_path, sample_xls_path):
+        path = sample_xls_path if request.param == "xls" else sample_xlsx_path
+        engine = "fast" if request.param == "xlsx-fast" else "openpyxl"
+
+        def run(**kwargs):
+            return get_excel_data_from_path(str(path), xlsx_engine=engine, **kwargs)
+
+        return run
+
+    def test_select_by_name(self, load):
+        sheets = load(sheets=["Sheet2"])
+        assert [sheet["sheetname"] for sheet in sheets] == ["Sheet2"]
+
+    def test_select_by_index_keeps_workbook_order(self, load):
+        sheets = load(sheet_indices=[3, 0])
+        assert [sheet["sheetname"] for sheet in sheets] == ["Sheet 1", "Sheet2"]
+
+    def test_names_and_indices_combined(self, load):
+        sheets = load(sheets=["Sheet2"], sheet_indices=[1])
+        assert [sheet["sheetname"] for sheet in sheets] == ["Лист1", "Sheet2"]
+
+    def test_unknown_sheet(self, load):
+        with pytest.raises(SheetNotFoundError):
+            load(sheets=["Missing"])
+
+    def test_index_out_of_range(self, load):
+        with pytest.raises(SheetNotFoundError):
+            load(sheet_indices=[10])
+
+    def test_cell_range(self, load):
+        sheet = load(sheet_indices=[0], cell_range="C1:D3")[0]
+        assert sheet["headers"] == ["Header 2", "Header №4"]
+        assert sheet["data"] == [[23, 24], [33, 34]]
+
+    def test_column_range(self, load):
+        sheet = load(sheets=["Sheet2"], cell_range="B:B")[0]
+        assert sheet["headers"] == ["Header 2"]
+        assert sheet["data"] == [[23], [33]]
+
+    def test_range_outside_data(self, load):
+        with pytest.raises(EmptyFileError):
+            load(sheets=["Sheet2"], cell_range="A10:B12")
+
+    def test_streaming_range(self, sample_xlsx_path):
+        sheets = iter_excel_sheets_from_path(
+            str(sample_xlsx_path), sheets=["Sheet 1"], cell_range="B2:E4"
+        )
+        sheet = next(sheets)
+        assert sheet["headers"] == ["22", "23", "24", ""]
+        assert sheet["column_count"] == 4
+        assert list(sheet["rows"]) == [[32, 33, 34, 35], ["", 43, "", ""]]
+        assert list(sheets) == []
+
+
+class TestParseCellRange:
+    """Tests for parse_cell_range function."""
+
+    def test_none_is_full_sheet(self):
+        assert parse_cell_range(None) == (1, 1, None, None)
+
+    def test_cell_range(self):
+        assert parse_cell_range("b2:d100") == (2, 2, 4, 100)
+
+    def test_row_range(self):
+        assert parse_cell_range("2:10") == (1, 2, None, 10)
+
+    def test_invalid_range(self):
+        with pytest.raises(InvalidRangeError):
+            parse_cell_range("not a range")
+
+
+class TestInspectWorkbook:
+    """Tests for inspect_workbook function."""
+
+    @pytest.mark.parametrize("fixture", ["sample_xlsx_path", "sample_xls_path"])
+    def test_lists_sheets_with_dimensions(self, fixture, request):
+        path = request.getfixturevalue(fixture)
+        info = inspect_workbook(path.read_bytes(), path.name)
+
+        assert info["format"] == path.suffix.lstrip(".")
+        assert [sheet["name"] for sheet in info["sheets"]] == [
+            "Sheet 1",
+            "Лист1",
+            "Лист номер 2",
+            "Sheet2",
+        ]
+        first = info["sheets"][0]
+        assert first["index"] == 0
+        assert first["dimension"] == "A1:E4"
+        assert first["row_count"] == 4
+        assert first["column_count"] == 5
+        assert first["estimated_cells"] == 20
+        assert info["estimated_cells"] == sum(
+            sheet["estimated_cells"] or 0 for sheet in info["sheets"]
+        )
+
+    def test_accepts_file_object(self, sample_xls_path):
+        with open(sample_xls_path, "rb") as f:
+            info = inspect_workbook(f, "sample.xls")
+        assert len(info["sheets"]) == 4
+
+    def test_invalid_content(self):
+        with pytest.raises(InvalidFileFormatError):
+            inspect_workbook(b"not an excel file", "test.xlsx")
+
+    def test_corrupt_xls(self, corrupt_xls):
+        with pytest.raises(InvalidFileFormatError):
+            inspect_workbook(corrupt_xls, "broken.xls")
+
+    def test_corrupt_xlsx(self, corrupt_xlsx):
+        with pytest.raises(InvalidFileFormatError):
+            inspect_workbook(corrupt_xlsx, "broken.xlsx")
+
+
+
+class TestSheetFingerprints:
+    """Tests for sheet_fingerprints function."""
+
+    @staticmethod
+    def make_workbook(file_format: str, value: float) -> bytes:
+        """Two-sheet workbook where only the value in sheet "A" varies."""
+        buffer = BytesIO()
+        if file_format == "xls":
+            xlwt = pytest.importorskip("xlwt")
+
+            workbook = xlwt.Workbook()
+            for name, number in (("A", value), ("B", 5)):
+                sheet = workbook.add_sheet(name)
+                sheet.write(0, 0, "x")
+                sheet.write(1, 0, number)
+        else:
+            from openpyxl import Workbook
+
+            workbook = Workbook()
+            workbook.active.title = "A"
+            workbook.create_sheet("B")
+            for name, number in (("A", value), ("B", 5)):
+                workbook[name].append(["x"])
+                workbook[name].append([number])
+        workbook.save(buffer)
+        return buffer.getvalue()
+
+    @pytest.mark.parametrize("fixture", ["sample_xlsx_path", "sample_xls_path"])
+    def test_one_fingerprint_per_sheet(self, fixture, request):
+        path = request.getfixturevalue(fixture)
+        fingerprints = sheet_fingerprints(path.read_bytes(), path.name)
+
+        assert list(fingerprints) == ["Sheet 1", "Лист1", "Лист номер 2", "Sheet2"]
+        assert len(set(fingerprints.values())) == 4
+        with open(path, "rb") as f:
+            assert sheet_fingerprints(f, path.name) == fingerprints
+
+    @pytest.mark.parametrize("file_format", ["xlsx", "xls"])
+    def test_only_edited_sheet_changes(self, file_format):
+        filename = f"book.{file_format}"
+        before = sheet_fingerprints(self.make_workbook(file_format, 1), filename)
+        after = sheet_fingerprints(self.make_workbook(file_format, 2), filename)
+
+        assert before["A"] != after["A"]
+        assert before["B"] == after["B"]
+
+    def test_invalid_content(self):
+        with pytest.raises(InvalidFileFormatError):
+            sheet_fingerprints(b"not an excel file", "test.xls")
+
+    def test_corrupt_xls(self, corrupt_xls):
+        with pytest.raises(InvalidFileFormatError):
+            sheet_fingerprints(corrupt_xls, "broken.xls")
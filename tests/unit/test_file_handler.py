@@ -0,0 +1,171 @@
+"""Unit tests for file handler service."""
+
+import asyncio
+import hashlib
+import struct
+from io import BytesIO
+
+import pytest
+from fastapi import UploadFile
+
+from app.config import settings
+from app.core.exceptions import FileTooLargeError
+from app.core.line_index import index_path
+from app.services import file_handler as file_handler_module
+from app.services.file_handler import file_handler
+
+
+@pytest.fixture
+def result_file(tmp_path, monkeypatch):
+    """Store a five-line result file for task "task" and return its name."""
+    monkeypatch.setattr(settings, "results_dir", tmp_path)
+    (tmp_path / "task").mkdir()
+    (tmp_path / "task" / "Sheet.md").write_text(
+        "|A|\n|-|\n|1|\n|2|\n|3|", encoding="utf-8"
+    )
+    return "Sheet.md"
+
+
+class TestReadResultText:
+    """Tests for FileHandler.read_result_text."""
+
+    def test_whole_file(self, result_file):
+        text, has_more = file_handler.read_result_text("task", result_file)
+        assert text == "|A|\n|-|\n|1|\n|2|\n|3|"
+        assert has_more is False
+
+    def test_window(self, result_file):
+        text, has_more = file_handler.read_result_text("task", result_file, 2, 2)
+        assert text == "|1|\n|2|\n"
+        assert has_more is True
+
+    def test_last_window(self, result_file):
+        text, has_more = file_handler.read_result_text("task", result_file, 3, 2)
+        assert text == "|2|\n|3|"
+        assert has_more is False
+
+    def test_missing_file(self, result_file):
+        with pytest.raises(FileNotFoundError):
+            file_handler.read_result_text("task", "Other.md")
+
+
+class TestReadResultWindow:
+    """Tests for FileHandler.read_result_window."""
+
+    def test_without_index(self, result_file):
+        window = file_handler.read_result_window("task", result_file, 1, 2)
+        assert window == ("|-|\n|1|\n", True, None)
+
+    def test_with_index(self, tmp_path, result_file):
+        path = tmp_path / "task" / result_file
+        offsets = [0, 4, 8, 12, 16, 19]
+        index_path(path).write_bytes(struct.pack(f"<{len(offsets)}Q", *offsets))
+
+        window = file_handler.read_result_window("task", result_file, 3, 5)
+        assert window == ("|2|\n|3|", False, 5)
+
+
+class TestReadResultPreview:
+    """Tests for FileHandler.read_result_preview."""
+
+    def test_first_lines(self, result_file, monkeypatch):
+        monkeypatch.setattr(settings, "preview_lines", 2)
+        preview = file_handler.read_result_preview("task", result_file)
+        assert preview == ("|A|\n|-|\n", 2, True, False)
+
+    def test_whole_file(self, result_file):
+        preview = file_handler.read_result_preview("task", result_file)
+        assert preview == ("|A|\n|-|\n|1|\n|2|\n|3|", 5, False, False)
+
+    def test_size_bound_keeps_whole_lines(self, result_file, monkeypatch):
+        monkeypatch.setattr(file_handler_module, "PREVIEW_MAX_CHARS", 10)
+        preview = file_handler.read_result_preview("task", result_file)
+        assert preview == ("|A|\n|-|\n", 2, True, False)
+
+    def test_long_first_line_truncated(self, result_file, monkeypatch):
+        monkeypatch.setattr(file_handler_module, "PREVIEW_MAX_CHARS", 2)
+        preview = file_handler.read_result_preview("task", result_file)
+        assert preview == ("|A", 0, True, True)
+
+    def test_long_single_line(self, tmp_path, result_file, monkeypatch):
+        monkeypatch.setattr(file_handler_module, "PREVIEW_MAX_CHARS", 2)
+        (tmp_path / "task" / result_file).write_text("|ABC|", encoding="utf-8")
+        preview = file_handler.read_result_preview("task", result_file)
+        assert preview == ("|A", 0, True, True)
+
+
+class TestNegotiateEncoding:
+    """Tests for FileHandler.negotiate_encoding."""
+
+    @pytest.fixture
+    def path(self, tmp_path, result_file):
+        path = tmp_path / "task" / result_file
+        for suffix in (".gz", ".br"):
+            path.with_name(path.name + suffix).write_bytes(b"compressed")
+        return path
+
+    def test_prefers_brotli(self, path):
+        assert file_handler.negotiate_encoding(path, "gzip, deflate, br") == "br"
+
+    def test_quality_values(self, path):
+        assert file_handler.negotiate_encoding(path, "br;q=0.5, gzip") == "gzip"
+        assert file_handler.negotiate_encoding(path, "gzip;q=0, br;q=0") is None
+        assert file_handler.negotiate_encoding(path, "*;q=0.1") == "br"
+
+    def test_only_existing_copies(self, path):
+        path.with_name(path.name + ".br").unlink()
+        assert file_handler.negotiate_encoding(path, "br, gzip") == "gzip"
+
+    def test_not_accepted(self, path):
+        assert file_handler.negotiate_encoding(path, None) is None
+        assert file_handler.negotiate_encoding(path, "identity") is None
+
+
+class TestEtag:
+    """Tests for FileHandler.make_etag and etag_matches."""
+
+    def test_digest_and_encoding(self, tmp_path, result_file):
+        path = tmp_path / "task" / result_file
+        digest = "ab" * 32
+
+        assert file_handler.make_etag(path, digest) == f'"{"ab" * 16}"'
+        assert file_handler.make_etag(path, digest, "gzip") == f'"{"ab" * 16}-gzip"'
+        # Falls back to mtime and size
+        assert file_handler.make_etag(path) == file_handler.make_etag(path)
+
+    def test_matches(self):
+        assert file_handler.etag_matches('"a", "b"', '"b"')
+        assert file_handler.etag_matches('W/"b"', '"b"')
+        assert file_handler.etag_matches("*", '"b"')
+        assert not file_handler.etag_matches('"b-gzip"', '"b"')
+        assert not file_handler.etag_matches(None, '"b"')
+
+
+class TestSaveUpload:
+    """Tests for FileHandler.save_upload."""
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "uploads_dir", tmp_path)
+        monkeypatch.setattr(file_handler_module, "UPLOAD_CHUNK_SIZE", 4)
+
+    def save(self, data):
+        upload = UploadFile(file=BytesIO(data), filename="data.xlsx")
+        return asyncio.run(file_handler.save_upload(upload, "task"))
+
+    def test_saves_file_and_hash(self, tmp_path):
+        data = b"0123456789" * 3
+        file_path, filename, sha256 = self.save(data)
+
+        assert file_path == tmp_path / "task" / "data.xlsx"
+        assert file_path.read_bytes() == data
+        assert filename == "data.xlsx"
+        assert sha256 == hashlib.sha256(data).hexdigest()
+        assert [p.name for p in (tmp_path / "task").iterdir()] == ["data.xlsx"]
+
+    def test_too_large_aborts_and_cleans_up(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "max_file_size_mb", 0)
+
+        with pytest.raises(FileTooLargeError):
+            self.save(b"0123456789")
+        assert list((tmp_path / "task").iterdir()) == []
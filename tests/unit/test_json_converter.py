@@ -0,0 +1,78 @@
+"""Unit tests for JSON converter module."""
+
+import json
+from datetime import datetime
+from io import StringIO
+
+import pytest
+
+from app.core.json_converter import (
+    iter_json_records,
+    write_json_records,
+    write_ndjson_records,
+)
+
+
+class TestIterJsonRecords:
+    """Tests for iter_json_records function."""
+
+    def test_records_keyed_by_header(self):
+        records = list(iter_json_records(["a", "b"], [[1, 2], [3, 4]]))
+        assert records == [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+
+    def test_empty_header_gets_column_name(self):
+        records = list(iter_json_records(["a", ""], [[1, 2]]))
+        assert records == [{"a": 1, "column_1": 2}]
+
+    def test_short_rows_padded_with_none(self):
+        records = list(iter_json_records(["a", "b"], [[1]]))
+        assert records == [{"a": 1, "b": None}]
+
+    def test_without_headers_rows_are_lists(self):
+        assert list(iter_json_records([], [[1, 2]])) == [[1, 2]]
+
+
+class TestWriteJsonRecords:
+    """Tests for write_json_records function."""
+
+    @pytest.mark.parametrize(
+        "headers, rows",
+        [
+            (["Name", "When"], [["Ünï", datetime(2024, 1, 2)], ["x\ny", None]]),
+            (["Name"], []),
+            ([], [[1, "a"], [2.5, None]]),
+            ([], []),
+        ],
+    )
+    def test_matches_json_dumps(self, headers, rows):
+        fp = StringIO()
+        row_count = write_json_records(headers, iter(rows), fp, buffer_rows=1)
+
+        expected = json.dumps(
+            list(iter_json_records(headers, rows)),
+            ensure_ascii=False,
+            indent=2,
+            default=str,
+        )
+        assert fp.getvalue() == expected
+        assert row_count == len(rows)
+
+
+class TestWriteNdjsonRecords:
+    """Tests for write_ndjson_records function."""
+
+    def test_one_compact_record_per_line(self):
+        fp = StringIO()
+        rows = [["Ünï", 1], ["x\ny", datetime(2024, 1, 2)]]
+        row_count = write_ndjson_records(["a", "b"], iter(rows), fp, buffer_rows=1)
+
+        lines = fp.getvalue().splitlines()
+        assert row_count == 2
+        assert lines[0] == '{"a":"Ünï","b":1}'
+        assert json.loads(lines[1]) == {"a": "x\ny", "b": "2024-01-02 00:00:00"}
+        assert fp.getvalue().endswith("\n")
+
+    def test_empty_sheet_writes_nothing(self):
+        fp = StringIO()
+        assert write_ndjson_records(["a"], iter([]), fp) == 0
+        assert fp.getvalue() == ""
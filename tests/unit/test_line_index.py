@@ -0,0 +1,68 @@
+"""Unit tests for line indexes of result files."""
+
+import io
+
+import pytest
+
+from app.core.line_index import LineIndexWriter, index_path, read_line_window
+
+
+def write_indexed(path, chunks):
+    with open(path, "wb") as fp, open(index_path(path), "wb") as index:
+        writer = LineIndexWriter(fp, index)
+        for chunk in chunks:
+            writer.write(chunk)
+        writer.finish()
+
+
+def expected_window(path, offset, limit):
+    with open(path, encoding="utf-8", newline="") as f:
+        lines = list(f)
+    end = len(lines) if limit is None else offset + limit
+    return "".join(lines[offset:end]), end < len(lines), len(lines)
+
+
+class TestLineIndex:
+    """Tests for LineIndexWriter and read_line_window."""
+
+    @pytest.fixture
+    def indexed(self, tmp_path):
+        path = tmp_path / "Лист1.md"
+        # Lines split across writes, multi-byte characters, no final newline
+        write_indexed(path, ["| Имя |\n| --", "- |\n", "| ä", "ö |\n| 2 |\n| 3 |"])
+        return path
+
+    @pytest.mark.parametrize(
+        "offset, limit",
+        [(0, None), (0, 2), (1, 2), (2, 1), (4, 1), (3, 10), (4, None), (9, 2)],
+    )
+    def test_windows_match_scan(self, indexed, offset, limit):
+        assert read_line_window(indexed, offset, limit) == expected_window(
+            indexed, offset, limit
+        )
+
+    def test_trailing_newline(self, tmp_path):
+        path = tmp_path / "a.ndjson"
+        write_indexed(path, ['{"a": 1}\n{"a": 2}\n'])
+
+        assert read_line_window(path, 1, 5) == ('{"a": 2}\n', False, 2)
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.md"
+        write_indexed(path, [])
+
+        assert read_line_window(path) == ("", False, 0)
+
+    def test_missing_or_unfinished_index(self, tmp_path):
+        path = tmp_path / "plain.md"
+        path.write_text("|A|\n", encoding="utf-8")
+        assert read_line_window(path) is None
+
+        index_path(path).write_bytes(b"")
+        assert read_line_window(path) is None
+
+    def test_passes_encoded_text_on(self):
+        fp = io.BytesIO()
+        writer = LineIndexWriter(fp, io.BytesIO())
+        assert writer.write("äb\nc") == 4
+        assert fp.getvalue() == "äb\nc".encode("utf-8")
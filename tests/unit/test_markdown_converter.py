@@ -1,12 +1,18 @@
 """Unit tests for markdown converter module."""
 
+import tracemalloc
+from datetime import time
+from io import StringIO
+
 import pytest
 
 from app.core.markdown_converter import (
+    CellFormatter,
     escape_markdown_cell,
     get_markdown_table,
     get_markdown_data,
     convert_sheet_to_markdown,
+    write_markdown_table,
 )
 
 
@@ -31,6 +37,54 @@ class TestEscapeMarkdownCell:
     def test_float_value(self):
         assert escape_markdown_cell(3.14) == "3.14"
 
+    def test_integral_float_value(self):
+        assert escape_markdown_cell(1.0) == "1"
+        assert escape_markdown_cell(-20.0) == "-20"
+
+    def test_huge_float_keeps_exponent(self):
+        assert escape_markdown_cell(1e20) == "1e+20"
+
+    def test_bool_value(self):
+        assert escape_markdown_cell(True) == "True"
+
+    def test_other_types_are_escaped(self):
+        assert escape_markdown_cell(time(12, 30)) == "12:30:00"
+
+
+class TestCellFormatter:
+    """Tests for CellFormatter class."""
+
+    def test_row_formats_by_type(self):
+        formatter = CellFormatter()
+        row = ["a|b", 1, 2.0, 2.5, None, True, "x\ny"]
+        assert formatter.row(row) == "|a\\|b|1|2|2.5||True|x<br>y|"
+
+    def test_float_int_and_bool_kept_apart(self):
+        formatter = CellFormatter()
+        assert formatter.row([1.0, 1, True, 1.0]) == "|1|1|True|1|"
+
+    def test_repeated_floats_cached(self):
+        formatter = CellFormatter()
+        assert formatter.row([3.0, 0.5, 3.0]) == "|3|0.5|3|"
+        # Only integral floats are cached
+        assert formatter._floats == {3.0: "3"}
+
+    def test_cache_is_bounded(self):
+        formatter = CellFormatter(max_entries=2)
+        assert formatter.row([1.0, 2.0, 1.0, 1.0, 2.0, 3.0]) == "|1|2|1|1|2|3|"
+        assert formatter._floats == {1.0: "1", 2.0: "2"}
+
+    def test_cache_dropped_when_values_never_repeat(self):
+        formatter = CellFormatter(max_entries=2)
+        assert formatter.row([1.0, 2.0, 3.0]) == "|1|2|3|"
+        assert formatter._floats is None
+        assert formatter.row([4.0, 0.5]) == "|4|0.5|"
+
+    def test_float_edge_cases(self):
+        formatter = CellFormatter()
+        values = [-0.0, -2.0, 1e16, 1e20, float("nan"), float("inf")]
+        assert formatter.row(values) == "|0|-2|1e+16|1e+20|nan|inf|"
+
 
 class TestGetMarkdownTable:
     """Tests for get_markdown_table function."""
@@ -76,6 +130,18 @@ class TestGetMarkdownTable:
         result = get_markdown_table(headers, data)
         assert "<br>" in result
 
+    def test_escaping_only_touches_affected_cells(self):
+        data = [["a|b", None, 1, "c\nd"], ["plain", "", 2.5, None]]
+        result = get_markdown_table(["H1", "H2", "H3", "H4"], data)
+        assert result.splitlines()[2:] == [
+            "|a\\|b||1|c<br>d|",
+            "|plain||2.5||",
+        ]
+
+    def test_ragged_rows_without_headers(self):
+        result = get_markdown_table([], [[1], [1, 2, 3], []])
+        assert result == "| | | |\n|-|-|-|\n|1|\n|1|2|3|\n||"
+
 
 class TestGetMarkdownData:
     """Tests for get_markdown_data function."""
@@ -152,3 +218,65 @@ class TestConvertSheetToMarkdown:
         result = convert_sheet_to_markdown(sample_sheet_data_no_headers)
         assert "| | |" in result
         assert "|1|2|" in result
+
+
+class _CountingSink:
+    """Writable text stream that only counts characters."""
+
+    def __init__(self):
+        self.size = 0
+        self.writes = 0
+
+    def write(self, text):
+        self.size += len(text)
+        self.writes += 1
+        return len(text)
+
+
+class TestWriteMarkdownTable:
+    """Tests for write_markdown_table function."""
+
+    @pytest.mark.parametrize(
+        "headers, data",
+        [
+            (["Col1", "Col2"], [["a|b", 1], [None, "x\ny"]]),
+            (["Col1", "Col2"], []),
+            ([], [[1, 2], [3]]),
+            (None, []),
+        ],
+    )
+    def test_matches_get_markdown_table(self, headers, data):
+        fp = StringIO()
+        column_count = max(map(len, data), default=0)
+        row_count = write_markdown_table(
+            headers, iter(data), fp, column_count=column_count, buffer_rows=1
+        )
+        assert fp.getvalue() == get_markdown_table(headers, data)
+        assert row_count == len(data)
+
+    def test_requires_column_count_without_headers(self):
+        with pytest.raises(ValueError):
+            write_markdown_table(None, iter([[1]]), StringIO())
+
+    def test_flushes_in_chunks(self):
+        sink = _CountingSink()
+        write_markdown_table(["A"], ([i] for i in range(10)), sink, buffer_rows=4)
+        assert sink.writes == 3
+
+    def test_memory_stays_bounded(self):
+        """Peak memory must stay far below the size of the rendered table."""
+        rows = (
+            [r, r + 0.25, f"text {r}", None, "a" if r % 100 else "a|b"] * 2
+            for r in range(50_000)
+        )
+        sink = _CountingSink()
+
+        tracemalloc.start()
+        try:
+            write_markdown_table([f"H{c}" for c in range(10)], rows, sink)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert sink.size > 2 * 1024 * 1024
+        assert peak < 512 * 1024
@@ -0,0 +1,117 @@
+"""Unit tests for Prometheus metrics."""
+
+import io
+import time
+from unittest import mock
+
+import pytest
+import redis
+from prometheus_client import REGISTRY
+
+from app.services import metrics
+from app.services.metrics import StageTimer
+
+
+def _stage_count(stage: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "excel2md_conversion_stage_seconds_count", {"stage": stage}
+    )
+    return value or 0.0
+
+
+class TestStageTimer:
+    """Tests for StageTimer."""
+
+    def test_timed_rows(self):
+        timer = StageTimer()
+
+        def slow_rows():
+            for row in range(3):
+                time.sleep(0.01)
+                yield row
+
+        assert list(timer.timed_rows(slow_rows())) == [0, 1, 2]
+        assert timer.seconds["read"] >= 0.03
+
+    def test_timed_writer(self):
+        timer = StageTimer()
+        fp = io.StringIO()
+
+        writer = timer.timed_writer(fp, "write")
+
+        assert writer.write("abc") == 3
+        assert fp.getvalue() == "abc"
+        assert timer.seconds["write"] > 0
+
+    def test_stage(self):
+        timer = StageTimer()
+        with pytest.raises(ValueError):
+            with timer.stage("zip"):
+                time.sleep(0.01)
+                raise ValueError
+
+        assert timer.seconds["zip"] >= 0.01
+
+    def test_observe_records_remainder_as_render(self):
+        timer = StageTimer()
+        timer.seconds["read"] = 0.5
+        timer.seconds["write"] = 0.25
+        before = {stage: _stage_count(stage) for stage in ("read", "write", "render")}
+
+        timer.observe(total=1.0)
+
+        assert timer.seconds["render"] == pytest.approx(0.25)
+        for stage, count in before.items():
+            assert _stage_count(stage) == count + 1
+
+    def test_observe_without_total(self):
+        timer = StageTimer()
+        timer.seconds["zip"] = 0.1
+
+        timer.observe()
+
+        assert "render" not in timer.seconds
+
+
+class TestCollectMetrics:
+    """Tests for the /metrics output."""
+
+    @pytest.fixture
+    def backend(self, monkeypatch):
+        client = mock.Mock()
+        client.llen.return_value = 7
+        monkeypatch.setattr(metrics._backend_collector, "_redis", client)
+        stats = {"hits": 3, "misses": 1, "sheet_hits": 5, "sheet_misses": 2}
+        monkeypatch.setattr(metrics.result_cache, "stats", lambda: stats)
+        return client
+
+    def test_includes_backend_metrics(self, backend):
+        text = metrics.collect_metrics().decode()
+
+        assert 'excel2md_queue_depth{queue="celery"} 7.0' in text
+        assert (
+            'excel2md_result_cache_lookups_total{kind="sheet",outcome="hit"} 5.0'
+            in text
+        )
+        assert "excel2md_conversion_stage_seconds" in text
+        assert "excel2md_http_request_duration_seconds" in text
+
+    def test_queue_depth_skipped_without_redis(self, backend):
+        backend.llen.side_effect = redis.ConnectionError("down")
+
+        text = metrics.collect_metrics().decode()
+
+        assert "excel2md_queue_depth{" not in text
+        assert "excel2md_result_cache_lookups_total" in text
+
+
+def test_record_worker_rss():
+    try:
+        open("/proc/self/statm").close()
+    except OSError:
+        pytest.skip("/proc is not available")
+
+    metrics.record_worker_rss()
+
+    value = REGISTRY.get_sample_value("excel2md_worker_resident_memory_bytes")
+    assert value > 1024 * 1024
@@ -0,0 +1,202 @@
+"""Unit tests for result cache service."""
+
+import os
+
+import pytest
+
+from app.config import settings
+from app.services import result_cache as result_cache_module
+from app.services.result_cache import ResultCache
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the counter commands used."""
+
+    def __init__(self):
+        self.values = {}
+
+    def incr(self, key):
+        self.values[key] = self.values.get(key, 0) + 1
+
+    def mget(self, *keys):
+        return [self.values.get(key) for key in keys]
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "results_dir", tmp_path / "results")
+    result_cache = ResultCache(tmp_path / "cache", 1024, "redis://unused")
+    result_cache._redis = FakeRedis()
+    return result_cache
+
+
+@pytest.fixture
+def scans(cache, monkeypatch):
+    """Record the directory scans run by cache.evict."""
+    calls = []
+    evict = cache.evict
+
+    def counting_evict(*args, **kwargs):
+        calls.append(args)
+        return evict(*args, **kwargs)
+
+    monkeypatch.setattr(cache, "evict", counting_evict)
+    return calls
+
+
+def make_result(task_id, content="|A|\n|-|\n|1|"):
+    """Write a one-sheet result for task_id and return its task result."""
+    result_dir = settings.results_dir / task_id
+    result_dir.mkdir(parents=True)
+    (result_dir / "Sheet.md").write_text(content, encoding="utf-8")
+    return result_dir, {
+        "status": "success",
+        "task_id": task_id,
+        "original_filename": "a.xlsx",
+        "result_dir": str(result_dir),
+        "sheets": {"Sheet": {"file": "Sheet.md", "row_count": 1, "column_count": 1}},
+        "total_sheets": 1,
+        "has_zip": False,
+        "zip_path": None,
+    }
+
+
+class TestMakeKey:
+    """Tests for ResultCache.make_key."""
+
+    def test_depends_on_options(self):
+        base = ResultCache.make_key("abc", "markdown")
+        assert base == ResultCache.make_key("abc", "markdown", True)
+        assert base != ResultCache.make_key("abc", "json")
+        assert base != ResultCache.make_key("abc", "markdown", False)
+        assert base != ResultCache.make_key("abd", "markdown")
+
+    def test_sheet_order_does_not_matter(self):
+        assert ResultCache.make_key("abc", "markdown", sheets=["B", "A"]) == (
+            ResultCache.make_key("abc", "markdown", sheets=["A", "B"])
+        )
+
+
+class TestStoreAndRestore:
+    """Tests for storing and restoring cached results."""
+
+    def test_miss(self, cache):
+        assert cache.restore("missing", "task-2", "b.xlsx") is None
+        assert cache.stats() == {
+            "hits": 0, "misses": 1, "sheet_hits": 0, "sheet_misses": 0
+        }
+
+    def test_hit_restores_files_for_new_task(self, cache):
+        result_dir, result = make_result("task-1")
+        cache.store("key", result_dir, result)
+
+        restored = cache.restore("key", "task-2", "b.xlsx")
+
+        assert restored["task_id"] == "task-2"
+        assert restored["original_filename"] == "b.xlsx"
+        assert restored["sheets"] == result["sheets"]
+        new_file = settings.results_dir / "task-2" / "Sheet.md"
+        assert new_file.read_text(encoding="utf-8") == "|A|\n|-|\n|1|"
+        assert cache.stats() == {
+            "hits": 1, "misses": 0, "sheet_hits": 0, "sheet_misses": 0
+        }
+
+    def test_entry_survives_original_result_removal(self, cache):
+        result_dir, result = make_result("task-1")
+        cache.store("key", result_dir, result)
+        (result_dir / "Sheet.md").unlink()
+
+        assert cache.restore("key", "task-2", "b.xlsx") is not None
+
+
+class TestSheetEntries:
+    """Tests for per-sheet cache entries."""
+
+    def test_sheet_key_depends_on_options(self):
+        base = ResultCache.make_sheet_key("abc", "markdown")
+        assert base != ResultCache.make_sheet_key("abd", "markdown")
+        assert base != ResultCache.make_sheet_key("abc", "json")
+        assert base != ResultCache.make_sheet_key("abc", "markdown", cell_range="A1:B2")
+        assert base != ResultCache.make_key("abc", "markdown")
+
+    def test_restore_under_new_name(self, cache, tmp_path):
+        source = tmp_path / "Old.md"
+        source.write_text("|A|\n|-|\n|1|", encoding="utf-8")
+        cache.store_sheet("key", source, {"file": "Old.md", "row_count": 1})
+
+        target = tmp_path / "New.md"
+        restored = cache.restore_sheet("key", target)
+
+        assert restored == {"file": "New.md", "row_count": 1}
+        assert target.read_text(encoding="utf-8") == "|A|\n|-|\n|1|"
+        assert cache.restore_sheet("missing", tmp_path / "Other.md") is None
+        assert cache.stats()["sheet_hits"] == 1
+        assert cache.stats()["sheet_misses"] == 1
+
+    def test_companions_follow_output(self, cache, tmp_path):
+        source = tmp_path / "Old.md"
+        source.write_text("|A|", encoding="utf-8")
+        index = tmp_path / "Old.md.idx"
+        index.write_bytes(b"index")
+        cache.store_sheet("key", source, {"file": "Old.md"}, [index])
+
+        cache.restore_sheet("key", tmp_path / "New.md")
+
+        assert (tmp_path / "New.md.idx").read_bytes() == b"index"
+
+
+class TestEvict:
+    """Tests for ResultCache.evict."""
+
+    def test_least_recently_used_evicted_first(self, cache):
+        # Room for two entries of ~2.3 KB each
+        cache.max_bytes = 5000
+        for i, key in enumerate(["old", "new"]):
+            result_dir, result = make_result(f"task-{key}", "x" * 2000)
+            cache.store(key, result_dir, result)
+            manifest = cache.cache_dir / key / "manifest.json"
+            os.utime(manifest, (1000 + i, 1000 + i))
+
+        # A hit makes "old" the most recently used entry
+        cache.restore("old", "task-3", "c.xlsx")
+        result_dir, result = make_result("task-third", "x" * 2000)
+        cache.store("third", result_dir, result)
+
+        assert sorted(p.name for p in cache.cache_dir.iterdir()) == ["old", "third"]
+
+    def test_max_age(self, cache):
+        result_dir, result = make_result("task-1")
+        cache.store("key", result_dir, result)
+        os.utime(cache.cache_dir / "key" / "manifest.json", (1000, 1000))
+
+        assert cache.evict(max_age_seconds=3600) == 1
+        assert list(cache.cache_dir.iterdir()) == []
+
+    def test_stores_under_limit_skip_scan(self, cache, scans):
+        cache.max_bytes = 100_000
+        for key in ("a", "b", "c"):
+            result_dir, result = make_result(f"task-{key}")
+            cache.store(key, result_dir, result)
+
+        # Only the first store scans, to learn the cache size
+        assert len(scans) == 1
+
+    def test_store_crossing_limit_scans(self, cache, scans):
+        cache.max_bytes = 5000
+        for key in ("a", "b", "c"):
+            result_dir, result = make_result(f"task-{key}", "x" * 2000)
+            cache.store(key, result_dir, result)
+
+        assert len(scans) == 2
+        assert len(list(cache.cache_dir.iterdir())) == 2
+
+    def test_store_scans_after_interval(self, cache, scans):
+        cache.max_bytes = 100_000
+        result_dir, result = make_result("task-a")
+        cache.store("a", result_dir, result)
+        cache._last_scan -= result_cache_module.EVICT_INTERVAL_SECONDS
+
+        result_dir, result = make_result("task-b")
+        cache.store("b", result_dir, result)
+
+        assert len(scans) == 2
@@ -0,0 +1,165 @@
+"""Unit tests for task event streaming."""
+
+import asyncio
+import json
+
+from app.celery_app import celery_app
+from app.services.conversion_service import ConversionService
+from app.services.task_events import TaskEvents
+
+
+def encode_meta(task_id, status, result):
+    """Encode task meta the way the Redis result backend stores it."""
+    backend = celery_app.backend
+    return backend.encode(
+        {"status": status, "result": result, "task_id": task_id, "traceback": None}
+    )
+
+
+class FakePubSub:
+    """Pub/sub stand-in publishing queued messages on the subscribed channel."""
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.channels = []
+        self.subscribe_calls = 0
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.subscribe_calls += 1
+        if channel not in self.channels:
+            self.channels.append(channel)
+
+    async def unsubscribe(self, channel):
+        self.channels.remove(channel)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        if not self.messages or not self.channels:
+            await asyncio.sleep(min(timeout, 0.005))
+            return None
+        data = self.messages.pop(0)
+        return {"type": "message", "channel": self.channels[0], "data": data}
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeRedis:
+    """Async Redis stand-in with a stored meta value."""
+
+    def __init__(self, stored):
+        self.stored = stored
+
+    async def get(self, key):
+        return self.stored
+
+
+def make_events(stored, messages):
+    """Build TaskEvents on fake status lookups and a fake subscriber."""
+    service = ConversionService("redis://unused", 1)
+    service._redis = FakeRedis(stored)
+    events = TaskEvents("redis://unused", service)
+    events._pubsub = FakePubSub(messages)
+    return events
+
+
+def collect(events, task_id, **kwargs):
+    async def run():
+        try:
+            return [status async for status in events.watch(task_id, **kwargs)]
+        finally:
+            await events.close()
+
+    return asyncio.run(run())
+
+
+class TestWatch:
+    """Tests for TaskEvents.watch."""
+
+    def test_streams_until_success(self):
+        progress = {
+            "progress": 50,
+            "message": "Converting sheet: A",
+            "current_sheet": "A",
+            "total_sheets": 2,
+        }
+        events = make_events(
+            None,
+            [
+                encode_meta("t1", "PROGRESS", progress),
+                encode_meta("t1", "SUCCESS", {"sheets": {}}),
+                encode_meta("t1", "PROGRESS", progress),
+            ],
+        )
+        pubsub = events._pubsub
+
+        statuses = collect(events, "t1")
+
+        assert [s["status"] for s in statuses] == ["PENDING", "PROGRESS", "SUCCESS"]
+        assert statuses[1]["progress"] == 50
+        assert statuses[1]["current_sheet"] == "A"
+        assert statuses[2]["result"] == {"sheets": {}}
+        assert pubsub.subscribe_calls == 1
+        # Unsubscribed once the stream ended, closed on shutdown
+        assert pubsub.channels == []
+        assert pubsub.closed
+        assert events._listener is None
+
+    def test_finished_task_ends_immediately(self):
+        events = make_events(encode_meta("t2", "SUCCESS", {"sheets": {}}), [])
+
+        statuses = collect(events, "t2")
+
+        assert [s["status"] for s in statuses] == ["SUCCESS"]
+
+    def test_heartbeat_while_idle(self):
+        events = make_events(None, [])
+
+        statuses = collect(events, "t3", heartbeat=0.01, timeout=0.035)
+
+        assert statuses[0]["status"] == "PENDING"
+        # Heartbeats until the stream times out
+        assert len(statuses) > 1
+        assert statuses[1:] == [None] * (len(statuses) - 1)
+
+    def test_events_are_json_serializable(self):
+        failure = {
+            "exc_type": "EmptyFileError",
+            "exc_message": ["No data"],
+            "exc_module": "app.core.exceptions",
+        }
+        events = make_events(encode_meta("t4", "FAILURE", failure), [])
+
+        (status,) = collect(events, "t4")
+
+        assert status["error"] == "No data"
+        json.dumps(status)
+
+    def test_watchers_share_subscription(self):
+        events = make_events(None, [encode_meta("t5", "SUCCESS", {"sheets": {}})])
+        channel = celery_app.backend.get_key_for_task("t5")
+
+        async def run():
+            first = events.watch("t5", heartbeat=0.01)
+            second = events.watch("t5", heartbeat=0.01)
+            # Both watchers are subscribed before anything is published
+            assert (await first.__anext__())["status"] == "PENDING"
+            assert (await second.__anext__())["status"] == "PENDING"
+            assert events._pubsub.channels == [channel]
+            statuses = [
+                [s for s in await collect_rest(stream) if s is not None]
+                for stream in (first, second)
+            ]
+            assert events._watchers == {}
+            return statuses
+
+        async def collect_rest(stream):
+            return [status async for status in stream]
+
+        statuses = asyncio.run(run())
+
+        assert [[s["status"] for s in rest] for rest in statuses] == [
+            ["SUCCESS"],
+            ["SUCCESS"],
+        ]
+        assert events._pubsub.channels == []
@@ -0,0 +1,152 @@
+"""Parity tests for the fast .xlsx reader engine against openpyxl."""
+
+import re
+import zipfile
+from datetime import date, datetime, time, timedelta
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell.rich_text import CellRichText, TextBlock
+from openpyxl.cell.text import InlineFont
+from openpyxl.utils.datetime import CALENDAR_MAC_1904
+
+from app.core.excel_reader import get_excel_data, iter_excel_sheets
+from app.core.exceptions import InvalidFileFormatError
+from app.core.xlsx_fast_reader import open_fast_xlsx
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+
+def _openpyxl_rows(content: bytes):
+    workbook = load_workbook(BytesIO(content), read_only=True, data_only=True)
+    rows = {
+        name: [tuple(row) for row in workbook[name].iter_rows(values_only=True)]
+        for name in workbook.sheetnames
+    }
+    workbook.close()
+    return rows
+
+
+def _fast_rows(content: bytes):
+    workbook = open_fast_xlsx(BytesIO(content))
+    rows = {
+        name: [tuple(row) for row in workbook[name].iter_rows(values_only=True)]
+        for name in workbook.sheetnames
+    }
+    workbook.close()
+    return rows
+
+
+def _save(workbook: Workbook) -> bytes:
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _strip_dimensions(content: bytes) -> bytes:
+    """Rewrite an .xlsx archive without <dimension> tags in worksheets."""
+    source = zipfile.ZipFile(BytesIO(content))
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as target:
+        for item in source.infolist():
+            data = source.read(item.filename)
+            if item.filename.startswith("xl/worksheets/"):
+                data = re.sub(rb"<dimension [^>]*/>", b"", data)
+            target.writestr(item, data)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def typed_xlsx() -> bytes:
+    """Workbook covering the cell types the engine has to decode."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Types"
+    sheet.append(["text", "int", "float", "bool", "date", "time", "duration"])
+    sheet.append(["a|b", 1, 2.5, True, datetime(2024, 1, 2, 3, 4, 5), time(6, 7), timedelta(hours=30)])
+    sheet.append(["line1\nline2", -7, 1e-20, False, date(1999, 12, 31), None, None])
+    sheet["A5"] = "after gap"
+    sheet["C5"] = "=1+1"
+    sheet["B6"] = CellRichText(["plain ", TextBlock(InlineFont(b=True), "bold")])
+
+    workbook.create_sheet("Empty")
+
+    wide = workbook.create_sheet("Wide")
+    for r in range(1, 20):
+        wide.append([f"{r}-{c}" if (r * c) % 3 else None for c in range(1, 30)])
+    return _save(workbook)
+
+
+class TestFastEngineParity:
+    """Row-level parity between the fast engine and openpyxl."""
+
+    @pytest.mark.parametrize(
+        "path",
+        [ROOT_DIR / "ExcelTestFile.xlsx", ROOT_DIR / "tests" / "fixtures" / "sample.xlsx"],
+        ids=["ExcelTestFile", "sample"],
+    )
+    def test_fixture_files(self, path):
+        content = path.read_bytes()
+        assert _fast_rows(content) == _openpyxl_rows(content)
+
+    def test_typed_cells(self, typed_xlsx):
+        assert _fast_rows(typed_xlsx) == _openpyxl_rows(typed_xlsx)
+
+    def test_without_dimensions(self, typed_xlsx):
+        content = _strip_dimensions(typed_xlsx)
+        assert _fast_rows(content) == _openpyxl_rows(content)
+
+    def test_1904_epoch(self):
+        workbook = Workbook()
+        workbook.epoch = CALENDAR_MAC_1904
+        workbook.active.append([datetime(2020, 5, 17), 3])
+        content = _save(workbook)
+        assert _fast_rows(content) == _openpyxl_rows(content)
+
+    def test_inline_strings(self, sample_xlsx_path):
+        source = zipfile.ZipFile(sample_xlsx_path)
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w") as target:
+            for item in source.infolist():
+                data = source.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data = re.sub(
+                        rb'<c r="A1"[^>]*>.*?</c>',
+                        b'<c r="A1" t="inlineStr"><is><t>Inline</t></is></c>',
+                        data,
+                    )
+                target.writestr(item, data)
+        content = buffer.getvalue()
+
+        rows = _fast_rows(content)
+        assert rows == _openpyxl_rows(content)
+        assert rows["Sheet 1"][0][0] == "Inline"
+
+    @pytest.mark.parametrize("use_headers", [True, False])
+    def test_get_excel_data(self, typed_xlsx, use_headers):
+        expected = get_excel_data(typed_xlsx, "typed.xlsx", use_headers)
+        result = get_excel_data(typed_xlsx, "typed.xlsx", use_headers, xlsx_engine="fast")
+        assert result == expected
+
+    def test_iter_excel_sheets(self, typed_xlsx):
+        def collect(engine):
+            return [
+                (sheet["sheetname"], sheet["headers"], list(sheet["rows"]))
+                for sheet in iter_excel_sheets(typed_xlsx, "typed.xlsx", xlsx_engine=engine)
+            ]
+
+        assert collect("fast") == collect("openpyxl")
+
+
+class TestFastEngineErrors:
+    """Error handling of the fast engine."""
+
+    def test_invalid_content(self):
+        with pytest.raises(InvalidFileFormatError):
+            get_excel_data(b"not excel content", "test.xlsx", xlsx_engine="fast")
+
+    def test_unknown_engine(self, sample_xlsx_path):
+        with pytest.raises(ValueError):
+            get_excel_data(sample_xlsx_path.read_bytes(), "sample.xlsx", xlsx_engine="nope")
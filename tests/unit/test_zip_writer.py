@@ -0,0 +1,63 @@
+"""Unit tests for ZIP archive writing."""
+
+import io
+import zipfile
+
+import pytest
+
+from app.core.zip_writer import TeeWriter, iter_zip, open_zip, zip_compression
+
+
+class TestZipCompression:
+    """Tests for zip_compression."""
+
+    def test_level_zero_stores(self):
+        assert zip_compression(0) == (zipfile.ZIP_STORED, None)
+
+    def test_deflate_levels(self):
+        assert zip_compression(1) == (zipfile.ZIP_DEFLATED, 1)
+        assert zip_compression(9) == (zipfile.ZIP_DEFLATED, 9)
+
+
+class TestTeeWriter:
+    """Tests for TeeWriter."""
+
+    def test_writes_to_file_and_archive(self, tmp_path):
+        target = tmp_path / "result.zip"
+        with open_zip(target, 6) as archive, open(
+            tmp_path / "Лист1.md", "wb"
+        ) as fp, archive.open("Лист1.md", "w") as entry:
+            tee = TeeWriter(fp, entry)
+            assert tee.write("| Имя |\n".encode("utf-8")) == 11
+            tee.write(b"| --- |")
+
+        text = (tmp_path / "Лист1.md").read_text(encoding="utf-8")
+        assert text == "| Имя |\n| --- |"
+        with zipfile.ZipFile(target) as archive:
+            assert archive.read("Лист1.md").decode("utf-8") == text
+
+
+class TestIterZip:
+    """Tests for iter_zip."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for name, size in (("a.md", 10), ("b.md", 300_000), ("empty.md", 0)):
+            path = tmp_path / name
+            path.write_bytes(bytes(i % 251 for i in range(size)))
+            paths.append(path)
+        return paths
+
+    @pytest.mark.parametrize("level", [0, 6])
+    def test_archive_round_trip(self, files, level):
+        chunks = list(iter_zip(files, level, chunk_size=64 * 1024))
+
+        assert len(chunks) > 1
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+            assert archive.testzip() is None
+            assert archive.namelist() == ["a.md", "b.md", "empty.md"]
+            for path in files:
+                assert archive.read(path.name) == path.read_bytes()
+            expected = zip_compression(level)[0]
+            assert archive.getinfo("b.md").compress_type == expected